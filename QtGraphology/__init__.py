@@ -7,6 +7,9 @@ from .pkg_info import __version__ as VERSION
 from .pkg_info import __license__ as LICENSE
 
 from .base.graph import NodeGraph, SubGraph
+from .base.async_executor import AsyncGraphExecutor
+from .base.executor import GraphExecutor
+from .base.scheduler import ParallelGraphExecutor
 from .base.menu  import NodesMenu, NodeGraphMenu, NodeGraphCommand
 from .base.port  import Port
 from .base.node  import NodeObject
@@ -29,9 +32,11 @@ from .custom_widgets.properties_bin.node_property_widgets import (
 __version__ = VERSION
 
 __all__ = [
+    'AsyncGraphExecutor',
     'BackdropNode',
     'BaseNode',
     'BaseNodeCircle',
+    'GraphExecutor',
     'GroupNode',
     'LICENSE',
     'NodeBaseWidget',
@@ -42,6 +47,7 @@ __all__ = [
     'NodesPaletteWidget',
     'NodesTreeWidget',
     'NodesMenu',
+    'ParallelGraphExecutor',
     'Port',
     'PropertiesBinWidget',
     'SubGraph',
@@ -0,0 +1,274 @@
+#!/usr/bin/python
+from __future__ import annotations
+import asyncio
+import inspect
+from collections import deque
+from typing import TYPE_CHECKING, Any, Self
+
+from QtGraphology.base.executor import GraphExecutor
+from QtGraphology.errors import NodeExecutionError
+from QtGraphology.nodes.base_node import BaseNode
+from QtGraphology.nodes.group_node import GroupNode
+from QtGraphology.nodes.port_node import PortInputNode
+
+if TYPE_CHECKING:
+    from QtGraphology.base.graph import NodeGraph
+
+
+class AsyncGraphExecutor(GraphExecutor):
+    """
+    Graph executor that evaluates the nodes as asyncio tasks.
+
+    Nodes with a coroutine :meth:`BaseNode.run` or :meth:`BaseNode.compute`
+    (``async def``) are awaited so thousands of I/O bound nodes can be in
+    flight at once, regular nodes are evaluated inline on the event loop.
+    Run it on the Qt event loop with ``PySide6.QtAsyncio`` and start an
+    execution with :meth:`AsyncGraphExecutor.start` so the UI isn't blocked.
+
+    The run is cancelled when an edit invalidates nodes
+    (:attr:`NodeGraph.nodes_invalidated`), the outputs of the nodes that
+    finished before the edit stay memoized. Progress is reported with the
+    :attr:`NodeGraph.node_executed`, :attr:`NodeGraph.execution_progress`
+    and :attr:`NodeGraph.execution_finished` signals.
+
+    Args:
+        graph (QtGraphology.NodeGraph): node graph.
+        max_concurrency (int): maximum nodes evaluated at the same time.
+            (default: no limit)
+        limits (dict): {<node_type>: <int>} maximum nodes of a type
+            evaluated at the same time, overrides the node
+            :attr:`BaseNode.MAX_CONCURRENCY`. (optional)
+    """
+
+    def __init__(self: Self,
+                 graph: NodeGraph,
+                 max_concurrency: int | None = None,
+                 limits: dict[str, int] | None = None) -> None:
+        super(AsyncGraphExecutor, self).__init__(graph)
+        self._max_concurrency: int | None = max_concurrency
+        self._limits: dict[str, int] = dict(limits or {})
+        # semaphores ((event loop, node type) -> semaphore, node type None
+        # for the global limit) shared with the sub graph executors.
+        self._semaphores: dict[tuple[asyncio.AbstractEventLoop, str | None],
+                               asyncio.Semaphore] = {}
+        self._task: asyncio.Task | None = None
+        graph.nodes_invalidated.connect(self._on_nodes_invalidated)
+
+    def new_sub_executor(self: Self, sub_graph: NodeGraph) -> GraphExecutor:
+        executor = self.__class__(sub_graph,
+                                  max_concurrency=self._max_concurrency,
+                                  limits=self._limits)
+        executor._semaphores = self._semaphores
+        return executor
+
+    def running(self: Self) -> bool:
+        """
+        Returns:
+            bool: True if an execution started with
+                :meth:`AsyncGraphExecutor.start` is in progress.
+        """
+        return self._task is not None and not self._task.done()
+
+    def cancel(self: Self) -> bool:
+        """
+        Cancel the execution in progress.
+
+        Returns:
+            bool: True if an execution was cancelled.
+        """
+        if not self.running():
+            return False
+        return self._task.cancel()
+
+    def _on_nodes_invalidated(self: Self, node_ids: list[str]) -> None:
+        """
+        Slot cancelling the execution when the graph is edited mid run.
+
+        Args:
+            node_ids (list[str]): invalidated node ids.
+        """
+        self.cancel()
+
+    def start(self: Self, nodes: list[BaseNode] | None = None) -> asyncio.Task:
+        """
+        Schedule an execution on the running event loop, an execution in
+        progress is cancelled first.
+
+        Args:
+            nodes (list[QtGraphology.BaseNode]): nodes to evaluate.
+                (default: all nodes)
+
+        Returns:
+            asyncio.Task: execution task.
+        """
+        self.cancel()
+        self._task = asyncio.ensure_future(self.execute_async(nodes))
+        return self._task
+
+    def execute(self: Self,
+                nodes: list[BaseNode] | None = None,
+                port_inputs: dict[str, Any] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Evaluate the nodes and block until they're done, use
+        :meth:`AsyncGraphExecutor.start` or
+        :meth:`AsyncGraphExecutor.execute_async` from a running event loop.
+
+        Args:
+            nodes (list[QtGraphology.BaseNode]): nodes to evaluate.
+                (default: all nodes)
+            port_inputs (dict): {<port_name>: <value>} sub graph input
+                port node values. (default: pulled from the parent graph)
+
+        Returns:
+            dict: {<node_id>: {<output_port_name>: <value>}}
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.execute_async(nodes, port_inputs))
+        raise RuntimeError('event loop already running use "start()" or '
+                           '"await execute_async()" instead.')
+
+    def semaphores(self: Self, node: BaseNode) -> list[asyncio.Semaphore]:
+        """
+        Returns the semaphores limiting the concurrency of a node.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+
+        Returns:
+            list[asyncio.Semaphore]: semaphores to acquire.
+        """
+        loop = asyncio.get_running_loop()
+        semaphores = []
+        for node_type, limit in ((None, self._max_concurrency),
+                                 (node.type_, self._limits.get(node.type_, node.MAX_CONCURRENCY))):
+            if limit is None:
+                continue
+            semaphore = self._semaphores.get((loop, node_type))
+            if semaphore is None:
+                # semaphores are bound to an event loop, drop the ones from
+                # the loops of previous "execute" calls.
+                for key in [k for k in self._semaphores if k[0].is_closed()]:
+                    del self._semaphores[key]
+                semaphore = asyncio.Semaphore(limit)
+                self._semaphores[(loop, node_type)] = semaphore
+            semaphores.append(semaphore)
+        return semaphores
+
+    async def run_node_async(self: Self, node: BaseNode, inputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run a node, awaiting coroutine nodes, and validate its output values
+        without storing them.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+            inputs (dict): {<input_port_name>: <value>}
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        # group nodes only wait on their sub graph nodes so they don't hold
+        # a slot the sub graph nodes would wait on.
+        semaphores = [] if isinstance(node, GroupNode) else self.semaphores(node)
+        acquired = []
+        try:
+            for semaphore in semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+            if isinstance(node, GroupNode):
+                executor = self.sub_executor(self.sub_graph(node))
+                await executor.execute_async(port_inputs=inputs)
+                outputs = executor.port_outputs()
+            else:
+                outputs = node.run(inputs)
+                if inspect.isawaitable(outputs):
+                    outputs = await outputs
+        except (NodeExecutionError, asyncio.CancelledError):
+            raise
+        except Exception as error:
+            raise NodeExecutionError(
+                '"{}" failed to execute: {}'.format(node.name(), error)
+            ) from error
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+        return self.check_outputs(node, outputs)
+
+    async def execute_async(self: Self,
+                            nodes: list[BaseNode] | None = None,
+                            port_inputs: dict[str, Any] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Evaluate the dirty nodes, a node task is created as soon as its
+        upstream nodes are evaluated.
+
+        Args:
+            nodes (list[QtGraphology.BaseNode]): nodes to evaluate.
+                (default: all nodes)
+            port_inputs (dict): {<port_name>: <value>} sub graph input
+                port node values. (default: pulled from the parent graph)
+
+        Returns:
+            dict: {<node_id>: {<output_port_name>: <value>}}
+        """
+        graph = self._graph
+        model = graph.model
+        order = [n_id for n_id in self.execution_order(nodes)
+                 if isinstance(model.nodes.get(n_id), BaseNode)]
+        position = {n_id: i for i, n_id in enumerate(order)}
+
+        # pending upstream count (connections closing a cycle are ignored).
+        pending = {
+            node_id: sum(1 for n in model.node_predecessors(node_id)
+                         if position.get(n, len(order)) < position[node_id])
+            for node_id in order
+        }
+        ready = deque(n_id for n_id in order if not pending[n_id])
+        total = sum(1 for n_id in order if not self.is_cached(n_id))
+        count = 0
+        tasks: dict[asyncio.Task, BaseNode] = {}
+
+        def node_done(node_id: str) -> None:
+            for n_id in model.node_successors(node_id):
+                if n_id not in pending or position[n_id] <= position[node_id]:
+                    continue
+                pending[n_id] -= 1
+                if not pending[n_id]:
+                    ready.append(n_id)
+
+        finished = False
+        try:
+            while ready or tasks:
+                while ready:
+                    node_id = ready.popleft()
+                    node = model.nodes[node_id]
+                    if isinstance(node, PortInputNode):
+                        if port_inputs is None:
+                            port_inputs = self.parent_inputs()
+                        self.set_port_inputs(node, port_inputs)
+                        node_done(node_id)
+                    elif self.is_cached(node_id):
+                        node_done(node_id)
+                    else:
+                        task = asyncio.ensure_future(
+                            self.run_node_async(node, self.node_inputs(node)))
+                        tasks[task] = node
+                if not tasks:
+                    continue
+                done, _ = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = tasks.pop(task)
+                    self.store_outputs(node.id, task.result())
+                    count += 1
+                    graph.node_executed.emit(node)
+                    graph.execution_progress.emit(count, total)
+                    node_done(node.id)
+            finished = True
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            graph.execution_finished.emit(finished)
+        return self._results
@@ -8,6 +8,39 @@ from QtGraphology import BaseNode
 from QtGraphology.constants import PortTypeEnum
 from QtGraphology.base.node import NodeObject, NodeModel
 
+
+def _output_input_ports(src_port, trg_port):
+    """
+    Sort a port pair into its output and input port.
+
+    Args:
+        src_port (NodeGraphQt.Port): source port.
+        trg_port (NodeGraphQt.Port): target port.
+
+    Returns:
+        tuple(NodeGraphQt.Port, NodeGraphQt.Port): output port, input port.
+    """
+    if src_port.type_() == PortTypeEnum.IN.value:
+        return trg_port, src_port
+    return src_port, trg_port
+
+
+def _update_virtual_node(node):
+    """
+    Sync the viewer spatial index from the node model of a node without a
+    node item. (virtualized mode)
+
+    Args:
+        node (NodeGraphQt.NodeObject): node.
+    """
+    graph = node.graph
+    viewer = graph.viewer() if graph is not None else None
+    if viewer is None:
+        return
+    x, y = node.model.pos
+    viewer.update_virtual_rect(
+        node.id, (x, y, node.model.width, node.model.height))
+
 class PropertyChangedCmd(QtGui.QUndoCommand):
     """
     Node property changed command.
@@ -32,11 +65,29 @@ class PropertyChangedCmd(QtGui.QUndoCommand):
         """
         # set model data.
         model: NodeModel = self.node.model
+        if name == 'name' and self.node.graph:
+            self.node.graph.model.rename_node(self.node.id, model.name, value)
         model.set_property(name, value)
 
-        # set view data.
-        view = self.node.view
+        # set view data. (the node item is synced from the model when it's
+        # built)
+        if self.node.has_view():
+            self.set_view_property(self.node.view, name, value)
+        elif name == 'pos':
+            _update_virtual_node(self.node)
+
+        # emit property changed signal.
+        graph = self.node.graph
+        if graph:
+            if not model.is_display_property(self.name):
+                graph.invalidate_nodes([self.node])
+            graph.property_changed.emit(self.node, self.name, value)
 
+    @staticmethod
+    def set_view_property(view, name: str, value: Any) -> None:
+        """
+        updates the node view.
+        """
         # view widgets.
         if hasattr(view, 'widgets'):
             widgets = view.__getattribute__('widgets')
@@ -53,11 +104,6 @@ class PropertyChangedCmd(QtGui.QUndoCommand):
                 name = 'xy_pos'
             setattr(view, name, value)
 
-        # emit property changed signal.
-        graph = self.node.graph
-        if graph:
-            graph.property_changed.emit(self.node, self.name, value)
-
     def undo(self) -> None:
         if self.old_val != self.new_val:
             self.set_node_property(self.name, self.old_val)
@@ -86,18 +132,19 @@ class NodeVisibleCmd(QtGui.QUndoCommand):
         model = self.node.model
         model.set_property('visible', visible)
 
-        node_view = self.node.view
-        node_view.visible = visible
+        if self.node.has_view():
+            node_view = self.node.view
+            node_view.visible = visible
 
-        # redraw the connected pipes in the scene.
-        ports = node_view.inputs + node_view.outputs
-        for port in ports:
-            for pipe in port.connected_pipes:
-                pipe.update()
+            # redraw the connected pipes in the scene.
+            ports = node_view.inputs + node_view.outputs
+            for port in ports:
+                for pipe in port.connected_pipes:
+                    pipe.update()
 
-        # restore the node selected state.
-        if self.selected != node_view.isSelected():
-            node_view.setSelected(model.selected)
+            # restore the node selected state.
+            if self.selected != node_view.isSelected():
+                node_view.setSelected(model.selected)
 
         # emit property changed signal.
         graph = self.node.graph
@@ -153,15 +200,65 @@ class NodeMovedCmd(QtGui.QUndoCommand):
         self.pos = pos
         self.prev_pos = prev_pos
 
+    def set_pos(self, pos):
+        if self.node.has_view():
+            self.node.view.xy_pos = pos
+            self.node.model.pos = pos
+            return
+        self.node.model.pos = pos
+        _update_virtual_node(self.node)
+
     def undo(self):
-        self.node.view.xy_pos = self.prev_pos
-        self.node.model.pos = self.prev_pos
+        self.set_pos(self.prev_pos)
 
     def redo(self):
         if self.pos == self.prev_pos:
             return
-        self.node.view.xy_pos = self.pos
-        self.node.model.pos = self.pos
+        self.set_pos(self.pos)
+
+
+class NodesMovedCmd(QtGui.QUndoCommand):
+    """
+    Multiple nodes moved command, the node positions are written to the
+    graph model geometry table and the node items are synced in a single
+    batched pass.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        nodes (list[NodeGraphQt.NodeObject]): nodes.
+        positions (list[list[float, float]]): new node positions.
+        prev_positions (list[list[float, float]]): previous node positions.
+        text (str): undo command text.
+    """
+
+    def __init__(self, graph, nodes, positions, prev_positions, text='move nodes'):
+        QtGui.QUndoCommand.__init__(self)
+        self.setText(text)
+        self.graph = graph
+        self.nodes = nodes
+        self.positions = positions
+        self.prev_positions = prev_positions
+
+    def set_positions(self, positions):
+        handles = [n.model.geometry_handle for n in self.nodes]
+        self.graph.model.geometry.set_positions(handles, positions)
+        viewer = self.graph.viewer()
+        if viewer is None:
+            return
+        items, item_positions = [], []
+        for node, pos in zip(self.nodes, positions):
+            if node.has_view():
+                items.append(node.view)
+                item_positions.append(pos)
+            else:
+                _update_virtual_node(node)
+        viewer.set_nodes_pos(items, item_positions)
+
+    def undo(self):
+        self.set_positions(self.prev_positions)
+
+    def redo(self):
+        self.set_positions(self.positions)
 
 
 class NodeAddedCmd(QtGui.QUndoCommand):
@@ -186,15 +283,29 @@ class NodeAddedCmd(QtGui.QUndoCommand):
     def undo(self):
         node_id = self.node.id
         self.pos = self.pos or self.node.pos()
-        self.graph.model.nodes.pop(self.node.id)
-        self.node.view.delete()
+        self.graph.model.remove_node(self.node.id)
+        if self.node.has_view():
+            self.node.view.delete()
+        elif self.graph.viewer() is not None:
+            self.graph.viewer().remove_virtual_node(node_id)
 
         if self.emit_signal:
             self.graph.nodes_deleted.emit([node_id])
 
     def redo(self):
-        self.graph.model.nodes[self.node.id] = self.node
-        self.graph.viewer().add_node(self.node.view, self.pos)
+        self.graph.model.add_node(self.node)
+        viewer = self.graph.viewer()
+        if viewer is None or viewer.is_virtualized():
+            # headless graph, the node model is the only source of truth.
+            # (in virtualized mode the node item is built once in view)
+            if self.pos:
+                self.node.model.pos = [float(self.pos[0]), float(self.pos[1])]
+            if viewer is not None:
+                viewer.add_virtual_nodes([self.node.id])
+            if self.emit_signal:
+                self.graph.node_created.emit(self.node)
+            return
+        viewer.add_node(self.node.view, self.pos)
 
         # node width & height is calculated when it's added to the scene,
         # so we have to update the node model here.
@@ -205,6 +316,69 @@ class NodeAddedCmd(QtGui.QUndoCommand):
             self.graph.node_created.emit(self.node)
 
 
+class NodesAddedCmd(QtGui.QUndoCommand):
+    """
+    Multiple nodes added command.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        nodes (list[NodeGraphQt.NodeObject]): nodes.
+        positions (list[tuple(float, float)]): initial node positions (optional).
+        emit_signal (bool): emit node creation signals. (default: True)
+    """
+
+    def __init__(self, graph, nodes, positions=None, emit_signal=True):
+        QtGui.QUndoCommand.__init__(self)
+        self.setText('added nodes')
+        self.graph = graph
+        self.nodes = nodes
+        self.positions = positions
+        self.emit_signal = emit_signal
+
+    def undo(self):
+        self.positions = [n.pos() for n in self.nodes]
+        node_ids = []
+        for node in self.nodes:
+            node_ids.append(node.id)
+            self.graph.model.remove_node(node.id)
+            if node.has_view():
+                node.view.delete()
+            elif self.graph.viewer() is not None:
+                self.graph.viewer().remove_virtual_node(node.id)
+
+        if self.emit_signal:
+            self.graph.nodes_deleted.emit(node_ids)
+
+    def redo(self):
+        viewer = self.graph.viewer()
+        if viewer is None or viewer.is_virtualized():
+            # headless graph, the node models are the only source of truth.
+            # (in virtualized mode the node items are built once in view)
+            positions = self.positions or [None] * len(self.nodes)
+            for node, pos in zip(self.nodes, positions):
+                if pos:
+                    node.model.pos = [float(pos[0]), float(pos[1])]
+                self.graph.model.add_node(node)
+            if viewer is not None:
+                viewer.add_virtual_nodes([n.id for n in self.nodes])
+            if self.emit_signal:
+                for node in self.nodes:
+                    self.graph.node_created.emit(node)
+            return
+
+        viewer.add_nodes([n.view for n in self.nodes], self.positions)
+        for node in self.nodes:
+            node.model.pos = node.view.xy_pos
+            self.graph.model.add_node(node)
+            # node width & height is calculated when it's added to the scene.
+            node.model.width = node.view.width
+            node.model.height = node.view.height
+
+        if self.emit_signal:
+            for node in self.nodes:
+                self.graph.node_created.emit(node)
+
+
 class NodesRemovedCmd(QtGui.QUndoCommand):
     """
     Node deleted command.
@@ -223,19 +397,27 @@ class NodesRemovedCmd(QtGui.QUndoCommand):
         self.emit_signal = emit_signal
 
     def undo(self):
+        viewer = self.graph.viewer()
         for node in self.nodes:
-            self.graph.model.nodes[node.id] = node
-            self.graph.scene().addItem(node.view)
+            self.graph.model.add_node(node)
+            if viewer is not None and not viewer.is_virtualized():
+                viewer.scene().addItem(node.view)
 
             if self.emit_signal:
                 self.graph.node_created.emit(node)
+        if viewer is not None and viewer.is_virtualized():
+            viewer.add_virtual_nodes([n.id for n in self.nodes])
 
     def redo(self):
+        viewer = self.graph.viewer()
         node_ids = []
         for node in self.nodes:
             node_ids.append(node.id)
-            self.graph.model.nodes.pop(node.id)
-            node.view.delete()
+            self.graph.model.remove_node(node.id)
+            if node.has_view():
+                node.view.delete()
+            elif viewer is not None:
+                viewer.remove_virtual_node(node.id)
 
         if self.emit_signal:
             self.graph.nodes_deleted.emit(node_ids)
@@ -312,24 +494,13 @@ class PortConnectedCmd(QtGui.QUndoCommand):
         self.emit_signal = emit_signal
 
     def undo(self):
-        src_model = self.source.model
-        trg_model = self.target.model
-        src_id = self.source.node().id
-        trg_id = self.target.node().id
-
-        port_names = src_model.connected_ports.get(trg_id)
-        if not port_names:
-            del src_model.connected_ports[trg_id]
-        if port_names and self.target.name() in port_names:
-            port_names.remove(self.target.name())
+        out_port, in_port = _output_input_ports(self.source, self.target)
+        graph = self.source.node().graph
+        graph.model.remove_connection(out_port, in_port)
+        graph.invalidate_nodes([in_port.node()])
 
-        port_names = trg_model.connected_ports.get(src_id)
-        if port_names is []:
-            del trg_model.connected_ports[src_id]
-        if port_names and self.source.name() in port_names:
-            port_names.remove(self.source.name())
-
-        self.source.view.disconnect_from(self.target.view)
+        if self.source.has_view() and self.target.has_view():
+            self.source.view.disconnect_from(self.target.view)
 
         # emit "port_disconnected" signal from the parent graph.
         if self.emit_signal:
@@ -339,15 +510,13 @@ class PortConnectedCmd(QtGui.QUndoCommand):
                                          ports[PortTypeEnum.OUT.value])
 
     def redo(self):
-        src_model = self.source.model
-        trg_model = self.target.model
-        src_id = self.source.node().id
-        trg_id = self.target.node().id
-
-        src_model.connected_ports[trg_id].append(self.target.name())
-        trg_model.connected_ports[src_id].append(self.source.name())
+        out_port, in_port = _output_input_ports(self.source, self.target)
+        graph = self.source.node().graph
+        graph.model.add_connection(out_port, in_port)
+        graph.invalidate_nodes([in_port.node()])
 
-        self.source.view.connect_to(self.target.view)
+        if self.source.has_view() and self.target.has_view():
+            self.source.view.connect_to(self.target.view)
 
         # emit "port_connected" signal from the parent graph.
         if self.emit_signal:
@@ -374,15 +543,13 @@ class PortDisconnectedCmd(QtGui.QUndoCommand):
         self.emit_signal = emit_signal
 
     def undo(self):
-        src_model = self.source.model
-        trg_model = self.target.model
-        src_id = self.source.node().id
-        trg_id = self.target.node().id
+        out_port, in_port = _output_input_ports(self.source, self.target)
+        graph = self.source.node().graph
+        graph.model.add_connection(out_port, in_port)
+        graph.invalidate_nodes([in_port.node()])
 
-        src_model.connected_ports[trg_id].append(self.target.name())
-        trg_model.connected_ports[src_id].append(self.source.name())
-
-        self.source.view.connect_to(self.target.view)
+        if self.source.has_view() and self.target.has_view():
+            self.source.view.connect_to(self.target.view)
 
         # emit "port_connected" signal from the parent graph.
         if self.emit_signal:
@@ -392,24 +559,13 @@ class PortDisconnectedCmd(QtGui.QUndoCommand):
                                       ports[PortTypeEnum.OUT.value])
 
     def redo(self):
-        src_model = self.source.model
-        trg_model = self.target.model
-        src_id = self.source.node().id
-        trg_id = self.target.node().id
-
-        port_names = src_model.connected_ports.get(trg_id)
-        if port_names is []:
-            del src_model.connected_ports[trg_id]
-        if port_names and self.target.name() in port_names:
-            port_names.remove(self.target.name())
-
-        port_names = trg_model.connected_ports.get(src_id)
-        if port_names is []:
-            del trg_model.connected_ports[src_id]
-        if port_names and self.source.name() in port_names:
-            port_names.remove(self.source.name())
+        out_port, in_port = _output_input_ports(self.source, self.target)
+        graph = self.source.node().graph
+        graph.model.remove_connection(out_port, in_port)
+        graph.invalidate_nodes([in_port.node()])
 
-        self.source.view.disconnect_from(self.target.view)
+        if self.source.has_view() and self.target.has_view():
+            self.source.view.disconnect_from(self.target.view)
 
         # emit "port_disconnected" signal from the parent graph.
         if self.emit_signal:
@@ -419,6 +575,61 @@ class PortDisconnectedCmd(QtGui.QUndoCommand):
                                          ports[PortTypeEnum.OUT.value])
 
 
+class PortsConnectedCmd(QtGui.QUndoCommand):
+    """
+    Multiple port connections command.
+    (the port models are wired first then all the pipes are created in
+    a single pass through the viewer)
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        connections (list[tuple(NodeGraphQt.Port, NodeGraphQt.Port)]):
+            input port, output port pairs.
+        emit_signal (bool): emit port connection signals.
+    """
+
+    def __init__(self, graph, connections, emit_signal=False):
+        QtGui.QUndoCommand.__init__(self)
+        self.setText('connected ports')
+        self.graph = graph
+        self.connections = connections
+        self.emit_signal = emit_signal
+
+    def undo(self):
+        model = self.graph.model
+        for in_port, out_port in reversed(self.connections):
+            model.remove_connection(out_port, in_port)
+            if in_port.has_view() and out_port.has_view():
+                in_port.view.disconnect_from(out_port.view)
+        self.graph.invalidate_nodes({p.node() for p, _ in self.connections})
+
+        for in_port, out_port in reversed(self.connections):
+            in_port.node().on_input_disconnected(in_port, out_port)
+            if self.emit_signal:
+                self.graph.port_disconnected.emit(in_port, out_port)
+
+    def redo(self):
+        model = self.graph.model
+        for in_port, out_port in self.connections:
+            model.add_connection(out_port, in_port)
+        self.graph.invalidate_nodes({p.node() for p, _ in self.connections})
+
+        # only the pipes between built port items, in virtualized mode the
+        # other pipes are drawn when the node items are built.
+        viewer = self.graph.viewer()
+        if viewer is not None:
+            viewer.establish_connections(
+                [(in_port.view, out_port.view)
+                 for in_port, out_port in self.connections
+                 if in_port.has_view() and out_port.has_view()]
+            )
+
+        for in_port, out_port in self.connections:
+            in_port.node().on_input_connected(in_port, out_port)
+            if self.emit_signal:
+                self.graph.port_connected.emit(in_port, out_port)
+
+
 class PortLockedCmd(QtGui.QUndoCommand):
     """
     Port locked command.
@@ -434,11 +645,13 @@ class PortLockedCmd(QtGui.QUndoCommand):
 
     def undo(self):
         self.port.model.locked = False
-        self.port.view.locked = False
+        if self.port.has_view():
+            self.port.view.locked = False
 
     def redo(self):
         self.port.model.locked = True
-        self.port.view.locked = True
+        if self.port.has_view():
+            self.port.view.locked = True
 
 
 class PortUnlockedCmd(QtGui.QUndoCommand):
@@ -456,11 +669,13 @@ class PortUnlockedCmd(QtGui.QUndoCommand):
 
     def undo(self):
         self.port.model.locked = True
-        self.port.view.locked = True
+        if self.port.has_view():
+            self.port.view.locked = True
 
     def redo(self):
         self.port.model.locked = False
-        self.port.view.locked = False
+        if self.port.has_view():
+            self.port.view.locked = False
 
 
 class PortVisibleCmd(QtGui.QUndoCommand):
@@ -482,6 +697,8 @@ class PortVisibleCmd(QtGui.QUndoCommand):
 
     def set_visible(self, visible):
         self.port.model.visible = visible
+        if not self.port.has_view():
+            return
         self.port.view.setVisible(visible)
         node_view = self.port.node().view
         text_item = None
@@ -0,0 +1,512 @@
+#!/usr/bin/python
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Self
+
+from QtGraphology.constants import PortTypeEnum
+from QtGraphology.errors import NodeExecutionError
+from QtGraphology.nodes.base_node import BaseNode
+from QtGraphology.nodes.group_node import GroupNode
+from QtGraphology.nodes.port_node import PortInputNode, PortOutputNode
+
+if TYPE_CHECKING:
+    from QtGraphology.base.graph import NodeGraph
+    from QtGraphology.base.port import Port
+
+
+def check_port_value(port: Port, value: Any) -> None:
+    """
+    Validate a value against the port data type.
+
+    Args:
+        port (QtGraphology.Port): node port.
+        value (object): port value.
+
+    Raises:
+        NodeExecutionError: the value doesn't match the port data type.
+    """
+    data_type = port.model.data_type
+    if data_type is None or value is None or isinstance(value, data_type):
+        return
+    raise NodeExecutionError(
+        '"{}" port "{}" expects {} got {}.'.format(
+            port.node().name(), port.name(),
+            getattr(data_type, '__name__', data_type),
+            type(value).__name__))
+
+
+class GraphExecutor(object):
+    """
+    Evaluates the nodes of a node graph in topological order.
+
+    Each node is evaluated with :meth:`BaseNode.run` from the values of
+    the output ports connected to its input ports, the output values are
+    kept per node so downstream nodes (and the caller) can read them.
+    The outputs are memoized, only the nodes the graph model marks dirty
+    (see :meth:`NodeGraphModel.invalidate_node`) are re-evaluated.
+    Group nodes are evaluated through their sub graph, the expanded sub
+    graph or a headless sub graph built from the group node session.
+
+    Note:
+        Connections that close a cycle (non acyclic graph) are ignored, the
+        input port gets the value from the previous execution if any.
+
+    Args:
+        graph (QtGraphology.NodeGraph): node graph.
+    """
+
+    def __init__(self: Self, graph: NodeGraph) -> None:
+        self._graph: NodeGraph = graph
+        self._results: dict[str, dict[str, Any]] = {}
+        self._sub_graphs: dict[str, tuple[dict, NodeGraph]] = {}
+        self._sub_executors: dict[NodeGraph, GraphExecutor] = {}
+        # executor of the parent graph when executing a group node sub graph.
+        self._parent: GraphExecutor | None = None
+
+    def __repr__(self: Self) -> str:
+        return '<{}({}) object at {}>'.format(
+            self.__class__.__name__, self._graph, hex(id(self)))
+
+    @property
+    def graph(self: Self) -> NodeGraph:
+        """
+        Returns:
+            QtGraphology.NodeGraph: the executed node graph.
+        """
+        return self._graph
+
+    def results(self: Self) -> dict[str, dict[str, Any]]:
+        """
+        Returns the output values from the last evaluation of the nodes.
+
+        Returns:
+            dict: {<node_id>: {<output_port_name>: <value>}}
+        """
+        return self._results
+
+    def outputs(self: Self, node: BaseNode) -> dict[str, Any] | None:
+        """
+        Returns the output values from the last evaluation of a node.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+
+        Returns:
+            dict: {<output_port_name>: <value>} or None if not evaluated.
+        """
+        return self._results.get(node.id)
+
+    def clear(self: Self) -> None:
+        """
+        Discard the evaluated output values and cached sub graphs.
+        """
+        self._results.clear()
+        self._sub_graphs.clear()
+        self._sub_executors.clear()
+
+    def is_cached(self: Self, node_id: str) -> bool:
+        """
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            bool: True if the node outputs are evaluated and up to date.
+        """
+        return (node_id in self._results and
+                not self._graph.model.is_dirty(node_id))
+
+    def store_outputs(self: Self, node_id: str, outputs: dict[str, Any]) -> None:
+        """
+        Store the output values of an evaluated node and clear its dirty
+        state, the node stays dirty while an upstream node is dirty.
+        (connections closing a cycle are ignored like the evaluation order)
+
+        Args:
+            node_id (str): node id.
+            outputs (dict): {<output_port_name>: <value>}
+        """
+        self._results[node_id] = outputs
+        model = self._graph.model
+        index = model.topology.index
+        position = index(node_id)
+        for n_id in model.node_predecessors(node_id):
+            n_position = index(n_id)
+            if position is not None and (n_position is None or n_position >= position):
+                continue
+            if model.is_dirty(n_id):
+                return
+        model.clean_node(node_id)
+
+    def node_inputs(self: Self, node: BaseNode) -> dict[str, Any]:
+        """
+        Gather the input values of a node from the evaluated output values
+        of the connected nodes.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+
+        Returns:
+            dict: {<input_port_name>: <value>} multi input ports get a list.
+        """
+        return {port.name(): self.port_input(port) for port in node.input_ports()}
+
+    def port_input(self: Self, port: Port) -> Any:
+        """
+        Gather the value of an input port from the evaluated output values
+        of the connected nodes.
+
+        Args:
+            port (QtGraphology.Port): input port.
+
+        Returns:
+            object: port value, multi input ports get a list.
+        """
+        results = self._results
+        values = []
+        for src_port in self._graph.model.connected_ports(port):
+            outputs = results.get(src_port.node().id)
+            if outputs is None:
+                continue
+            value = outputs.get(src_port.name())
+            check_port_value(port, value)
+            values.append(value)
+        if port.multi_connection():
+            return values
+        return values[0] if values else None
+
+    def evaluate_node(self: Self, node: BaseNode, inputs: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Evaluate a single node and store its output values.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+            inputs (dict): input values. (default: gathered from the
+                connected nodes)
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        if inputs is None:
+            inputs = self.node_inputs(node)
+        outputs = self.run_node(node, inputs)
+        self.store_outputs(node.id, outputs)
+        return outputs
+
+    def run_node(self: Self, node: BaseNode, inputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run a node and validate its output values without storing them.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+            inputs (dict): {<input_port_name>: <value>}
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        try:
+            if isinstance(node, GroupNode):
+                outputs = self._run_group_node(node, inputs)
+            else:
+                outputs = node.run(inputs)
+        except NodeExecutionError:
+            raise
+        except Exception as error:
+            raise NodeExecutionError(
+                '"{}" failed to execute: {}'.format(node.name(), error)
+            ) from error
+
+        return self.check_outputs(node, outputs)
+
+    def check_outputs(self: Self, node: BaseNode, outputs: dict[str, Any] | None) -> dict[str, Any]:
+        """
+        Validate the output values returned by a node.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+            outputs (dict): {<output_port_name>: <value>}
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        outputs = outputs or {}
+        if not isinstance(outputs, dict):
+            raise NodeExecutionError(
+                '"{}" run() must return a dict of output values not {}.'
+                .format(node.name(), type(outputs).__name__))
+        for name, value in outputs.items():
+            port = node.get_output(name)
+            if port is None:
+                raise NodeExecutionError(
+                    '"{}" has no output port "{}".'.format(node.name(), name))
+            check_port_value(port, value)
+        return outputs
+
+    def execute(self: Self,
+                nodes: list[BaseNode] | None = None,
+                port_inputs: dict[str, Any] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Evaluate the dirty nodes in topological order, the clean nodes
+        keep their memoized outputs.
+
+        Args:
+            nodes (list[QtGraphology.BaseNode]): nodes to evaluate, the
+                upstream nodes must already be evaluated. (default: all nodes)
+            port_inputs (dict): {<port_name>: <value>} values for the
+                sub graph input port nodes when executing a group node
+                session. (default: pulled from the parent graph)
+
+        Returns:
+            dict: {<node_id>: {<output_port_name>: <value>}}
+        """
+        graph_nodes = self._graph.model.nodes
+        for node_id in self.execution_order(nodes):
+            node = graph_nodes.get(node_id)
+            if not isinstance(node, BaseNode):
+                continue
+            if isinstance(node, PortInputNode):
+                if port_inputs is None:
+                    port_inputs = self.parent_inputs()
+                self.set_port_inputs(node, port_inputs)
+                continue
+            if self.is_cached(node_id):
+                continue
+            self.evaluate_node(node)
+        return self._results
+
+    def execution_order(self: Self, nodes: list[BaseNode] | None = None) -> list[str]:
+        """
+        Returns the node ids in evaluation order, a subset of nodes is
+        sorted by its topological index instead of filtering the order of
+        the whole graph.
+
+        Args:
+            nodes (list[QtGraphology.BaseNode]): nodes. (default: all nodes)
+
+        Returns:
+            list[str]: node ids upstream first.
+        """
+        model = self._graph.model
+        if nodes is None:
+            return model.topological_order()
+        index = model.topology.index
+        node_ids = list(dict.fromkeys(n.id for n in nodes if index(n.id) is not None))
+        node_ids.sort(key=index)
+        return node_ids
+
+    def upstream_nodes(self: Self, node_ids: list[str]) -> list[BaseNode]:
+        """
+        Returns the nodes that have to be evaluated for the outputs of the
+        specified nodes, the nodes and their upstream nodes stopping at the
+        memoized nodes.
+
+        Args:
+            node_ids (list[str]): node ids.
+
+        Returns:
+            list[QtGraphology.BaseNode]: nodes to evaluate.
+        """
+        model = self._graph.model
+        visited = set()
+        stack = list(node_ids)
+        while stack:
+            node_id = stack.pop()
+            if node_id in visited or self.is_cached(node_id):
+                continue
+            visited.add(node_id)
+            stack.extend(model.node_predecessors(node_id))
+        return [model.nodes[n_id] for n_id in visited if n_id in model.nodes]
+
+    def pull(self: Self, port: Port) -> Any:
+        """
+        Lazily evaluate the value of a single port, only the nodes upstream
+        from the port are evaluated (the memoized outputs are reused).
+
+        Output ports of a group node only evaluate the sub graph nodes
+        upstream from the matching output port node, input port nodes of a
+        sub graph pull the group node inputs from the parent graph.
+
+        Args:
+            port (QtGraphology.Port): input or output port.
+
+        Returns:
+            object: port value.
+        """
+        self.refresh_port_inputs()
+        node = port.node()
+        if port.type_() == PortTypeEnum.IN.value:
+            sources = {p.node().id for p in self._graph.model.connected_ports(port)}
+            self.execute(self.upstream_nodes(list(sources)))
+            return self.port_input(port)
+        if isinstance(node, GroupNode) and not self.is_cached(node.id):
+            return self._pull_group_output(node, port.name())
+        self.execute(self.upstream_nodes([node.id]))
+        return self._results.get(node.id, {}).get(port.name())
+
+    def pull_inputs(self: Self, node: BaseNode) -> dict[str, Any]:
+        """
+        Lazily evaluate the input values of a node.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+
+        Returns:
+            dict: {<input_port_name>: <value>}
+        """
+        self.refresh_port_inputs()
+        self.execute(self.upstream_nodes(self._graph.model.node_predecessors(node.id)))
+        return self.node_inputs(node)
+
+    def refresh_port_inputs(self: Self) -> None:
+        """
+        Update the sub graph input port nodes from the parent graph so the
+        nodes downstream from a changed group node input are invalidated
+        before the upstream nodes are collected.
+        """
+        if self._parent is None:
+            return
+        port_inputs = None
+        for node in self._graph.model.nodes.values():
+            if isinstance(node, PortInputNode):
+                if port_inputs is None:
+                    port_inputs = self.parent_inputs()
+                self.set_port_inputs(node, port_inputs)
+
+    def parent_inputs(self: Self) -> dict[str, Any]:
+        """
+        Returns the group node input values for the sub graph input port
+        nodes, pulled from the parent graph executor.
+
+        Returns:
+            dict: {<port_name>: <value>} empty if not a sub graph executor.
+        """
+        group_node = getattr(self._graph, 'node', None)
+        if self._parent is None or group_node is None:
+            return {}
+        return self._parent.pull_inputs(group_node)
+
+    def _pull_group_output(self: Self, node: GroupNode, name: str) -> Any:
+        """
+        Evaluate a single group node output without running the whole sub
+        graph, the group node outputs aren't stored as the other outputs
+        are left unevaluated.
+
+        Args:
+            node (QtGraphology.GroupNode): group node.
+            name (str): output port name.
+
+        Returns:
+            object: port value.
+        """
+        sub_graph = self.sub_graph(node)
+        executor = self.sub_executor(sub_graph)
+        for port_node in sub_graph.model.nodes.values():
+            if not isinstance(port_node, PortOutputNode):
+                continue
+            port = port_node.get_input(name)
+            if port is not None:
+                value = executor.pull(port)
+                check_port_value(node.get_output(name), value)
+                return value
+        return None
+
+    def set_port_inputs(self: Self, node: PortInputNode, port_inputs: dict[str, Any]) -> None:
+        """
+        Pass the group node input values through a sub graph input port
+        node, the downstream nodes are invalidated when the values change.
+
+        Args:
+            node (QtGraphology.PortInputNode): sub graph input port node.
+            port_inputs (dict): {<port_name>: <value>}
+        """
+        outputs = {p.name(): port_inputs.get(p.name())
+                   for p in node.output_ports()}
+        if self._results.get(node.id) != outputs:
+            self._graph.model.invalidate_node(node.id)
+        self.store_outputs(node.id, outputs)
+
+    def sub_graph(self: Self, node: GroupNode) -> NodeGraph:
+        """
+        Returns the sub graph used to execute a group node, the expanded
+        sub graph or a cached headless sub graph built from the group
+        node session.
+
+        Args:
+            node (QtGraphology.GroupNode): group node.
+
+        Returns:
+            QtGraphology.SubGraph: sub graph.
+        """
+        sub_graph = node.get_sub_graph() if node.graph else None
+        if sub_graph is not None:
+            return sub_graph
+        session = node.get_sub_graph_session()
+        cached = self._sub_graphs.get(node.id)
+        if cached and cached[0] is session:
+            return cached[1]
+        if cached:
+            self._sub_executors.pop(cached[1], None)
+        sub_graph = self._graph.build_sub_graph(node)
+        self._sub_graphs[node.id] = (session, sub_graph)
+        return sub_graph
+
+    def _run_group_node(self: Self, node: GroupNode, inputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute a group node sub graph and collect the values reaching the
+        output port nodes.
+
+        Args:
+            node (QtGraphology.GroupNode): group node.
+            inputs (dict): group node input values.
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        sub_graph = self.sub_graph(node)
+        executor = self.sub_executor(sub_graph)
+        executor.execute(port_inputs=inputs)
+        return executor.port_outputs()
+
+    def port_outputs(self: Self) -> dict[str, Any]:
+        """
+        Collect the values reaching the output port nodes of an executed
+        group node sub graph.
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        outputs = {}
+        for port_node in self._graph.model.nodes.values():
+            if not isinstance(port_node, PortOutputNode):
+                continue
+            for name, value in self.node_inputs(port_node).items():
+                outputs[name] = value
+        return outputs
+
+    def sub_executor(self: Self, sub_graph: NodeGraph) -> GraphExecutor:
+        """
+        Returns the executor for a group node sub graph, kept per sub graph
+        so the sub graph node outputs are memoized too.
+
+        Args:
+            sub_graph (QtGraphology.SubGraph): sub graph.
+
+        Returns:
+            GraphExecutor: sub graph executor.
+        """
+        executor = self._sub_executors.get(sub_graph)
+        if executor is None:
+            executor = self.new_sub_executor(sub_graph)
+            executor._parent = self
+            self._sub_executors[sub_graph] = executor
+        return executor
+
+    def new_sub_executor(self: Self, sub_graph: NodeGraph) -> GraphExecutor:
+        """
+        Create the executor for a group node sub graph.
+
+        Args:
+            sub_graph (QtGraphology.SubGraph): sub graph.
+
+        Returns:
+            GraphExecutor: sub graph executor.
+        """
+        return self.__class__(sub_graph)
@@ -21,6 +21,8 @@ class NodeFactory(object):
         self.__aliases: ALIASES = {}
         self.__names: NAMES = {}
         self.__nodes: NODES = {}
+        # prototype instances of the "BaseNode.PROTOTYPE" node types.
+        self.__prototypes: dict[str, NodeObject] = {}
 
     @property
     def names(self: Self) -> NODES:
@@ -52,23 +54,36 @@ class NodeFactory(object):
         """
         return self.__nodes
 
-    def create_node_instance(self: Self, node_type: str='') -> NodeObject:
+    def create_node_instance(self: Self, node_type: str='') -> NodeObject | None:
         """
         create node object by the node type identifier or alias.
 
+        Node types with :attr:`BaseNode.PROTOTYPE` enabled are cloned from a
+        prototype instance built on the first call.
+
         Args:
             node_type (str): node type or optional alias name.
 
         Returns:
-            QtGraphology.NodeObject: new node object.
+            QtGraphology.NodeObject: new node object or None if the node type
+                isn't registered.
         """
         if node_type in self.aliases:
             node_type = self.aliases[node_type]
 
-        _NodeClass: str | None = self.__nodes.get(node_type)
+        _NodeClass: type[NodeObject] | None = self.__nodes.get(node_type)
+        if not _NodeClass:
+            return None
 
-        if _NodeClass:
-            return NodeObject()
+        if getattr(_NodeClass, 'PROTOTYPE', False):
+            prototype = self.__prototypes.get(node_type)
+            if prototype is None:
+                prototype = _NodeClass()
+                self.__prototypes[node_type] = prototype
+            node = prototype.clone()
+            if node is not None:
+                return node
+        return _NodeClass()
 
     def register_node(self, node, alias=None):
         """
@@ -109,5 +124,6 @@ class NodeFactory(object):
         clear out registered nodes, to prevent conflicts on reset.
         """
         self.__nodes.clear()
+        self.__prototypes.clear()
         self.__names.clear()
         self.__aliases.clear()
@@ -0,0 +1,353 @@
+#!/usr/bin/python
+from __future__ import annotations
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Self
+
+from QtGraphology.constants import TRECT, LayoutDirectionEnum, NodeAlignEnum
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# row count from where the bulk transforms hand the columns to numpy,
+# below it the python loops are faster than building the index array.
+_NUMPY_MIN_ROWS = 64
+
+
+def _unique(handles: Iterable[int]) -> list[int]:
+    """
+    Returns the handles without repeats (first occurrence order), numpy
+    fancy indexing writes a repeated row once so the python loops must
+    not see it twice either.
+
+    Args:
+        handles (list[int]): row handles.
+
+    Returns:
+        list[int]: unique row handles.
+    """
+    return list(dict.fromkeys(handles))
+
+
+class NodeGeometryTable(object):
+    """
+    Columnar store of the node x, y, width and height.
+
+    Each column is a flat "array('d')" and a node is addressed by a dense
+    integer handle (row index), rows of removed nodes are recycled from a
+    free list. The bulk transforms work on the columns for a list of
+    handles so moving N nodes is one call instead of N property round
+    trips, when numpy is installed the columns are wrapped as numpy arrays
+    (no copy) and transformed with column-wide operations, otherwise they
+    fall back to a python loop over the handles. A handle passed more than
+    once to a transform is transformed once.
+
+    Note:
+        The x, y position is the top left corner of the node same as the
+        node "pos" property.
+    """
+
+    def __init__(self: Self) -> None:
+        self.x: array = array('d')
+        self.y: array = array('d')
+        self.width: array = array('d')
+        self.height: array = array('d')
+        self._free: list[int] = []
+
+    def __repr__(self: Self) -> str:
+        return '<{}({} rows) object at {}>'.format(
+            self.__class__.__name__, len(self), hex(id(self)))
+
+    def __len__(self: Self) -> int:
+        return len(self.x) - len(self._free)
+
+    def add(self: Self, x: float, y: float, width: float, height: float) -> int:
+        """
+        Add a row to the table.
+
+        Args:
+            x (float): x position.
+            y (float): y position.
+            width (float): node width.
+            height (float): node height.
+
+        Returns:
+            int: row handle.
+        """
+        if self._free:
+            handle = self._free.pop()
+            self.x[handle] = x
+            self.y[handle] = y
+            self.width[handle] = width
+            self.height[handle] = height
+            return handle
+        self.x.append(x)
+        self.y.append(y)
+        self.width.append(width)
+        self.height.append(height)
+        return len(self.x) - 1
+
+    def remove(self: Self, handle: int) -> TRECT:
+        """
+        Release a row, the handle is recycled by the next "add".
+
+        Args:
+            handle (int): row handle.
+
+        Returns:
+            tuple(float, float, float, float): last x, y, width, height.
+        """
+        row = self.rect(handle)
+        self._free.append(handle)
+        return row
+
+    def clear(self: Self) -> None:
+        """
+        Remove all rows.
+        """
+        for column in (self.x, self.y, self.width, self.height):
+            del column[:]
+        self._free.clear()
+
+    def _numpy_rows(self: Self, handles: Sequence[int]):
+        """
+        Returns the handles as a numpy index array, None when numpy isn't
+        installed or there are too few rows to be worth it.
+
+        Args:
+            handles (list[int]): row handles.
+
+        Returns:
+            numpy.ndarray: row indices or None.
+        """
+        if numpy is None or len(handles) < _NUMPY_MIN_ROWS:
+            return None
+        return numpy.asarray(handles, dtype=numpy.intp)
+
+    @staticmethod
+    def _numpy_column(column: array):
+        """
+        Args:
+            column (array): table column.
+
+        Returns:
+            numpy.ndarray: writable view of the column, it must be released
+                before the column is resized.
+        """
+        return numpy.frombuffer(column, dtype=numpy.float64)
+
+    def rect(self: Self, handle: int) -> TRECT:
+        """
+        Args:
+            handle (int): row handle.
+
+        Returns:
+            tuple(float, float, float, float): x, y, width, height.
+        """
+        return (self.x[handle], self.y[handle],
+                self.width[handle], self.height[handle])
+
+    def positions(self: Self, handles: Iterable[int]) -> list[list[float]]:
+        """
+        Args:
+            handles (list[int]): row handles.
+
+        Returns:
+            list[list[float, float]]: x, y positions.
+        """
+        xs, ys = self.x, self.y
+        return [[xs[h], ys[h]] for h in handles]
+
+    def set_positions(self: Self,
+                      handles: Sequence[int],
+                      positions: Sequence[Sequence[float]]) -> None:
+        """
+        Args:
+            handles (list[int]): row handles.
+            positions (list[list[float, float]]): x, y positions.
+        """
+        xs, ys = self.x, self.y
+        for h, (x, y) in zip(handles, positions):
+            xs[h] = x
+            ys[h] = y
+
+    def bounding_box(self: Self, handles: Iterable[int] | None = None) -> TRECT | None:
+        """
+        Returns the bounding box of the rows.
+
+        Args:
+            handles (list[int]): row handles. (default: all rows)
+
+        Returns:
+            tuple(float, float, float, float): x, y, width, height or None
+                when there are no rows.
+        """
+        if handles is None:
+            free = set(self._free)
+            handles = [h for h in range(len(self.x)) if h not in free]
+        xs, ys, ws, hs = self.x, self.y, self.width, self.height
+        handles = list(handles)
+        if not handles:
+            return None
+        rows = self._numpy_rows(handles)
+        if rows is not None:
+            x = self._numpy_column(xs)[rows]
+            y = self._numpy_column(ys)[rows]
+            left, top = float(x.min()), float(y.min())
+            right = float((x + self._numpy_column(ws)[rows]).max())
+            bottom = float((y + self._numpy_column(hs)[rows]).max())
+            return left, top, right - left, bottom - top
+        left = min(xs[h] for h in handles)
+        top = min(ys[h] for h in handles)
+        right = max(xs[h] + ws[h] for h in handles)
+        bottom = max(ys[h] + hs[h] for h in handles)
+        return left, top, right - left, bottom - top
+
+    def translate(self: Self, handles: Sequence[int], dx: float, dy: float) -> None:
+        """
+        Offset the rows position.
+
+        Args:
+            handles (list[int]): row handles.
+            dx (float): x offset.
+            dy (float): y offset.
+        """
+        handles = _unique(handles)
+        rows = self._numpy_rows(handles)
+        if rows is not None:
+            self._numpy_column(self.x)[rows] += dx
+            self._numpy_column(self.y)[rows] += dy
+            return
+        xs, ys = self.x, self.y
+        for h in handles:
+            xs[h] += dx
+            ys[h] += dy
+
+    def scale(self: Self,
+              handles: Sequence[int],
+              sx: float,
+              sy: float,
+              origin: Sequence[float] | None = None) -> None:
+        """
+        Scale the rows center position about an origin, the node sizes
+        are left untouched.
+
+        Args:
+            handles (list[int]): row handles.
+            sx (float): x scale factor.
+            sy (float): y scale factor.
+            origin (tuple(float, float)): scale origin.
+                (default: bounding box center)
+        """
+        handles = _unique(handles)
+        if origin is None:
+            rect = self.bounding_box(handles)
+            if rect is None:
+                return
+            origin = (rect[0] + rect[2] / 2, rect[1] + rect[3] / 2)
+        ox, oy = origin
+        rows = self._numpy_rows(handles)
+        if rows is not None:
+            for column, size, o, factor in ((self.x, self.width, ox, sx),
+                                            (self.y, self.height, oy, sy)):
+                pos = self._numpy_column(column)
+                half = self._numpy_column(size)[rows] / 2
+                pos[rows] = o + (pos[rows] + half - o) * factor - half
+            return
+        xs, ys, ws, hs = self.x, self.y, self.width, self.height
+        for h in handles:
+            half_w, half_h = ws[h] / 2, hs[h] / 2
+            xs[h] = ox + (xs[h] + half_w - ox) * sx - half_w
+            ys[h] = oy + (ys[h] + half_h - oy) * sy - half_h
+
+    def align(self: Self, handles: Sequence[int], edge: NodeAlignEnum) -> None:
+        """
+        Align the rows to the matching edge of their bounding box.
+
+        Args:
+            handles (list[int]): row handles.
+            edge (NodeAlignEnum): alignment edge.
+        """
+        handles = _unique(handles)
+        rect = self.bounding_box(handles)
+        if rect is None:
+            return
+        left, top, width, height = rect
+        edge = NodeAlignEnum(edge)
+        rows = self._numpy_rows(handles)
+        if rows is not None:
+            if edge in (NodeAlignEnum.LEFT, NodeAlignEnum.RIGHT, NodeAlignEnum.CENTER_X):
+                pos, size, start, span = self.x, self.width, left, width
+            else:
+                pos, size, start, span = self.y, self.height, top, height
+            pos = self._numpy_column(pos)
+            if edge in (NodeAlignEnum.LEFT, NodeAlignEnum.TOP):
+                pos[rows] = start
+            elif edge in (NodeAlignEnum.RIGHT, NodeAlignEnum.BOTTOM):
+                pos[rows] = start + span - self._numpy_column(size)[rows]
+            else:
+                pos[rows] = start + span / 2 - self._numpy_column(size)[rows] / 2
+            return
+        xs, ys, ws, hs = self.x, self.y, self.width, self.height
+        if edge is NodeAlignEnum.LEFT:
+            for h in handles:
+                xs[h] = left
+        elif edge is NodeAlignEnum.RIGHT:
+            for h in handles:
+                xs[h] = left + width - ws[h]
+        elif edge is NodeAlignEnum.CENTER_X:
+            center = left + width / 2
+            for h in handles:
+                xs[h] = center - ws[h] / 2
+        elif edge is NodeAlignEnum.TOP:
+            for h in handles:
+                ys[h] = top
+        elif edge is NodeAlignEnum.BOTTOM:
+            for h in handles:
+                ys[h] = top + height - hs[h]
+        elif edge is NodeAlignEnum.CENTER_Y:
+            center = top + height / 2
+            for h in handles:
+                ys[h] = center - hs[h] / 2
+
+    def distribute(self: Self,
+                   handles: Sequence[int],
+                   direction: LayoutDirectionEnum | int = LayoutDirectionEnum.HORIZONTAL.value) -> None:
+        """
+        Space the rows with an equal gap between them, the first and
+        last rows (in the direction) stay in place.
+
+        Args:
+            handles (list[int]): row handles.
+            direction (LayoutDirectionEnum): horizontal or vertical.
+        """
+        handles = _unique(handles)
+        if len(handles) < 3:
+            return
+        direction = LayoutDirectionEnum(getattr(direction, 'value', direction))
+        if direction is LayoutDirectionEnum.HORIZONTAL:
+            pos, size = self.x, self.width
+        else:
+            pos, size = self.y, self.height
+        rows = self._numpy_rows(handles)
+        if rows is not None:
+            column = self._numpy_column(pos)
+            sizes = self._numpy_column(size)
+            rows = rows[numpy.argsort(column[rows], kind='stable')]
+            ordered_sizes = sizes[rows]
+            start = column[rows[0]]
+            span = column[rows[-1]] + ordered_sizes[-1] - start
+            gap = (span - ordered_sizes.sum()) / (len(rows) - 1)
+            offsets = numpy.concatenate(([0.0], numpy.cumsum(ordered_sizes[:-1] + gap)))
+            column[rows] = start + offsets
+            return
+        ordered = sorted(handles, key=lambda h: pos[h])
+        first, last = ordered[0], ordered[-1]
+        span = pos[last] + size[last] - pos[first]
+        gap = (span - sum(size[h] for h in ordered)) / (len(ordered) - 1)
+        current = pos[first]
+        for h in ordered:
+            pos[h] = current
+            current += size[h] + gap
@@ -12,10 +12,12 @@ import re
 from typing import Self, Any
 
 from QtGraphology.base import (
-    NodeMovedCmd,
+    NodesMovedCmd,
     NodeAddedCmd,
+    NodesAddedCmd,
     NodesRemovedCmd,
     PortConnectedCmd,
+    PortsConnectedCmd,
 )
 from QtGraphology.qgraphics.node_abstract import AbstractNodeItem
 from QtGraphology.qgraphics.pipe import PipeItem
@@ -24,17 +26,26 @@ from QtGraphology.widgets.scene import NodeScene
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from QtGraphology.base import session
+from QtGraphology.base.executor import GraphExecutor
 from QtGraphology.base.factory import NodeFactory
+from QtGraphology.base.layout import (
+    ForceDirectedLayout,
+    ForceLayoutWorker,
+    LayeredLayout,
+)
 from QtGraphology.base.menu import NodeGraphMenu, NodesMenu
-from QtGraphology.base.model import NodeGraphModel
+from QtGraphology.base.model import NodeGraphModel, NodeHydrationPlan
 from QtGraphology.base.node import NodeObject
 from QtGraphology.base.port import Port
 from QtGraphology.base.types import TSerializedData
 from QtGraphology.constants import (
     LayoutDirectionEnum,
     MIME_TYPE,
+    NodeAlignEnum,
     PipeLayoutEnum,
     PortTypeEnum,
+    TRECT,
     URI_SCHEME,
     URN_SCHEME,
     ViewerEnum,
@@ -148,6 +159,36 @@ class NodeGraph(QtCore.QObject):
     :parameters: str
     :emits: new session path
     """
+    nodes_invalidated: QtCore.Signal = QtCore.Signal(list)
+    """
+    Signal triggered when an edit invalidates the executor outputs of nodes.
+
+    :parameters: list[str]
+    :emits: ids of the invalidated nodes (downstream nodes not included).
+    """
+    node_executed: QtCore.Signal = QtCore.Signal(NodeObject)
+    """
+    Signal triggered when a node has been evaluated by the asynchronous
+    graph executor.
+
+    :parameters: :class:`QtGraphology.BaseNode`
+    :emits: evaluated node
+    """
+    execution_progress: QtCore.Signal = QtCore.Signal(int, int)
+    """
+    Signal triggered by the asynchronous graph executor as nodes finish.
+
+    :parameters: int, int
+    :emits: evaluated node count, node count to evaluate
+    """
+    execution_finished: QtCore.Signal = QtCore.Signal(bool)
+    """
+    Signal triggered when the asynchronous graph executor run ends.
+
+    :parameters: bool
+    :emits: True if all the nodes were evaluated, False if the run was
+        cancelled or failed.
+    """
     context_menu_prompt: QtCore.Signal = QtCore.Signal(object, object)
     """
     Signal is triggered just before a context menu is shown.
@@ -183,9 +224,11 @@ class NodeGraph(QtCore.QObject):
 
             viewer_: NodeViewer | Any = kwargs.get('viewer')
             if isinstance(viewer_, NodeViewer):
-                self._viewer: NodeViewer = viewer_
+                self._viewer: NodeViewer | None = viewer_
+            elif kwargs.get('headless'):
+                self._viewer: NodeViewer | None = None
             else:
-                self._viewer: NodeViewer = NodeViewer(undo_stack=self._undo_stack)
+                self._viewer: NodeViewer | None = NodeViewer(undo_stack=self._undo_stack)
 
             node_factory_: NodeFactory | Any = kwargs.get('node_factory')
             if isinstance(node_factory_, NodeFactory):
@@ -207,21 +250,18 @@ class NodeGraph(QtCore.QObject):
         else:
             self._model: NodeGraphModel = NodeGraphModel()
             self._undo_stack: QtGui.QUndoStack = QtGui.QUndoStack(parent=self)
-            self._viewer: NodeViewer = NodeViewer(undo_stack=self._undo_stack)
+            self._viewer: NodeViewer | None = NodeViewer(undo_stack=self._undo_stack)
             self._node_factory: NodeFactory = NodeFactory()
             self._model.layout_direction = LayoutDirectionEnum.VERTICAL
             self._model.pipe_style = PipeLayoutEnum.CURVED
 
-        self._viewer.set_layout_direction(direction=self._model.layout_direction)
-        self._viewer.set_pipe_layout(self._model.pipe_style)
-
-        # viewer needs a reference to the model port connection constrains
-        # for the user interaction with the live pipe.
-        self._viewer.accept_connection_types = self._model.accept_connection_types
-        self._viewer.reject_connection_types = self._model.reject_connection_types
+        self._sync_viewer()
 
         self._widget = None
         self._sub_graphs: dict = {}
+        self._executor: GraphExecutor | None = None
+        self._layout_engine: LayeredLayout = LayeredLayout()
+        self._layout_worker: tuple[QtCore.QThread, ForceLayoutWorker] | None = None
         self._undo_view = None
         self._context_menu: dict[Any, Any] = {}
         self._register_context_menu()
@@ -249,10 +289,32 @@ class NodeGraph(QtCore.QObject):
         """
         self.register_node(BackdropNode, alias='Backdrop')
 
+    def _sync_viewer(self: Self) -> None:
+        """
+        Push the node graph model settings to the viewer.
+        """
+        if self._viewer is None:
+            return
+        self._viewer.acyclic = self._model.acyclic
+        self._viewer.pipe_collision = self._model.pipe_collision
+        self._viewer.pipe_slicing = self._model.pipe_slicing
+        self._viewer.set_layout_direction(direction=self._model.layout_direction)
+        self._viewer.set_pipe_layout(self._model.pipe_style)
+
+        # viewer needs a reference to the model port connection constrains
+        # for the user interaction with the live pipe.
+        self._viewer.accept_connection_types = self._model.accept_connection_types
+        self._viewer.reject_connection_types = self._model.reject_connection_types
+        self._viewer.topology = self._model.topology
+        # the viewer builds and releases the node items in virtualized mode.
+        self._viewer.graph_nodes = self._model.nodes
+
     def _wire_signals(self: Self) -> None:
         """
         Connect up all the signals and slots here.
         """
+        if self._viewer is None:
+            return
 
         # internal signals.
         self._viewer.search_triggered.connect(self._on_search_triggered)
@@ -444,11 +506,11 @@ class NodeGraph(QtCore.QObject):
         Args:
             node_data (dict): {<node_view>: <previous_pos>}
         """
-        self._undo_stack.beginMacro('move nodes')
-        for node_view, prev_pos in node_data.items():
-            node = self._model.nodes[node_view.id]
-            self._undo_stack.push(NodeMovedCmd(node, node.pos(), prev_pos))
-        self._undo_stack.endMacro()
+        nodes = [self._model.nodes[view.id] for view in node_data.keys()]
+        positions = [view.xy_pos for view in node_data.keys()]
+        self._undo_stack.push(
+            NodesMovedCmd(self, nodes, positions, list(node_data.values()))
+        )
 
     def _on_node_backdrop_updated(self, node_id, update_property, value):
         """
@@ -554,6 +616,7 @@ class NodeGraph(QtCore.QObject):
             NodeGraphWidget: node graph widget.
         """
         if self._widget is None:
+            self.attach_viewer()
             self._widget = NodeGraphWidget()
             self._widget.addTab(self._viewer, 'Node Graph')
             # hide the close button on the first tab.
@@ -588,7 +651,9 @@ class NodeGraph(QtCore.QObject):
         Returns:
             tuple(float, float): cursor x,y coordinates of the scene.
         """
-        cursor_pos = self.viewer().scene_cursor_pos()
+        if self._viewer is None:
+            return 0.0, 0.0
+        cursor_pos = self._viewer.scene_cursor_pos()
         if not cursor_pos:
             return 0.0, 0.0
         return cursor_pos.x(), cursor_pos.y()
@@ -597,7 +662,7 @@ class NodeGraph(QtCore.QObject):
         """
         toggle the node search widget visibility.
         """
-        if self._viewer.underMouse():
+        if self._viewer and self._viewer.underMouse():
             self._viewer.tab_search_set_nodes(self._node_factory.names)
             self._viewer.tab_search_toggle()
 
@@ -629,7 +694,8 @@ class NodeGraph(QtCore.QObject):
             :class:`PySide6.QtWidgets.QLayout`.
 
         Returns:
-            QtGraphology.widgets.viewer.NodeViewer: viewer interface.
+            QtGraphology.widgets.viewer.NodeViewer: viewer interface or None
+                if the node graph is headless.
         """
         return self._viewer
 
@@ -638,10 +704,72 @@ class NodeGraph(QtCore.QObject):
         Returns the ``QGraphicsScene`` object used in the node graph.
 
         Returns:
-            QtGraphology.widgets.scene.NodeScene: node scene.
+            QtGraphology.widgets.scene.NodeScene: node scene or None if the
+                node graph is headless.
         """
+        if self._viewer is None:
+            return None
         return self._viewer.scene()
 
+    def headless(self) -> bool:
+        """
+        Returns true if the node graph has no viewer.
+
+        A headless node graph is created with ``NodeGraph(headless=True)``
+        the nodes, ports and connections only exist in the node graph model
+        and no ``QGraphicsScene`` or viewer widget is created. The viewer is
+        created when :attr:`NodeGraph.widget` is first accessed or
+        :meth:`NodeGraph.attach_viewer` is called.
+
+        Returns:
+            bool: true if headless.
+        """
+        return self._viewer is None
+
+    def attach_viewer(self, viewer: NodeViewer | None = None) -> NodeViewer:
+        """
+        Create the viewer for a headless node graph and add the existing
+        nodes and connections into its scene.
+
+        Note:
+            With a viewer already in virtualized mode only the node items
+            of the nodes in view are built.
+
+        Args:
+            viewer (NodeViewer): viewer to attach. (optional)
+
+        Returns:
+            QtGraphology.widgets.viewer.NodeViewer: the node graph viewer.
+        """
+        if self._viewer is not None:
+            return self._viewer
+        self._viewer = viewer or NodeViewer(undo_stack=self._undo_stack)
+        self._sync_viewer()
+        self._register_context_menu()
+        self._wire_signals()
+
+        if self._viewer.is_virtualized():
+            # the pipes are drawn as the node items are built.
+            self._viewer.add_virtual_nodes(list(self._model.nodes))
+            return self._viewer
+
+        nodes = list(self._model.nodes.values())
+        if nodes:
+            self._viewer.add_nodes([n.view for n in nodes],
+                                   [n.model.pos for n in nodes])
+            # node width & height is calculated when it's added to the scene.
+            for node in nodes:
+                node.model.width = node.view.width
+                node.model.height = node.view.height
+
+        connections = self._model.connections()
+        if connections:
+            self._viewer.establish_connections(
+                [(in_port.view, out_port.view)
+                 for out_port, in_port in connections]
+            )
+        return self._viewer
+
     def background_color(self):
         """
         Return the node graph background color.
@@ -649,6 +777,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             tuple: r, g ,b
         """
+        if self._viewer is None:
+            return ViewerEnum.BACKGROUND_COLOR.value
         return self.scene().background_color
 
     def set_background_color(self, r, g, b):
@@ -660,6 +790,8 @@ class NodeGraph(QtCore.QObject):
             g (int): green value.
             b (int): blue value.
         """
+        if self._viewer is None:
+            return
         self.scene().background_color = (r, g, b)
         self._viewer.force_update()
 
@@ -670,6 +802,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             tuple: r, g ,b
         """
+        if self._viewer is None:
+            return ViewerEnum.GRID_COLOR.value
         return self.scene().grid_color
 
     def set_grid_color(self, r, g, b):
@@ -681,6 +815,8 @@ class NodeGraph(QtCore.QObject):
             g (int): green value.
             b (int): blue value.
         """
+        if self._viewer is None:
+            return
         self.scene().grid_color = (r, g, b)
         self._viewer.force_update()
 
@@ -709,6 +845,8 @@ class NodeGraph(QtCore.QObject):
         if mode not in display_types:
             mode = ViewerEnum.GRID_DISPLAY_LINES.value
 
+        if self._viewer is None:
+            return
         self.scene().grid_mode = mode
         self._viewer.force_update()
 
@@ -956,6 +1094,8 @@ class NodeGraph(QtCore.QObject):
             disabled (bool): true to enable context menu.
             name (str): menu name. (default: ``"all"``)
         """
+        if self._viewer is None:
+            return
         if name == 'all':
             for k, menu in self._viewer.context_menus().items():
                 menu.setDisabled(disabled)
@@ -989,7 +1129,42 @@ class NodeGraph(QtCore.QObject):
             mode (bool): true to enable acyclic.
         """
         self._model.acyclic = mode
-        self._viewer.acyclic = self._model.acyclic
+        if self._viewer is not None:
+            self._viewer.acyclic = self._model.acyclic
+
+    def virtualized(self):
+        """
+        Returns if the viewer virtualized mode is enabled.
+
+        See Also:
+            :meth:`NodeGraph.set_virtualized`
+
+        Returns:
+            bool: True if virtualized mode is enabled.
+        """
+        if self._viewer is None:
+            return False
+        return self._viewer.is_virtualized()
+
+    def set_virtualized(self, mode=True, margin=None):
+        """
+        Enable/Disable the viewer virtualized mode.
+
+        When enabled only the nodes inside the visible area (plus a margin)
+        have a node item in the scene, the node items of the other nodes are
+        released and built again from the node model as the view pans and
+        zooms. Recommended for very large graphs.
+
+        See Also:
+            :meth:`NodeGraph.virtualized`
+
+        Args:
+            mode (bool): True to enable virtualized mode.
+            margin (float): margin around the visible area as a ratio of
+                its size. (optional)
+        """
+        if self._viewer is not None:
+            self._viewer.set_virtualized(mode, margin)
 
     def pipe_collision(self):
         """
@@ -1018,7 +1193,8 @@ class NodeGraph(QtCore.QObject):
             mode (bool): False to disable pipe collision.
         """
         self._model.pipe_collision = mode
-        self._viewer.pipe_collision = self._model.pipe_collision
+        if self._viewer is not None:
+            self._viewer.pipe_collision = self._model.pipe_collision
 
     def pipe_slicing(self):
         """
@@ -1050,7 +1226,8 @@ class NodeGraph(QtCore.QObject):
             mode (bool): False to disable the slicer pipe.
         """
         self._model.pipe_slicing = mode
-        self._viewer.pipe_slicing = self._model.pipe_slicing
+        if self._viewer is not None:
+            self._viewer.pipe_slicing = self._model.pipe_slicing
 
     def pipe_style(self):
         """
@@ -1088,7 +1265,8 @@ class NodeGraph(QtCore.QObject):
                         PipeLayoutEnum.ANGLE.value])
         style = style if 0 <= style <= pipe_max else PipeLayoutEnum.CURVED.value
         self._model.pipe_style = style
-        self._viewer.set_pipe_layout(style)
+        if self._viewer is not None:
+            self._viewer.set_pipe_layout(style)
 
     def layout_direction(self):
         """
@@ -1134,9 +1312,11 @@ class NodeGraph(QtCore.QObject):
         if direction not in direction_types:
             direction = LayoutDirectionEnum.HORIZONTAL.value
         self._model.layout_direction = direction
-        for node in self.all_nodes():
-            node.set_layout_direction(direction)
-        self._viewer.set_layout_direction(direction)
+        for node in self._model.nodes.values():
+            node.model.layout_direction = direction
+        # the viewer redraws the node items and reroutes the pipes once.
+        if self._viewer is not None:
+            self._viewer.set_layout_direction(direction)
 
     def fit_to_selection(self):
         """
@@ -1144,7 +1324,7 @@ class NodeGraph(QtCore.QObject):
         If no nodes are selected then all nodes in the graph will be framed.
         """
         nodes = self.selected_nodes() or self.all_nodes()
-        if not nodes:
+        if not nodes or self._viewer is None:
             return
         self._viewer.zoom_to_nodes([n.view for n in nodes])
 
@@ -1152,7 +1332,8 @@ class NodeGraph(QtCore.QObject):
         """
         Reset the zoom level
         """
-        self._viewer.reset_zoom()
+        if self._viewer is not None:
+            self._viewer.reset_zoom()
 
     def set_zoom(self: Self, zoom: float=0) -> None:
         """
@@ -1161,7 +1342,8 @@ class NodeGraph(QtCore.QObject):
         Args:
             zoom (float): zoom factor (max zoom out ``-0.9`` / max zoom in ``2.0``)
         """
-        self._viewer.set_zoom(zoom)
+        if self._viewer is not None:
+            self._viewer.set_zoom(zoom)
 
     def get_zoom(self: Self) -> float:
         """
@@ -1170,6 +1352,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             float: the current zoom level.
         """
+        if self._viewer is None:
+            return 0.0
         return self._viewer.get_zoom()
 
     def center_on(self: Self, nodes: list[BaseNode]  = []) -> None:
@@ -1179,12 +1363,15 @@ class NodeGraph(QtCore.QObject):
         Args:
             nodes (list[QtGraphology.BaseNode]): a list of nodes.
         """
-        self._viewer.center_selection([n.view for n in nodes])
+        if self._viewer is not None:
+            self._viewer.center_selection([n.view for n in nodes])
 
     def center_selection(self: Self) -> None:
         """
         Centers on the current selected nodes.
         """
+        if self._viewer is None:
+            return
         nodes: list[AbstractNodeItem] = self._viewer.selected_nodes()
         self._viewer.center_selection(nodes)
         """
@@ -1193,6 +1380,111 @@ class NodeGraph(QtCore.QObject):
         nodes = self._viewer.selected_nodes()
         self._viewer.center_selection(nodes)
 
+    # bulk geometry functions.
+    # --------------------------------------------------------------------------
+
+    def _transform_nodes(self: Self, nodes, text, transform, *args) -> None:
+        """
+        Apply a geometry table transform to the nodes and push a single
+        undo command for the new positions.
+        (used internally by the node graph)
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes.
+            text (str): undo command text.
+            transform (Callable): "NodeGeometryTable" transform method
+                taking the row handles followed by the args.
+        """
+        nodes = [n for n in nodes if n.model.geometry_handle is not None]
+        if not nodes:
+            return
+        geometry = self._model.geometry
+        handles = [n.model.geometry_handle for n in nodes]
+        prev_positions = geometry.positions(handles)
+        transform(handles, *args)
+        positions = geometry.positions(handles)
+        if positions == prev_positions:
+            return
+        self._undo_stack.push(
+            NodesMovedCmd(self, nodes, positions, prev_positions, text)
+        )
+
+    def translate_nodes(self: Self, nodes, dx: float, dy: float) -> None:
+        """
+        Offset the position of multiple nodes.
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes.
+            dx (float): x offset.
+            dy (float): y offset.
+        """
+        self._transform_nodes(nodes, 'translate nodes',
+                              self._model.geometry.translate,
+                              float(dx), float(dy))
+
+    def scale_nodes(self: Self,
+                    nodes,
+                    sx: float,
+                    sy: float | None = None,
+                    origin: tuple[float, float] | None = None) -> None:
+        """
+        Scale the spacing between multiple nodes, the node sizes are
+        left untouched.
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes.
+            sx (float): x scale factor.
+            sy (float): y scale factor. (default: same as sx)
+            origin (tuple(float, float)): scale origin.
+                (default: nodes bounding box center)
+        """
+        sy = sx if sy is None else sy
+        self._transform_nodes(nodes, 'scale nodes',
+                              self._model.geometry.scale,
+                              float(sx), float(sy), origin)
+
+    def align_nodes(self: Self, nodes, edge: NodeAlignEnum) -> None:
+        """
+        Align multiple nodes to an edge of their bounding box.
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes.
+            edge (NodeAlignEnum): alignment edge.
+        """
+        self._transform_nodes(nodes, 'align nodes',
+                              self._model.geometry.align, NodeAlignEnum(edge))
+
+    def distribute_nodes(self: Self, nodes, direction: LayoutDirectionEnum | None = None) -> None:
+        """
+        Space multiple nodes evenly between the first and last node.
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes.
+            direction (LayoutDirectionEnum): horizontal or vertical.
+                (default: the node graph layout direction)
+        """
+        if direction is None:
+            direction = self._model.layout_direction
+        self._transform_nodes(nodes, 'distribute nodes',
+                              self._model.geometry.distribute, direction)
+
+    def nodes_bounding_box(self: Self, nodes=None) -> TRECT | None:
+        """
+        Returns the bounding box of the nodes from the graph model
+        geometry table.
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes. (default: all nodes)
+
+        Returns:
+            tuple(float, float, float, float): x, y, width, height or None.
+        """
+        handles = None
+        if nodes is not None:
+            handles = [n.model.geometry_handle for n in nodes
+                       if n.model.geometry_handle is not None]
+        return self._model.geometry.bounding_box(handles)
+
     def registered_nodes(self):
         """
         Return a list of all node types that have been registered.
@@ -1214,7 +1506,8 @@ class NodeGraph(QtCore.QObject):
             alias (str): custom alias name for the node type.
         """
         self._node_factory.register_node(node, alias)
-        self._viewer.rebuild_tab_search()
+        if self._viewer is not None:
+            self._viewer.rebuild_tab_search()
         self.nodes_registered.emit([node])
 
     def register_nodes(self, nodes):
@@ -1225,7 +1518,8 @@ class NodeGraph(QtCore.QObject):
             nodes (list[QtGraphology.NodeObject]): list of nodes.
         """
         [self._node_factory.register_node(n) for n in nodes]
-        self._viewer.rebuild_tab_search()
+        if self._viewer is not None:
+            self._viewer.rebuild_tab_search()
         self.nodes_registered.emit(nodes)
 
     def create_node(self, node_type, name=None, selected=True, color=None,
@@ -1250,52 +1544,7 @@ class NodeGraph(QtCore.QObject):
         """
         node: NodeObject = self._node_factory.create_node_instance(node_type)
         if node:
-            node._graph = self
-            node.model._graph_model = self.model
-
-            wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
-            prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
-
-            if self.model.get_node_common_properties(node.type_) is None:
-                node_attrs = {node.type_: {
-                    n: {'widget_type': wt} for n, wt in wid_types.items()
-                }}
-                for pname, pattrs in prop_attrs.items():
-                    node_attrs[node.type_][pname].update(pattrs)
-                self.model.set_node_common_properties(node_attrs)
-
-            accept_types = node.model.__dict__.pop(
-                '_TEMP_accept_connection_types'
-            )
-            for ptype, pdata in accept_types.get(node.type_, {}).items():
-                for pname, accept_data in pdata.items():
-                    for accept_ntype, accept_ndata in accept_data.items():
-                        for accept_ptype, accept_pnames in accept_ndata.items():
-                            for accept_pname in accept_pnames:
-                                self._model.add_port_accept_connection_type(
-                                    port_name=pname,
-                                    port_type=ptype,
-                                    node_type=node.type_,
-                                    accept_pname=accept_pname,
-                                    accept_ptype=accept_ptype,
-                                    accept_ntype=accept_ntype
-                                )
-            reject_types = node.model.__dict__.pop(
-                '_TEMP_reject_connection_types'
-            )
-            for ptype, pdata in reject_types.get(node.type_, {}).items():
-                for pname, reject_data in pdata.items():
-                    for reject_ntype, reject_ndata in reject_data.items():
-                        for reject_ptype, reject_pnames in reject_ndata.items():
-                            for reject_pname in reject_pnames:
-                                self._model.add_port_reject_connection_type(
-                                    port_name=pname,
-                                    port_type=ptype,
-                                    node_type=node.type_,
-                                    reject_pname=reject_pname,
-                                    reject_ptype=reject_ptype,
-                                    reject_ntype=reject_ntype
-                                )
+            self._register_node(node)
 
             node.NODE_NAME = self.get_unique_name(name or node.NODE_NAME)
             node.model.name = node.NODE_NAME
@@ -1338,22 +1587,28 @@ class NodeGraph(QtCore.QObject):
 
         raise NodeCreationError(f"Can't find node: {node_type}")
 
-    def add_node(self, node, pos=None, selected=True, push_undo=True):
+    def _register_node(self, node, registered_types=None):
         """
-        Add a node into the node graph.
-        unlike the :meth:`NodeGraph.create_node` function this will not
-        trigger the :attr:`NodeGraph.node_created` signal.
+        Move the temp property attributes and port connection constrains
+        from the node model into the graph model and link the node
+        to this graph.
+        (used internally by the node graph)
 
         Args:
-            node (QtGraphology.BaseNode): node object.
-            pos (list[float]): node x,y position. (optional)
-            selected (bool): node selected state. (optional)
-            push_undo (bool): register the command to the undo stack. (default: True)
+            node (QtGraphology.NodeObject): node object.
+            registered_types (set[str]): node types already registered in the
+                current batch, only the temp data is discarded for these.
         """
-        assert isinstance(node, NodeObject), 'node must be a Node instance.'
+        wid_types, prop_attrs, accept_types, reject_types = \
+            node.model.release_temp_data()
 
-        wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
-        prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
+        node._graph = self
+        node.model._graph_model = self.model
+
+        if registered_types is not None:
+            if node.type_ in registered_types:
+                return
+            registered_types.add(node.type_)
 
         if self.model.get_node_common_properties(node.type_) is None:
             node_attrs = {node.type_: {
@@ -1363,9 +1618,6 @@ class NodeGraph(QtCore.QObject):
                 node_attrs[node.type_][pname].update(pattrs)
             self.model.set_node_common_properties(node_attrs)
 
-        accept_types = node.model.__dict__.pop(
-            '_TEMP_accept_connection_types'
-        )
         for ptype, pdata in accept_types.get(node.type_, {}).items():
             for pname, accept_data in pdata.items():
                 for accept_ntype, accept_ndata in accept_data.items():
@@ -1379,9 +1631,6 @@ class NodeGraph(QtCore.QObject):
                                 accept_ptype=accept_ptype,
                                 accept_ntype=accept_ntype,
                             )
-        reject_types = node.model.__dict__.pop(
-            '_TEMP_reject_connection_types'
-        )
         for ptype, pdata in reject_types.get(node.type_, {}).items():
             for pname, reject_data in pdata.items():
                 for reject_ntype, reject_ndata in reject_data.items():
@@ -1396,9 +1645,22 @@ class NodeGraph(QtCore.QObject):
                                 reject_ntype=reject_ntype,
                             )
 
-        node._graph = self
+    def add_node(self, node, pos=None, selected=True, push_undo=True):
+        """
+        Add a node into the node graph.
+        unlike the :meth:`NodeGraph.create_node` function this will not
+        trigger the :attr:`NodeGraph.node_created` signal.
+
+        Args:
+            node (QtGraphology.BaseNode): node object.
+            pos (list[float]): node x,y position. (optional)
+            selected (bool): node selected state. (optional)
+            push_undo (bool): register the command to the undo stack. (default: True)
+        """
+        assert isinstance(node, NodeObject), 'node must be a Node instance.'
+
+        self._register_node(node)
         node.NODE_NAME = self.get_unique_name(node.NODE_NAME)
-        node.model._graph_model = self.model
         node.model.name = node.NODE_NAME
 
         # initial node direction layout.
@@ -1417,6 +1679,46 @@ class NodeGraph(QtCore.QObject):
         else:
             undo_cmd.redo()
 
+    def add_nodes(self, nodes, positions=None, selected=False, push_undo=True):
+        """
+        Add multiple nodes into the node graph as a single undo command.
+
+        Unlike calling :meth:`NodeGraph.add_node` for every node the common
+        node properties are registered once per node type and the node items
+        are added to the scene with the scene index suspended.
+
+        Args:
+            nodes (list[QtGraphology.BaseNode]): node objects.
+            positions (list[list[float]]): node x,y positions matching the
+                nodes list. (optional)
+            selected (bool): node selected state. (optional)
+            push_undo (bool): register the command to the undo stack. (default: True)
+        """
+        if not nodes:
+            return
+
+        registered_types = set()
+        layout_direction = self.layout_direction()
+        for node in nodes:
+            assert isinstance(node, NodeObject), 'node must be a Node instance.'
+            self._register_node(node, registered_types)
+            node.NODE_NAME = self.get_unique_name(node.NODE_NAME)
+            node.model.name = node.NODE_NAME
+            # reserve the name for the next unique name in the batch.
+            self._model.reserve_node_name(node.id, node.NODE_NAME)
+            node.model.layout_direction = layout_direction
+            if selected:
+                node.model.selected = True
+
+            # update method must be called before it's been added to the viewer.
+            node.update()
+
+        undo_cmd = NodesAddedCmd(self, nodes, positions=positions, emit_signal=False)
+        if push_undo:
+            self._undo_stack.push(undo_cmd)
+        else:
+            undo_cmd.redo()
+
     def delete_node(self, node, push_undo=True):
         """
         Remove the node from the node graph.
@@ -1573,7 +1875,7 @@ class NodeGraph(QtCore.QObject):
                 'Selected nodes cannot be extracted because the following '
                 'ports are locked:\n{}'.format('\n'.join(sorted(locked_ports)))
             )
-            if prompt_warning:
+            if prompt_warning and self._viewer is not None:
                 self._viewer.message_dialog(message, 'Can\'t Extract Nodes')
             return
 
@@ -1601,6 +1903,21 @@ class NodeGraph(QtCore.QObject):
         """
         return list(self._model.nodes.values())
 
+    def topological_order(self):
+        """
+        Return all nodes in the node graph sorted so upstream nodes come
+        before the nodes connected downstream of them.
+
+        Note:
+            connections closing a cycle (with :meth:`NodeGraph.acyclic`
+            disabled) are ignored by the order.
+
+        Returns:
+            list[QtGraphology.BaseNode]: list of nodes.
+        """
+        nodes = self._model.nodes
+        return [nodes[n] for n in self._model.topological_order() if n in nodes]
+
     def selected_nodes(self):
         """
         Return all selected nodes that are in the node graph.
@@ -1608,6 +1925,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             list[QtGraphology.BaseNode]: list of nodes.
         """
+        if self._viewer is None:
+            return [n for n in self._model.nodes.values() if n.model.selected]
         nodes = []
         for item in self._viewer.selected_nodes():
             node = self._model.nodes[item.id]
@@ -1664,11 +1983,10 @@ class NodeGraph(QtCore.QObject):
         Returns:
             QtGraphology.NodeObject: node object.
         """
-        for node_id, node in self._model.nodes.items():
-            if node.name() == name:
-                return node
-
-        return None
+        node_id = self._model.get_node_id_by_name(name)
+        if node_id is None:
+            return None
+        return self._model.nodes.get(node_id)
 
     def get_nodes_by_type(self, node_type):
         """
@@ -1693,25 +2011,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             str: unique node name.
         """
-        name = ' '.join(name.split())
-        node_names = [n.name() for n in self.all_nodes()]
-        if name not in node_names:
-            return name
-
-        regex = re.compile(r'\w+ (\d+)$')
-        search = regex.search(name)
-        if not search:
-            for x in range(1, len(node_names) + 2):
-                new_name = '{} {}'.format(name, x)
-                if new_name not in node_names:
-                    return new_name
-
-        version = search.group(1)
-        name = name[:len(version) * -1].strip()
-        for x in range(1, len(node_names) + 2):
-            new_name = '{} {}'.format(name, x)
-            if new_name not in node_names:
-                return new_name
+        return self._model.unique_node_name(name)
 
     def current_session(self):
         """
@@ -1754,7 +2054,10 @@ class NodeGraph(QtCore.QObject):
         """
         nodes = self.all_nodes()
         for n in nodes:
-            n.view.delete()
+            if n.has_view():
+                n.view.delete()
+            elif self._viewer is not None:
+                self._viewer.remove_virtual_node(n.id)
 
             if not isinstance(n, BaseNode):
                 continue
@@ -1773,72 +2076,217 @@ class NodeGraph(QtCore.QObject):
 
         self._undo_stack.clear()
         self._model = NodeGraphModel()
+        if self._executor is not None:
+            self._executor.clear()
+        if self._viewer is not None:
+            self._viewer.accept_connection_types = self._model.accept_connection_types
+            self._viewer.reject_connection_types = self._model.reject_connection_types
+            self._viewer.topology = self._model.topology
+            self._viewer.graph_nodes = self._model.nodes
 
-    def _serialize(self, nodes) -> TSerializedData:
+    def _hydrate_node(self, n_data, plans):
         """
-        serialize nodes to a dict.
+        Create a node instance from serialized node data.
         (used internally by the node graph)
 
         Args:
-            nodes (list[QtGraphology.Nodes]): list of node instances.
+            n_data (dict): serialized node data.
+            plans (dict): {<node_type>: <NodeHydrationPlan>} plans compiled
+                so far in the session.
 
         Returns:
-            dict: serialized data.
+            QtGraphology.NodeObject: node instance or None.
+        """
+        identifier = n_data['type_']
+        node = self._node_factory.create_node_instance(identifier)
+        if not node:
+            return None
+        node.NODE_NAME = n_data.get('name') or node.NODE_NAME
+        plan = plans.get(identifier)
+        if plan is None:
+            plan = plans[identifier] = NodeHydrationPlan(node.model)
+        # the node widgets are synced from the model by "node.update()"
+        # when the node is added.
+        plan.apply(node.model, n_data)
+        return node
+
+    def _move_deserialized_nodes(self, nodes, pos=None):
+        """
+        Offset the deserialized nodes by the position or move them to the
+        cursor position when there's a viewer.
+        (used internally by the node graph)
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): deserialized nodes.
+            pos (tuple or list): x, y position offset. (optional)
         """
-        serial_data: TSerializedData = {'graph': {}, 'nodes': {}, 'connections': []}
-        nodes_data = {}
+        nodes = [n for n in nodes if n.model.geometry_handle is not None]
+        if not nodes:
+            return
+        geometry = self._model.geometry
+        handles = [n.model.geometry_handle for n in nodes]
+        if self._viewer is None:
+            if pos:
+                geometry.translate(handles, pos[0], pos[1])
+            return
 
-        # serialize graph session.
-        serial_data['graph']['layout_direction'] = self.layout_direction()
-        serial_data['graph']['acyclic'] = self.acyclic()
-        serial_data['graph']['pipe_collision'] = self.pipe_collision()
-        serial_data['graph']['pipe_slicing'] = self.pipe_slicing()
-        serial_data['graph']['pipe_style'] = self.pipe_style()
+        if pos:
+            dx, dy = pos
+        else:
+            # center the nodes on the cursor from the node models, so no
+            # node item is built in virtualized mode.
+            x, y, width, height = geometry.bounding_box(handles)
+            cursor_x, cursor_y = self.cursor_pos()
+            dx = cursor_x - (x + width / 2.0)
+            dy = cursor_y - (y + height / 2.0)
+        prev_positions = geometry.positions(handles)
+        geometry.translate(handles, dx, dy)
+        # sync the built node items and the viewer spatial index.
+        NodesMovedCmd(self, nodes, geometry.positions(handles), prev_positions).redo()
+
+    def _serialize_graph(self) -> dict[str, Any]:
+        """
+        serialize the graph properties to a dict.
+        (used internally by the node graph)
 
-        # connection constrains.
-        serial_data['graph']['accept_connection_types'] = self.model.accept_connection_types
-        serial_data['graph']['reject_connection_types'] = self.model.reject_connection_types
+        Returns:
+            dict: serialized graph properties.
+        """
+        return {
+            'layout_direction': self.layout_direction(),
+            'acyclic': self.acyclic(),
+            'pipe_collision': self.pipe_collision(),
+            'pipe_slicing': self.pipe_slicing(),
+            'pipe_style': self.pipe_style(),
+            # connection constrains.
+            'accept_connection_types': self.model.accept_connection_types,
+            'reject_connection_types': self.model.reject_connection_types,
+        }
 
-        # serialize nodes.
-        for n in nodes:
-            # update the node model.
-            n.update_model()
+    def _serialize_node(self, node) -> tuple[str, dict[str, Any]]:
+        """
+        serialize a node to a dict without its connections.
+        (used internally by the node graph)
 
-            node_dict = n.model.to_dict
-            nodes_data.update(node_dict)
+        Args:
+            node (QtGraphology.NodeObject): node.
 
-        for n_id, n_data in nodes_data.items():
-            serial_data['nodes'][n_id] = n_data
+        Returns:
+            tuple(str, dict): node id, serialized node data.
+        """
+        # update the node model.
+        node.update_model()
+        node_data = node.model.to_dict[node.id]
+        node_data.pop('inputs', None)
+        node_data.pop('outputs', None)
+        return node.id, node_data
+
+    @staticmethod
+    def _iter_connections(nodes):
+        """
+        Yield the connections of the nodes once each, a connection is emitted
+        from its output port side and only from the input port side when the
+        source node isn't one of the serialized nodes.
+        (used internally by the node graph)
 
-            # serialize connections
-            inputs = n_data.pop('inputs') if n_data.get('inputs') else {}
-            outputs = n_data.pop('outputs') if n_data.get('outputs') else {}
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes.
 
-            for pname, conn_data in inputs.items():
-                for conn_id, prt_names in conn_data.items():
+        Yields:
+            tuple(str, str, str, str): out node id, out port name, in node
+                id, in port name.
+        """
+        node_ids = {node.id for node in nodes}
+        for node in nodes:
+            n_id = node.id
+            for pname, port_model in node.model.outputs.items():
+                for conn_id, prt_names in port_model.connected_ports.items():
                     for conn_prt in prt_names:
-                        pipe = {
-                            PortTypeEnum.IN.value: [n_id, pname],
-                            PortTypeEnum.OUT.value: [conn_id, conn_prt]
-                        }
-                        if pipe not in serial_data['connections']:
-                            serial_data['connections'].append(pipe)
-
-            for pname, conn_data in outputs.items():
-                for conn_id, prt_names in conn_data.items():
+                        yield n_id, pname, conn_id, conn_prt
+            for pname, port_model in node.model.inputs.items():
+                for conn_id, prt_names in port_model.connected_ports.items():
+                    if conn_id in node_ids:
+                        continue
                     for conn_prt in prt_names:
-                        pipe = {
-                            PortTypeEnum.OUT.value: [n_id, pname],
-                            PortTypeEnum.IN.value: [conn_id, conn_prt]
-                        }
-                        if pipe not in serial_data['connections']:
-                            serial_data['connections'].append(pipe)
+                        yield conn_id, conn_prt, n_id, pname
+
+    def _serialize(self, nodes) -> TSerializedData:
+        """
+        serialize nodes to a dict.
+        (used internally by the node graph)
 
+        Args:
+            nodes (list[QtGraphology.Nodes]): list of node instances.
+
+        Returns:
+            dict: serialized data.
+        """
+        serial_data: TSerializedData = {
+            'graph': self._serialize_graph(), 'nodes': {}, 'connections': []
+        }
+        nodes_data = serial_data['nodes']
+        for n in nodes:
+            n_id, n_data = self._serialize_node(n)
+            nodes_data[n_id] = n_data
+
+        in_type, out_type = PortTypeEnum.IN.value, PortTypeEnum.OUT.value
+        serial_data['connections'] = [
+            {in_type: [in_id, in_port], out_type: [out_id, out_port]}
+            for out_id, out_port, in_id, in_port in self._iter_connections(nodes)
+        ]
         if not serial_data['connections']:
             serial_data.pop('connections')
 
         return serial_data
 
+    def _iter_serialize_json(self, nodes, indent=2):
+        """
+        Serialize nodes to ``JSON`` text one node and one connection at a
+        time, the output matches ``json.dump`` of :meth:`NodeGraph._serialize`.
+        (used internally by the node graph)
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): list of node instances.
+            indent (int): indentation width.
+
+        Yields:
+            str: ``JSON`` text chunks.
+        """
+        def default(obj):
+            if isinstance(obj, set):
+                return list(obj)
+            return obj
+
+        def dumps(value, level):
+            text = json.dumps(value, indent=indent, separators=(',', ':'),
+                              default=default)
+            return text.replace('\n', '\n' + ' ' * (indent * level))
+
+        pad_1 = '\n' + ' ' * indent
+        pad_2 = '\n' + ' ' * (indent * 2)
+        yield '{' + pad_1 + '"graph":' + dumps(self._serialize_graph(), 1)
+
+        yield ',' + pad_1 + '"nodes":{'
+        separator = ''
+        for n in nodes:
+            n_id, n_data = self._serialize_node(n)
+            yield separator + pad_2 + json.dumps(n_id) + ':' + dumps(n_data, 2)
+            separator = ','
+        yield (pad_1 + '}') if separator else '}'
+
+        in_type, out_type = PortTypeEnum.IN.value, PortTypeEnum.OUT.value
+        separator = None
+        for out_id, out_port, in_id, in_port in self._iter_connections(nodes):
+            if separator is None:
+                yield ',' + pad_1 + '"connections":['
+                separator = ''
+            pipe = {in_type: [in_id, in_port], out_type: [out_id, out_port]}
+            yield separator + pad_2 + dumps(pipe, 2)
+            separator = ','
+        if separator is not None:
+            yield pad_1 + ']'
+        yield '\n}'
+
     def _deserialize(self, data: TSerializedData, relative_pos=False, pos=None):
         """
         deserialize node data.
@@ -1873,32 +2321,37 @@ class NodeGraph(QtCore.QObject):
 
         # build the nodes.
         nodes = {}
+        new_nodes = []
+        plans = {}
         for n_id, n_data in data.get('nodes', {}).items():
-            identifier = n_data['type_']
-            node = self._node_factory.create_node_instance(identifier)
+            node = self._hydrate_node(n_data, plans)
             if node:
-                node.NODE_NAME = n_data.get('name', node.NODE_NAME)
-                # set properties.
-                for prop in node.model.properties.keys():
-                    if prop in n_data.keys():
-                        node.model.set_property(prop, n_data[prop])
-                # set custom properties.
-                for prop, val in n_data.get('custom', {}).items():
-                    node.model.set_property(prop, val)
-                    if isinstance(node, BaseNode):
-                        if prop in node.view.widgets:
-                            node.view.widgets[prop].set_value(val)
-
                 nodes[n_id] = node
-                self.add_node(node, n_data.get('pos'))
+                new_nodes.append((node, n_data))
 
-                if n_data.get('port_deletion_allowed', None):
-                    node.set_ports({
-                        'input_ports': n_data['input_ports'],
-                        'output_ports': n_data['output_ports']
-                    })
+        self.add_nodes([n for n, _ in new_nodes],
+                       [n_data.get('pos') for _, n_data in new_nodes],
+                       selected=True)
+        for node, n_data in new_nodes:
+            if plans[n_data['type_']].needs_ports(n_data):
+                node.set_ports({
+                    'input_ports': n_data['input_ports'],
+                    'output_ports': n_data['output_ports']
+                })
+
+        pos_ = None
+        if relative_pos:
+            pos_ = None
+        elif pos:
+            pos_ = pos
+
+        # position the nodes before the connections so the pipe paths
+        # are only drawn once.
+        self._move_deserialized_nodes(list(nodes.values()), pos_)
 
         # build the connections.
+        connections = []
+        connected_inputs = set()
         for connection in data.get('connections', []):
             nid, pname = connection.get('in', ('', ''))
             in_node = nodes.get(nid) or self.get_node_by_id(nid)
@@ -1918,31 +2371,23 @@ class NodeGraph(QtCore.QObject):
                 # important when duplicating nodes.
                 allow_connection = any(
                     [
-                        not in_port.model.connected_ports,
+                        not in_port.model.connected_ports
+                        and in_port not in connected_inputs,
                         in_port.model.multi_connection,
                     ]
                 )
                 if allow_connection:
-                    self._undo_stack.push(
-                        PortConnectedCmd(in_port, out_port, emit_signal=False)
-                    )
-
-                # Run on_input_connected to ensure connections are fully set up
-                # after deserialization.
-                in_node.on_input_connected(in_port, out_port)
-
-        pos_ = None
-        if relative_pos:
-            pos_ = None
-        elif pos:
-            pos_ = pos
-
-        node_objs = list(nodes.values())
-        self._viewer.move_nodes([n.view for n in node_objs], pos=pos_)
-        for n in node_objs:
-            setattr(n.model, "pos", n.view.xy_pos)
+                    connections.append((in_port, out_port))
+                    connected_inputs.add(in_port)
+
+        # "on_input_connected" is run by the command to ensure connections
+        # are fully set up after deserialization.
+        if connections:
+            self._undo_stack.push(
+                PortsConnectedCmd(self, connections, emit_signal=False)
+            )
 
-        return node_objs
+        return list(nodes.values())
 
     def serialize_session(self):
         """
@@ -1975,9 +2420,10 @@ class NodeGraph(QtCore.QObject):
         self.clear_selection()
         self._undo_stack.clear()
 
-    def save_session(self, file_path):
+    def save_session(self, file_path, binary=None):
         """
-        Saves the current node graph session layout to a `JSON` formatted file.
+        Saves the current node graph session layout to a `JSON` formatted file
+        or a binary session file.
 
         See Also:
             :meth:`NodeGraph.serialize_session`,
@@ -1986,23 +2432,22 @@ class NodeGraph(QtCore.QObject):
 
         Args:
             file_path (str): path to the saved node layout.
+            binary (bool): save as a binary session, if ``None`` binary is
+                used when the file path ends with the ``.qgs`` extension.
         """
-        serialized_data = self._serialize(self.all_nodes())
         file_path = file_path.strip()
 
-        def default(obj):
-            if isinstance(obj, set):
-                return list(obj)
-            return obj
+        if binary is None:
+            binary = file_path.endswith(session.BINARY_SESSION_EXT)
+        if binary:
+            serialized_data = self._serialize(self.all_nodes())
+            with open(file_path, 'wb') as file_out:
+                session.dump_session(serialized_data, file_out)
+            return
 
+        # the JSON session is streamed to the file a node at a time.
         with open(file_path, 'w') as file_out:
-            json.dump(
-                serialized_data,
-                file_out,
-                indent=2,
-                separators=(',', ':'),
-                default=default
-            )
+            file_out.writelines(self._iter_serialize_json(self.all_nodes()))
 
     def load_session(self, file_path):
         """
@@ -2035,8 +2480,12 @@ class NodeGraph(QtCore.QObject):
             raise IOError('file does not exist: {}'.format(file_path))
 
         try:
-            with open(file_path) as data_file:
-                layout_data = json.load(data_file)
+            if session.is_binary_session(file_path):
+                with open(file_path, 'rb') as data_file:
+                    layout_data = session.load_session(data_file)
+            else:
+                with open(file_path) as data_file:
+                    layout_data = json.load(data_file)
         except Exception as e:
             layout_data = None
             print('Cannot read data from file.\n{}'.format(e))
@@ -2209,63 +2658,22 @@ class NodeGraph(QtCore.QObject):
         """
         Set the viewport to use QOpenGLWidget widget to draw the graph.
         """
-        self._viewer.use_OpenGL()
+        if self._viewer is not None:
+            self._viewer.use_OpenGL()
 
     # auto layout node functions.
     # --------------------------------------------------------------------------
 
-    @staticmethod
-    def _update_node_rank(node, nodes_rank, down_stream=True):
-        """
-        Recursive function for updating the node ranking.
-
-        Args:
-            node (QtGraphology.BaseNode): node to start from.
-            nodes_rank (dict): node ranking object to be updated.
-            down_stream (bool): true to rank down stram.
-        """
-        if down_stream:
-            node_values = node.connected_output_nodes().values()
-        else:
-            node_values = node.connected_input_nodes().values()
-
-        connected_nodes = set()
-        for nodes in node_values:
-            connected_nodes.update(nodes)
-
-        rank = nodes_rank[node] + 1
-        for n in connected_nodes:
-            if n in nodes_rank:
-                nodes_rank[n] = max(nodes_rank[n], rank)
-            else:
-                nodes_rank[n] = rank
-            NodeGraph._update_node_rank(n, nodes_rank, down_stream)
-
-    @staticmethod
-    def _compute_node_rank(nodes, down_stream=True):
-        """
-        Compute the ranking of nodes.
-
-        Args:
-            nodes (list[QtGraphology.BaseNode]): nodes to start ranking from.
-            down_stream (bool): true to compute down stream.
-
-        Returns:
-            dict: {QtGraphology.BaseNode: node_rank, ...}
-        """
-        nodes_rank = {}
-        for node in nodes:
-            nodes_rank[node] = 0
-            NodeGraph._update_node_rank(node, nodes_rank, down_stream)
-        return nodes_rank
-
     def auto_layout_nodes(self, nodes=None, down_stream=True, start_nodes=None):
         """
-        Auto layout the nodes in the node graph.
+        Auto layout the nodes in the node graph with a layered layout
+        (see :class:`QtGraphology.base.layout.LayeredLayout`) in the graph
+        layout direction, the nodes stay centered on their current bounding
+        box.
 
         Note:
-            If the node graph is acyclic then the ``start_nodes`` will need
-            to be specified.
+            If the node graph is not acyclic the ``start_nodes`` can be
+            specified to choose where the cycles are broken.
 
         Args:
             nodes (list[QtGraphology.BaseNode]): list of nodes to auto layout
@@ -2274,80 +2682,45 @@ class NodeGraph(QtCore.QObject):
             start_nodes (list[QtGraphology.BaseNode]):
                 list of nodes to start the auto layout from (Optional).
         """
-        self.begin_undo('Auto Layout Nodes')
-
         nodes = nodes or self.all_nodes()
 
         # filter out the backdrops.
         backdrops = {
             n: n.nodes() for n in nodes if isinstance(n, BackdropNode)
         }
-        filtered_nodes = [n for n in nodes if not isinstance(n, BackdropNode)]
-
-        start_nodes = start_nodes or []
-        if down_stream:
-            start_nodes += [
-                n for n in filtered_nodes
-                if not any(n.connected_input_nodes().values())
-            ]
-        else:
-            start_nodes += [
-                n for n in filtered_nodes
-                if not any(n.connected_output_nodes().values())
-            ]
-
-        if not start_nodes:
+        filtered_nodes = [n for n in nodes
+                          if not isinstance(n, BackdropNode) and
+                          n.model.geometry_handle is not None]
+        if not filtered_nodes:
             return
 
-        node_views = [n.view for n in nodes]
-        nodes_center_0 = self.viewer().nodes_rect_center(node_views)
+        geometry = self._model.geometry
+        sizes = {}
+        for node in filtered_nodes:
+            _, _, width, height = geometry.rect(node.model.geometry_handle)
+            sizes[node.id] = (width, height)
+        edges = [(node_id, n_id)
+                 for node_id in sizes
+                 for n_id in self._model.node_successors(node_id)]
+        layout = self._layout_engine.layout(
+            sizes, edges,
+            direction=self._model.layout_direction,
+            down_stream=down_stream,
+            start_nodes=[n.id for n in start_nodes or []]
+        )
 
-        nodes_rank = NodeGraph._compute_node_rank(start_nodes, down_stream)
+        # keep the nodes centered on the previous bounding box.
+        x, y, w, h = self.nodes_bounding_box(filtered_nodes)
+        right = max(px + sizes[n_id][0] for n_id, (px, py) in layout.items())
+        bottom = max(py + sizes[n_id][1] for n_id, (px, py) in layout.items())
+        dx = x + (w - right) / 2
+        dy = y + (h - bottom) / 2
+        positions = [[layout[n.id][0] + dx, layout[n.id][1] + dy]
+                     for n in filtered_nodes]
 
-        rank_map = {}
-        for node, rank in nodes_rank.items():
-            if rank in rank_map:
-                rank_map[rank].append(node)
-            else:
-                rank_map[rank] = [node]
-
-        node_layout_direction = self._viewer.get_layout_direction()
-
-        if node_layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
-            current_x = 0
-            node_height = 120
-            for rank in sorted(range(len(rank_map)), reverse=not down_stream):
-                ranked_nodes = rank_map[rank]
-                max_width = max([node.view.width for node in ranked_nodes])
-                current_x += max_width
-                current_y = 0
-                for idx, node in enumerate(ranked_nodes):
-                    dy = max(node_height, node.view.height)
-                    current_y += 0 if idx == 0 else dy
-                    node.set_pos(current_x, current_y)
-                    current_y += dy * 0.5 + 10
-
-                current_x += max_width * 0.5 + 100
-        elif node_layout_direction is LayoutDirectionEnum.VERTICAL.value:
-            current_y = 0
-            node_width = 250
-            for rank in sorted(range(len(rank_map)), reverse=not down_stream):
-                ranked_nodes = rank_map[rank]
-                max_height = max([node.view.height for node in ranked_nodes])
-                current_y += max_height
-                current_x = 0
-                for idx, node in enumerate(ranked_nodes):
-                    dx = max(node_width, node.view.width)
-                    current_x += 0 if idx == 0 else dx
-                    node.set_pos(current_x, current_y)
-                    current_x += dx * 0.5 + 10
-
-                current_y += max_height * 0.5 + 100
-
-        nodes_center_1 = self.viewer().nodes_rect_center(node_views)
-        dx = nodes_center_0[0] - nodes_center_1[0]
-        dy = nodes_center_0[1] - nodes_center_1[1]
-        [n.set_pos(n.x_pos() + dx, n.y_pos() + dy) for n in nodes]
+        self.begin_undo('Auto Layout Nodes')
+        self._transform_nodes(filtered_nodes, 'auto layout nodes',
+                              geometry.set_positions, positions)
 
         # wrap the backdrop nodes.
         for backdrop, contained_nodes in backdrops.items():
@@ -2355,6 +2728,86 @@ class NodeGraph(QtCore.QObject):
 
         self.end_undo()
 
+    def force_layout_nodes(self, nodes=None, iterations=100, animate=False):
+        """
+        Layout the nodes with a force directed layout
+        (see :class:`QtGraphology.base.layout.ForceDirectedLayout`), works
+        for graphs with cycles and doesn't need start nodes. The nodes
+        start from their current positions and don't overlap afterwards.
+
+        Args:
+            nodes (list[QtGraphology.BaseNode]): nodes to layout.
+                (default: all nodes)
+            iterations (int): simulation steps.
+            animate (bool): run the layout on a worker thread and animate
+                the intermediate positions in the viewer.
+
+        Returns:
+            ForceLayoutWorker: the layout worker when animated else None.
+        """
+        self._stop_layout_worker()
+        nodes = [n for n in nodes or self.all_nodes()
+                 if not isinstance(n, BackdropNode) and
+                 n.model.geometry_handle is not None]
+        if not nodes:
+            return None
+
+        geometry = self._model.geometry
+        sizes, positions = {}, {}
+        for node in nodes:
+            x, y, width, height = geometry.rect(node.model.geometry_handle)
+            sizes[node.id] = (width, height)
+            positions[node.id] = (x, y)
+        edges = [(node_id, n_id)
+                 for node_id in sizes
+                 for n_id in self._model.node_successors(node_id)]
+        layout = ForceDirectedLayout(iterations=iterations)
+
+        if not animate or self._viewer is None:
+            result = layout.layout(sizes, edges, positions)
+            self._transform_nodes(nodes, 'force layout nodes',
+                                  geometry.set_positions,
+                                  [list(result[n.id]) for n in nodes])
+            return None
+
+        thread = QtCore.QThread(self)
+        worker = ForceLayoutWorker(layout, sizes, edges, positions)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+
+        def on_positions_changed(result):
+            # animation frames only move the node items, the model is
+            # updated with a single undo command when the layout finishes.
+            alive = [n for n in nodes if n.model.geometry_handle is not None]
+            self._viewer.set_nodes_pos([n.view for n in alive],
+                                       [list(result[n.id]) for n in alive])
+
+        def on_finished(result):
+            alive = [n for n in nodes if n.model.geometry_handle is not None]
+            self._transform_nodes(alive, 'force layout nodes',
+                                  geometry.set_positions,
+                                  [list(result[n.id]) for n in alive])
+            self._stop_layout_worker()
+
+        worker.positions_changed.connect(on_positions_changed)
+        worker.finished.connect(on_finished)
+        self._layout_worker = (thread, worker)
+        thread.start()
+        return worker
+
+    def _stop_layout_worker(self):
+        """
+        Stop the animated force layout in progress.
+        (used internally by the node graph)
+        """
+        if self._layout_worker is None:
+            return
+        thread, worker = self._layout_worker
+        self._layout_worker = None
+        worker.stop()
+        thread.quit()
+        thread.wait()
+
     # convenience dialog functions.
     # --------------------------------------------------------------------------
 
@@ -2374,6 +2827,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             bool: true if user clicked yes.
         """
+        if self._viewer is None:
+            return False
         return self._viewer.question_dialog(text, title)
 
     def message_dialog(self, text, title='Node Graph'):
@@ -2388,7 +2843,8 @@ class NodeGraph(QtCore.QObject):
             text (str): message text.
             title (str): dialog window title.
         """
-        self._viewer.message_dialog(text, title)
+        if self._viewer is not None:
+            self._viewer.message_dialog(text, title)
 
     def load_dialog(self, current_dir=None, ext=None):
         """
@@ -2405,6 +2861,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             str: selected file path.
         """
+        if self._viewer is None:
+            return None
         return self._viewer.load_dialog(current_dir, ext)
 
     def save_dialog(self, current_dir=None, ext=None):
@@ -2422,6 +2880,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             str: selected file path.
         """
+        if self._viewer is None:
+            return None
         return self._viewer.save_dialog(current_dir, ext)
 
     # group node / sub graph.
@@ -2476,6 +2936,96 @@ class NodeGraph(QtCore.QObject):
     #     """
     #     self._viewer.set_scene_rect(rect)
 
+    def build_sub_graph(self, node):
+        """
+        Build a headless sub graph from a group node session without
+        expanding the group node.
+
+        Args:
+            node (QtGraphology.GroupNode): group node.
+
+        Returns:
+            SubGraph: headless sub graph populated from the group node session.
+        """
+        assert isinstance(node, GroupNode), 'node must be a GroupNode instance.'
+        sub_graph = SubGraph(self,
+                             node=node,
+                             node_factory=self.node_factory,
+                             headless=True,
+                             layout_direction=self.layout_direction(),
+                             pipe_style=self.pipe_style())
+        sub_graph.deserialize_session(node.get_sub_graph_session())
+        return sub_graph
+
+    def executor(self):
+        """
+        Returns the executor used to evaluate the node graph.
+
+        See Also:
+            :meth:`NodeGraph.execute`
+
+        Returns:
+            QtGraphology.base.executor.GraphExecutor: graph executor.
+        """
+        if self._executor is None:
+            self._executor = GraphExecutor(self)
+        return self._executor
+
+    def set_executor(self, executor):
+        """
+        Set the executor used to evaluate the node graph, for example a
+        :class:`QtGraphology.base.scheduler.ParallelGraphExecutor` to run
+        independent branches concurrently or a
+        :class:`QtGraphology.base.async_executor.AsyncGraphExecutor` for
+        asyncio nodes.
+
+        Args:
+            executor (QtGraphology.base.executor.GraphExecutor): graph executor.
+        """
+        if executor.graph is not self:
+            raise ValueError('executor "{}" does not evaluate this graph.'
+                             .format(executor))
+        self._executor = executor
+        self._model.invalidate_all()
+
+    def invalidate_nodes(self, nodes=None):
+        """
+        Mark nodes and the nodes downstream from them as dirty so the next
+        :meth:`NodeGraph.execute` re-evaluates them.
+
+        Note:
+            Custom property changes and port (dis)connections invalidate
+            the nodes automatically, this is for nodes reading external
+            data.
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes. (default: all nodes)
+        """
+        if nodes is None:
+            self._model.invalidate_all()
+            node_ids = list(self._model.nodes)
+        else:
+            node_ids = [node.id for node in nodes]
+            for node_id in node_ids:
+                self._model.invalidate_node(node_id)
+        if node_ids:
+            self.nodes_invalidated.emit(node_ids)
+
+    def execute(self, nodes=None):
+        """
+        Evaluate the nodes in topological order, see :meth:`BaseNode.run`
+        for implementing the node evaluation. The outputs are memoized so
+        only the nodes invalidated since the last execution are evaluated.
+
+        Args:
+            nodes (list[QtGraphology.BaseNode]): nodes to evaluate, the
+                upstream nodes must already be evaluated. (default: all nodes)
+
+        Returns:
+            dict: {<node_id>: {<output_port_name>: <value>}}
+        """
+        return self.executor().execute(nodes)
+
     def expand_group_node(self, node):
         """
         Expands a group node session in a new tab.
@@ -2602,10 +3152,29 @@ class SubGraph(NodeGraph):
         """
         return
 
+    def attach_viewer(self, viewer=None):
+        """
+        Create the viewer for a headless sub graph and add the existing
+        nodes and connections into its scene.
+
+        Args:
+            viewer (NodeViewer): viewer to attach. (optional)
+
+        Returns:
+            QtGraphology.widgets.viewer.NodeViewer: the sub graph viewer.
+        """
+        if self._viewer is not None:
+            return self._viewer
+        viewer = super(SubGraph, self).attach_viewer(viewer)
+        self._clone_context_menu_from_parent()
+        return viewer
+
     def _clone_context_menu_from_parent(self):
         """
         Clone the context menus from the parent node graph.
         """
+        if self._viewer is None or self.parent_graph.viewer() is None:
+            return
         graph_menu = self.get_context_menu('graph')
         parent_menu = self.parent_graph.get_context_menu('graph')
         parent_viewer = self.parent_graph.viewer()
@@ -2652,7 +3221,7 @@ class SubGraph(NodeGraph):
         Returns:
              tuple(dict, dict): input nodes, output nodes.
         """
-        node_layout_direction = self._viewer.get_layout_direction()
+        node_layout_direction = self._model.layout_direction
 
         # build the parent input port nodes.
         input_nodes = {n.name(): n for n in
@@ -2662,7 +3231,7 @@ class SubGraph(NodeGraph):
                 input_node = PortInputNode(parent_port=port)
                 input_node.NODE_NAME = port.name()
                 input_node.model.set_property('name', port.name())
-                input_node.add_output(port.name())
+                input_node.add_output(port.name(), data_type=port.data_type())
                 input_nodes[port.name()] = input_node
                 self.add_node(input_node, selected=False, push_undo=False)
                 x, y = input_node.pos()
@@ -2680,7 +3249,7 @@ class SubGraph(NodeGraph):
                 output_node = PortOutputNode(parent_port=port)
                 output_node.NODE_NAME = port.name()
                 output_node.model.set_property('name', port.name())
-                output_node.add_input(port.name())
+                output_node.add_input(port.name(), data_type=port.data_type())
                 output_nodes[port.name()] = output_node
                 self.add_node(output_node, selected=False, push_undo=False)
                 x, y = output_node.pos()
@@ -2717,6 +3286,8 @@ class SubGraph(NodeGraph):
 
         # build the nodes.
         nodes = {}
+        new_nodes = []
+        plans = {}
         for n_id, n_data in data.get('nodes', {}).items():
             identifier = n_data['type_']
             name = n_data.get('name')
@@ -2729,29 +3300,33 @@ class SubGraph(NodeGraph):
                 nodes[n_id].set_pos(*(n_data.get('pos') or [0, 0]))
                 continue
 
-            node = self._node_factory.create_node_instance(identifier)
+            node = self._hydrate_node(n_data, plans)
             if not node:
                 continue
 
-            node.NODE_NAME = name or node.NODE_NAME
-            # set properties.
-            for prop in node.model.properties.keys():
-                if prop in n_data.keys():
-                    node.model.set_property(prop, n_data[prop])
-            # set custom properties.
-            for prop, val in n_data.get('custom', {}).items():
-                node.model.set_property(prop, val)
-
             nodes[n_id] = node
-            self.add_node(node, n_data.get('pos'))
+            new_nodes.append((node, n_data))
 
-            if n_data.get('port_deletion_allowed', None):
+        self.add_nodes([n for n, _ in new_nodes],
+                       [n_data.get('pos') for _, n_data in new_nodes],
+                       selected=True)
+        for node, n_data in new_nodes:
+            if plans[n_data['type_']].needs_ports(n_data):
                 node.set_ports({
                     'input_ports': n_data['input_ports'],
                     'output_ports': n_data['output_ports']
                 })
 
+        pos_ = None
+        if relative_pos:
+            pos_ = None
+        elif pos:
+            pos_ = pos
+
+        self._move_deserialized_nodes(list(nodes.values()), pos_)
+
         # build the connections.
+        connections = []
         for connection in data.get('connections', []):
             nid, pname = connection.get('in', ('', ''))
             in_node = nodes.get(nid)
@@ -2766,22 +3341,14 @@ class SubGraph(NodeGraph):
             out_port = out_node.outputs().get(pname) if out_node else None
 
             if in_port and out_port:
-                self._undo_stack.push(
-                    PortConnectedCmd(in_port, out_port, emit_signal=False)
-                )
-
-        pos_ = None
-        if relative_pos:
-            pos_ = None
-        elif pos:
-            pos_ = pos
+                connections.append((in_port, out_port))
 
-        node_objs = list(nodes.values())
-        self._viewer.move_nodes([n.view for n in node_objs], pos=pos_)
-        for n in node_objs:
-            setattr(n.model, "pos", n.view.xy_pos)
+        if connections:
+            self._undo_stack.push(
+                PortsConnectedCmd(self, connections, emit_signal=False)
+            )
 
-        return node_objs
+        return list(nodes.values())
 
     def _on_navigation_changed(self, node_id, rm_node_ids):
         """
@@ -2896,6 +3463,31 @@ class SubGraph(NodeGraph):
         """
         return self._parent_graph
 
+    def executor(self):
+        """
+        Returns the executor used to evaluate the sub graph, by default the
+        parent graph executor's sub graph executor so the group node inputs
+        are pulled from the parent graph.
+
+        Returns:
+            QtGraphology.base.executor.GraphExecutor: graph executor.
+        """
+        if self._executor is None and self._parent_graph and self._node:
+            return self._parent_graph.executor().sub_executor(self)
+        return super(SubGraph, self).executor()
+
+    def invalidate_nodes(self, nodes=None):
+        """
+        Mark nodes and the nodes downstream from them as dirty, the parent
+        group node is invalidated in the parent graph too.
+
+        Args:
+            nodes (list[QtGraphology.NodeObject]): nodes. (default: all nodes)
+        """
+        super(SubGraph, self).invalidate_nodes(nodes)
+        if self._parent_graph and self._node:
+            self._parent_graph.invalidate_nodes([self._node])
+
     @property
     def node(self):
         """
@@ -0,0 +1,918 @@
+#!/usr/bin/python
+from __future__ import annotations
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Self
+
+from PySide6 import QtCore
+
+from QtGraphology.constants import TSIZE, LayoutDirectionEnum
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# node count up to which the numpy force layout computes the exact pairwise
+# repulsion, above it the Barnes-Hut quadtree is cheaper.
+_NUMPY_EXACT_REPULSION = 512
+# pairwise distances computed at once by the numpy repulsion.
+_NUMPY_BLOCK_SIZE = 1 << 20
+
+
+def _isotonic_fit(values: Sequence[float]) -> list[float]:
+    """
+    Least squares non decreasing fit of the values (pool adjacent violators).
+
+    Args:
+        values (list[float]): values.
+
+    Returns:
+        list[float]: fitted values.
+    """
+    means: list[float] = []
+    weights: list[int] = []
+    for value in values:
+        weight = 1
+        while means and means[-1] > value:
+            prev_weight = weights.pop()
+            value = (means.pop() * prev_weight + value * weight) / (prev_weight + weight)
+            weight += prev_weight
+        means.append(value)
+        weights.append(weight)
+    fitted: list[float] = []
+    for mean, weight in zip(means, weights):
+        fitted.extend([mean] * weight)
+    return fitted
+
+
+def _median_value(positions: list[int]) -> float:
+    """
+    Weighted median of the neighbor positions (Gansner et al.).
+
+    Args:
+        positions (list[int]): sorted neighbor positions.
+
+    Returns:
+        float: median value.
+    """
+    count = len(positions)
+    middle = count // 2
+    if count % 2:
+        return float(positions[middle])
+    if count == 2:
+        return (positions[0] + positions[1]) / 2.0
+    left = positions[middle - 1] - positions[0]
+    right = positions[-1] - positions[middle]
+    if left + right == 0:
+        return (positions[middle - 1] + positions[middle]) / 2.0
+    return (positions[middle - 1] * right + positions[middle] * left) / (left + right)
+
+
+class LayeredLayout(object):
+    """
+    Sugiyama style layered layout of a directed graph.
+
+    The layout runs in four passes:
+
+    1. cycles are broken by reversing the depth first search back edges.
+    2. nodes are ranked into layers with the longest path from the source
+       nodes (or to the sink nodes when laying out up stream).
+    3. edges spanning several layers are split with dummy nodes and the
+       node order in each layer is reduced for edge crossings with median
+       sweeps, the order with the fewest crossings is kept.
+    4. the layers are spaced by their largest node and the nodes are placed
+       across the layer at the least squares position to their neighbors
+       that keeps the layer order and the node spacing.
+
+    Every pass is iterative so deep graphs don't hit the recursion limit.
+
+    Args:
+        layer_spacing (float): gap between the layers.
+        node_spacing (float): gap between the nodes in a layer.
+        iterations (int): crossing reduction and placement sweeps.
+    """
+
+    def __init__(self: Self,
+                 layer_spacing: float = 100.0,
+                 node_spacing: float = 40.0,
+                 iterations: int = 4) -> None:
+        self.layer_spacing: float = layer_spacing
+        self.node_spacing: float = node_spacing
+        self.iterations: int = iterations
+
+    def __repr__(self: Self) -> str:
+        return '<{}() object at {}>'.format(self.__class__.__name__, hex(id(self)))
+
+    def layout(self: Self,
+               sizes: Mapping[str, TSIZE],
+               edges: Iterable[tuple[str, str]],
+               direction: LayoutDirectionEnum | int = LayoutDirectionEnum.HORIZONTAL.value,
+               down_stream: bool = True,
+               start_nodes: Iterable[str] = ()) -> dict[str, tuple[float, float]]:
+        """
+        Compute the node positions.
+
+        Args:
+            sizes (dict): {<node_id>: (width, height)} nodes to layout.
+            edges (list[tuple(str, str)]): (upstream node id, downstream
+                node id) connections, connections to other nodes are ignored.
+            direction (LayoutDirectionEnum): layers left to right or top
+                to bottom.
+            down_stream (bool): rank the nodes from the source nodes, false
+                to rank them from the sink nodes.
+            start_nodes (list[str]): node ids the cycles are broken from.
+                (optional)
+
+        Returns:
+            dict: {<node_id>: (x, y)} top left node positions starting at 0, 0.
+        """
+        direction = LayoutDirectionEnum(getattr(direction, 'value', direction))
+        node_ids = list(sizes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        count = len(node_ids)
+        if not count:
+            return {}
+
+        successors: list[list[int]] = [[] for _ in range(count)]
+        has_predecessor = [False] * count
+        seen = set()
+        for src, trg in edges:
+            u, v = index.get(src), index.get(trg)
+            if u is None or v is None or u == v or (u, v) in seen:
+                continue
+            seen.add((u, v))
+            successors[u].append(v)
+            has_predecessor[v] = True
+
+        roots = [index[n] for n in start_nodes if n in index]
+        roots += [i for i in range(count) if not has_predecessor[i]]
+        roots += range(count)
+        successors = self._acyclic(successors, roots)
+        ranks = self._rank(successors, down_stream)
+        layers, upper, lower = self._split_long_edges(successors, ranks)
+        self._order(layers, upper, lower)
+
+        horizontal = direction is LayoutDirectionEnum.HORIZONTAL
+        main_size = [0.0] * len(upper)
+        cross_size = [0.0] * len(upper)
+        for i, node_id in enumerate(node_ids):
+            width, height = sizes[node_id]
+            main_size[i], cross_size[i] = (width, height) if horizontal else (height, width)
+        cross = self._place(layers, upper, lower, cross_size)
+
+        layer_pos = []
+        current = 0.0
+        for layer in layers:
+            layer_pos.append(current)
+            current += max(main_size[i] for i in layer) + self.layer_spacing
+
+        lowest = min(cross[i] - cross_size[i] / 2 for i in range(count))
+        positions = {}
+        for rank, layer in enumerate(layers):
+            for i in layer:
+                if i >= count:
+                    continue
+                main = layer_pos[rank]
+                side = cross[i] - cross_size[i] / 2 - lowest
+                positions[node_ids[i]] = (main, side) if horizontal else (side, main)
+        return positions
+
+    @staticmethod
+    def _acyclic(successors: list[list[int]], roots: Iterable[int]) -> list[list[int]]:
+        """
+        Reverse the depth first search back edges so the graph is acyclic.
+
+        Args:
+            successors (list[list[int]]): adjacency list.
+            roots (list[int]): search start nodes in priority order.
+
+        Returns:
+            list[list[int]]: acyclic adjacency list.
+        """
+        count = len(successors)
+        state = [0] * count  # 0: not visited, 1: on the stack, 2: done.
+        back_edges = []
+        for root in roots:
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, iter(successors[root]))]
+            while stack:
+                u, children = stack[-1]
+                for v in children:
+                    if not state[v]:
+                        state[v] = 1
+                        stack.append((v, iter(successors[v])))
+                        break
+                    if state[v] == 1:
+                        back_edges.append((u, v))
+                else:
+                    state[u] = 2
+                    stack.pop()
+        if not back_edges:
+            return successors
+
+        acyclic = [list(children) for children in successors]
+        for u, v in back_edges:
+            acyclic[u].remove(v)
+            if u not in acyclic[v]:
+                acyclic[v].append(u)
+        return acyclic
+
+    @staticmethod
+    def _rank(successors: list[list[int]], down_stream: bool) -> list[int]:
+        """
+        Longest path layering of an acyclic graph.
+
+        Args:
+            successors (list[list[int]]): acyclic adjacency list.
+            down_stream (bool): rank from the source nodes.
+
+        Returns:
+            list[int]: layer index per node.
+        """
+        count = len(successors)
+        in_degree = [0] * count
+        for children in successors:
+            for v in children:
+                in_degree[v] += 1
+        order = [i for i in range(count) if not in_degree[i]]
+        for u in order:
+            for v in successors[u]:
+                in_degree[v] -= 1
+                if not in_degree[v]:
+                    order.append(v)
+
+        ranks = [0] * count
+        if down_stream:
+            for u in order:
+                rank = ranks[u] + 1
+                for v in successors[u]:
+                    if ranks[v] < rank:
+                        ranks[v] = rank
+            return ranks
+
+        # distance to the sinks then flipped so the sinks share the last layer.
+        for u in reversed(order):
+            for v in successors[u]:
+                if ranks[u] <= ranks[v]:
+                    ranks[u] = ranks[v] + 1
+        last = max(ranks)
+        return [last - rank for rank in ranks]
+
+    @staticmethod
+    def _split_long_edges(successors: list[list[int]], ranks: list[int]
+                          ) -> tuple[list[list[int]], list[list[int]], list[list[int]]]:
+        """
+        Insert dummy nodes so all the edges connect adjacent layers.
+
+        Args:
+            successors (list[list[int]]): acyclic adjacency list.
+            ranks (list[int]): layer index per node.
+
+        Returns:
+            tuple: layers (node indices per layer), upper and lower
+                neighbors per node (dummy nodes appended after the nodes).
+        """
+        ranks = list(ranks)
+        upper: list[list[int]] = [[] for _ in ranks]
+        lower: list[list[int]] = [[] for _ in ranks]
+        for u, children in enumerate(successors):
+            for v in children:
+                prev = u
+                for rank in range(ranks[u] + 1, ranks[v]):
+                    dummy = len(ranks)
+                    ranks.append(rank)
+                    upper.append([prev])
+                    lower.append([])
+                    lower[prev].append(dummy)
+                    prev = dummy
+                lower[prev].append(v)
+                upper[v].append(prev)
+
+        layers: list[list[int]] = [[] for _ in range(max(ranks) + 1)]
+        for i, rank in enumerate(ranks):
+            layers[rank].append(i)
+        return layers, upper, lower
+
+    def _order(self: Self,
+               layers: list[list[int]],
+               upper: list[list[int]],
+               lower: list[list[int]]) -> None:
+        """
+        Reorder the layers in place to reduce the edge crossings with
+        alternating down and up median sweeps.
+
+        Args:
+            layers (list[list[int]]): node indices per layer.
+            upper (list[list[int]]): upper layer neighbors per node.
+            lower (list[list[int]]): lower layer neighbors per node.
+        """
+        position = [0] * len(upper)
+
+        def index_layer(layer: list[int]) -> None:
+            for i, node in enumerate(layer):
+                position[node] = i
+
+        def sweep(layer: list[int], neighbors: list[list[int]]) -> None:
+            keys = {}
+            for i, node in enumerate(layer):
+                adjacent = neighbors[node]
+                if adjacent:
+                    keys[node] = (_median_value(sorted(position[n] for n in adjacent)), i)
+                else:
+                    keys[node] = (float(i), i)
+            layer.sort(key=keys.__getitem__)
+            index_layer(layer)
+
+        for layer in layers:
+            index_layer(layer)
+        best = [list(layer) for layer in layers]
+        best_crossings = self._crossings(layers, lower, position)
+        for _ in range(self.iterations):
+            if not best_crossings:
+                break
+            for layer in layers[1:]:
+                sweep(layer, upper)
+            for layer in reversed(layers[:-1]):
+                sweep(layer, lower)
+            crossings = self._crossings(layers, lower, position)
+            if crossings < best_crossings:
+                best_crossings = crossings
+                best = [list(layer) for layer in layers]
+        layers[:] = best
+
+    @staticmethod
+    def _crossings(layers: list[list[int]], lower: list[list[int]], position: list[int]) -> int:
+        """
+        Count the edge crossings between the adjacent layers.
+
+        Args:
+            layers (list[list[int]]): node indices per layer.
+            lower (list[list[int]]): lower layer neighbors per node.
+            position (list[int]): node index in its layer.
+
+        Returns:
+            int: crossing count.
+        """
+        total = 0
+        for rank, layer in enumerate(layers[:-1]):
+            size = len(layers[rank + 1])
+            # lower end positions in upper end order, crossings are the
+            # inversions counted with a fenwick tree.
+            targets = []
+            for node in layer:
+                targets.extend(sorted(position[n] for n in lower[node]))
+            tree = [0] * (size + 1)
+            for seen, target in enumerate(targets):
+                i = target + 1
+                smaller_or_equal = 0
+                while i:
+                    smaller_or_equal += tree[i]
+                    i -= i & -i
+                total += seen - smaller_or_equal
+                i = target + 1
+                while i <= size:
+                    tree[i] += 1
+                    i += i & -i
+        return total
+
+    def _place(self: Self,
+               layers: list[list[int]],
+               upper: list[list[int]],
+               lower: list[list[int]],
+               sizes: list[float]) -> list[float]:
+        """
+        Compute the node centers across the layers.
+
+        Args:
+            layers (list[list[int]]): ordered node indices per layer.
+            upper (list[list[int]]): upper layer neighbors per node.
+            lower (list[list[int]]): lower layer neighbors per node.
+            sizes (list[float]): node size across the layer.
+
+        Returns:
+            list[float]: node center per node.
+        """
+        centers = [0.0] * len(upper)
+        offsets = [0.0] * len(upper)
+        for layer in layers:
+            offset = 0.0
+            prev = None
+            for node in layer:
+                if prev is not None:
+                    offset += (sizes[prev] + sizes[node]) / 2 + self.node_spacing
+                offsets[node] = offset
+                centers[node] = offset
+                prev = node
+
+        def place(layer: list[int], neighbor_lists: tuple[list[list[int]], ...]) -> None:
+            targets = []
+            for node in layer:
+                adjacent = [n for neighbors in neighbor_lists for n in neighbors[node]]
+                if adjacent:
+                    target = sum(centers[n] for n in adjacent) / len(adjacent)
+                else:
+                    target = centers[node]
+                targets.append(target - offsets[node])
+            for node, value in zip(layer, _isotonic_fit(targets)):
+                centers[node] = value + offsets[node]
+
+        for _ in range(self.iterations):
+            for layer in layers[1:]:
+                place(layer, (upper,))
+            for layer in reversed(layers[:-1]):
+                place(layer, (lower,))
+        for layer in layers:
+            place(layer, (upper, lower))
+        return centers
+
+
+class ForceDirectedLayout(object):
+    """
+    Force directed layout (Fruchterman-Reingold) for graphs with cycles.
+
+    Connected nodes attract each other and all the nodes repel each other,
+    the repulsion is approximated with a Barnes-Hut quadtree so an
+    iteration costs O(N log N). The node rectangles are pushed apart once
+    the layout has settled so the nodes don't overlap.
+
+    When numpy is installed the attraction and the position update run as
+    array operations and the repulsion is computed exactly with blocked
+    pairwise distances for up to 512 nodes (the quadtree is still used
+    above that), otherwise the pure python implementation is used.
+
+    Args:
+        iterations (int): simulation steps.
+        spacing (float): minimum gap between the node rectangles.
+        theta (float): Barnes-Hut opening angle, higher is faster and less
+            accurate. (0 for exact repulsion)
+        gravity (float): pull towards the center keeping the disconnected
+            nodes together.
+    """
+
+    def __init__(self: Self,
+                 iterations: int = 100,
+                 spacing: float = 40.0,
+                 theta: float = 1.2,
+                 gravity: float = 0.05) -> None:
+        self.iterations: int = iterations
+        self.spacing: float = spacing
+        self.theta: float = theta
+        self.gravity: float = gravity
+
+    def __repr__(self: Self) -> str:
+        return '<{}() object at {}>'.format(self.__class__.__name__, hex(id(self)))
+
+    def layout(self: Self,
+               sizes: Mapping[str, TSIZE],
+               edges: Iterable[tuple[str, str]],
+               positions: Mapping[str, Sequence[float]] | None = None
+               ) -> dict[str, tuple[float, float]]:
+        """
+        Compute the node positions.
+
+        Args:
+            sizes (dict): {<node_id>: (width, height)} nodes to layout.
+            edges (list[tuple(str, str)]): connected node ids, connections
+                to other nodes are ignored.
+            positions (dict): {<node_id>: (x, y)} start top left positions.
+                (default: nodes spread on a grid)
+
+        Returns:
+            dict: {<node_id>: (x, y)} top left node positions.
+        """
+        result = {}
+        for result in self.iterate(sizes, edges, positions):
+            pass
+        return result
+
+    def iterate(self: Self,
+                sizes: Mapping[str, TSIZE],
+                edges: Iterable[tuple[str, str]],
+                positions: Mapping[str, Sequence[float]] | None = None,
+                frame: int = 0) -> Iterator[dict[str, tuple[float, float]]]:
+        """
+        Run the simulation step by step.
+
+        Args:
+            sizes (dict): {<node_id>: (width, height)} nodes to layout.
+            edges (list[tuple(str, str)]): connected node ids.
+            positions (dict): {<node_id>: (x, y)} start top left positions.
+                (default: nodes spread on a grid)
+            frame (int): yield the intermediate positions every n steps.
+                (0 to only yield the final positions)
+
+        Yields:
+            dict: {<node_id>: (x, y)} top left node positions, the last
+                one has the overlaps removed.
+        """
+        node_ids = list(sizes)
+        count = len(node_ids)
+        if not count:
+            yield {}
+            return
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        widths = array('d', (sizes[n][0] for n in node_ids))
+        heights = array('d', (sizes[n][1] for n in node_ids))
+        links = set()
+        for src, trg in edges:
+            u, v = index.get(src), index.get(trg)
+            if u is not None and v is not None and u != v:
+                links.add((min(u, v), max(u, v)))
+        links = list(links)
+
+        # ideal edge length from the average node size.
+        k = sum(max(w, h) for w, h in zip(widths, heights)) / count + self.spacing
+        xs, ys = self._start_positions(node_ids, widths, heights, positions, k)
+
+        def snapshot() -> dict[str, tuple[float, float]]:
+            return {node_id: (xs[i] - widths[i] / 2, ys[i] - heights[i] / 2)
+                    for i, node_id in enumerate(node_ids)}
+
+        left, top = min(xs), min(ys)
+        temperature = max(max(xs) - left, max(ys) - top, k) / 10.0
+        cooling = temperature / (self.iterations + 1)
+        dx = array('d', bytes(8 * count))
+        dy = array('d', bytes(8 * count))
+        if numpy is not None:
+            step_func = self._step_numpy
+            links = (numpy.array([u for u, _ in links], dtype=numpy.intp),
+                     numpy.array([v for _, v in links], dtype=numpy.intp))
+        else:
+            step_func = self._step
+        for step in range(self.iterations):
+            step_func(xs, ys, dx, dy, links, k, temperature)
+            temperature -= cooling
+            if frame and (step + 1) % frame == 0:
+                yield snapshot()
+
+        self._remove_overlaps(xs, ys, widths, heights)
+        yield snapshot()
+
+    def _step(self: Self,
+              xs: array,
+              ys: array,
+              dx: array,
+              dy: array,
+              links: list[tuple[int, int]],
+              k: float,
+              temperature: float) -> None:
+        """
+        Move the nodes one simulation step.
+
+        Args:
+            xs (array): x centers.
+            ys (array): y centers.
+            dx (array): x displacement accumulator.
+            dy (array): y displacement accumulator.
+            links (list[tuple(int, int)]): connected node indices.
+            k (float): ideal edge length.
+            temperature (float): maximum displacement.
+        """
+        count = len(xs)
+        self._repulse(xs, ys, dx, dy, k * k)
+        for u, v in links:
+            ddx, ddy = xs[u] - xs[v], ys[u] - ys[v]
+            dist = max(math.hypot(ddx, ddy), 0.01)
+            force = dist / k
+            ddx, ddy = ddx * force, ddy * force
+            dx[u] -= ddx
+            dy[u] -= ddy
+            dx[v] += ddx
+            dy[v] += ddy
+
+        cx, cy = sum(xs) / count, sum(ys) / count
+        for i in range(count):
+            fx = dx[i] - self.gravity * (xs[i] - cx)
+            fy = dy[i] - self.gravity * (ys[i] - cy)
+            length = math.hypot(fx, fy)
+            if length > temperature:
+                fx, fy = fx / length * temperature, fy / length * temperature
+            xs[i] += fx
+            ys[i] += fy
+            dx[i] = dy[i] = 0.0
+
+    def _step_numpy(self: Self,
+                    xs: array,
+                    ys: array,
+                    dx: array,
+                    dy: array,
+                    links: tuple[numpy.ndarray, numpy.ndarray],
+                    k: float,
+                    temperature: float) -> None:
+        """
+        Move the nodes one simulation step with numpy, the arrays are
+        updated in place through numpy views.
+
+        Args:
+            xs (array): x centers.
+            ys (array): y centers.
+            dx (array): x displacement accumulator.
+            dy (array): y displacement accumulator.
+            links (tuple(numpy.ndarray, numpy.ndarray)): connected node
+                indices.
+            k (float): ideal edge length.
+            temperature (float): maximum displacement.
+        """
+        count = len(xs)
+        x = numpy.frombuffer(xs, dtype=numpy.float64)
+        y = numpy.frombuffer(ys, dtype=numpy.float64)
+        fx = numpy.frombuffer(dx, dtype=numpy.float64)
+        fy = numpy.frombuffer(dy, dtype=numpy.float64)
+        if count <= _NUMPY_EXACT_REPULSION:
+            self._repulse_numpy(x, y, fx, fy, k * k)
+        else:
+            self._repulse(xs, ys, dx, dy, k * k)
+
+        u, v = links
+        if len(u):
+            ddx, ddy = x[u] - x[v], y[u] - y[v]
+            force = numpy.maximum(numpy.hypot(ddx, ddy), 0.01) / k
+            ddx *= force
+            ddy *= force
+            fx -= numpy.bincount(u, ddx, count)
+            fy -= numpy.bincount(u, ddy, count)
+            fx += numpy.bincount(v, ddx, count)
+            fy += numpy.bincount(v, ddy, count)
+
+        fx -= self.gravity * (x - x.mean())
+        fy -= self.gravity * (y - y.mean())
+        length = numpy.hypot(fx, fy)
+        scale = numpy.minimum(1.0, temperature / numpy.maximum(length, 1e-12))
+        x += fx * scale
+        y += fy * scale
+        fx[:] = 0.0
+        fy[:] = 0.0
+
+    @staticmethod
+    def _repulse_numpy(x: numpy.ndarray,
+                       y: numpy.ndarray,
+                       fx: numpy.ndarray,
+                       fy: numpy.ndarray,
+                       k2: float) -> None:
+        """
+        Accumulate the exact repulsion between all the nodes (k² / distance)
+        a block of rows at a time.
+
+        Args:
+            x (numpy.ndarray): x centers.
+            y (numpy.ndarray): y centers.
+            fx (numpy.ndarray): x displacement accumulator.
+            fy (numpy.ndarray): y displacement accumulator.
+            k2 (float): squared ideal edge length.
+        """
+        count = len(x)
+        indices = numpy.arange(count)
+        # fixed push apart direction of the coincident nodes.
+        push_x = 0.01 * (indices % 7 - 3)
+        push_y = 0.01 * (indices % 5 - 2)
+        rows = max(_NUMPY_BLOCK_SIZE // count, 1)
+        for start in range(0, count, rows):
+            stop = min(start + rows, count)
+            ddx = x[start:stop, None] - x[None, :]
+            ddy = y[start:stop, None] - y[None, :]
+            dist2 = ddx * ddx + ddy * ddy
+            near = dist2 < 1e-4
+            if near.any():
+                ddx = numpy.where(near, push_x[start:stop, None], ddx)
+                ddy = numpy.where(near, push_y[start:stop, None], ddy)
+                dist2 = numpy.where(near, 1e-4, dist2)
+            force = k2 / dist2
+            # no force of a node on itself.
+            force[indices[:stop - start], indices[start:stop]] = 0.0
+            fx[start:stop] += (ddx * force).sum(axis=1)
+            fy[start:stop] += (ddy * force).sum(axis=1)
+
+    @staticmethod
+    def _start_positions(node_ids: list[str],
+                         widths: array,
+                         heights: array,
+                         positions: Mapping[str, Sequence[float]] | None,
+                         k: float) -> tuple[array, array]:
+        """
+        Node center start positions, the current positions when they're
+        spread out otherwise a grid.
+
+        Returns:
+            tuple(array, array): x and y centers.
+        """
+        count = len(node_ids)
+        if positions:
+            xs = array('d', (positions[n][0] + widths[i] / 2 for i, n in enumerate(node_ids)))
+            ys = array('d', (positions[n][1] + heights[i] / 2 for i, n in enumerate(node_ids)))
+            if len(set(zip(xs, ys))) == count:
+                return xs, ys
+        columns = max(int(math.sqrt(count)), 1)
+        xs = array('d', ((i % columns) * k for i in range(count)))
+        ys = array('d', ((i // columns) * k for i in range(count)))
+        return xs, ys
+
+    def _repulse(self: Self, xs: array, ys: array, dx: array, dy: array, k2: float) -> None:
+        """
+        Accumulate the repulsion between all the nodes with a Barnes-Hut
+        quadtree (k² / distance).
+
+        Args:
+            xs (array): x centers.
+            ys (array): y centers.
+            dx (array): x displacement accumulator.
+            dy (array): y displacement accumulator.
+            k2 (float): squared ideal edge length.
+        """
+        count = len(xs)
+        left, top = min(xs), min(ys)
+        size = max(max(xs) - left, max(ys) - top, 1.0) * 1.0001
+
+        # flat quadtree cells: square origin and size, mass, mass weighted
+        # position sums, first child cell index (-1 for a leaf) and the leaf
+        # body index (-1 for an empty leaf).
+        cell_x, cell_y, cell_size = [left], [top], [size]
+        mass, mass_x, mass_y = [0], [0.0], [0.0]
+        child, body = [-1], [-1]
+
+        def subdivide(cell: int) -> None:
+            half = cell_size[cell] / 2
+            child[cell] = len(cell_x)
+            for qx, qy in ((0, 0), (1, 0), (0, 1), (1, 1)):
+                cell_x.append(cell_x[cell] + qx * half)
+                cell_y.append(cell_y[cell] + qy * half)
+                cell_size.append(half)
+                mass.append(0)
+                mass_x.append(0.0)
+                mass_y.append(0.0)
+                child.append(-1)
+                body.append(-1)
+
+        def quadrant(cell: int, x: float, y: float) -> int:
+            half = cell_size[cell] / 2
+            return (child[cell] +
+                    (x >= cell_x[cell] + half) +
+                    2 * (y >= cell_y[cell] + half))
+
+        for i in range(count):
+            x, y = xs[i], ys[i]
+            cell = 0
+            while True:
+                if child[cell] >= 0:
+                    mass[cell] += 1
+                    mass_x[cell] += x
+                    mass_y[cell] += y
+                    cell = quadrant(cell, x, y)
+                    continue
+                if not mass[cell] or cell_size[cell] < 0.01:
+                    # empty leaf or coincident nodes sharing a leaf.
+                    if not mass[cell]:
+                        body[cell] = i
+                    mass[cell] += 1
+                    mass_x[cell] += x
+                    mass_y[cell] += y
+                    break
+                # split the leaf and push its body down.
+                other = body[cell]
+                body[cell] = -1
+                subdivide(cell)
+                sub = quadrant(cell, xs[other], ys[other])
+                body[sub] = other
+                mass[sub] = 1
+                mass_x[sub] = xs[other]
+                mass_y[sub] = ys[other]
+
+        # per cell center of mass, non empty children and the squared
+        # distance below which the cell is opened (never for leaves).
+        theta2 = max(self.theta * self.theta, 1e-9)
+        cells = range(len(cell_x))
+        com_x = [mass_x[c] / mass[c] if mass[c] else 0.0 for c in cells]
+        com_y = [mass_y[c] / mass[c] if mass[c] else 0.0 for c in cells]
+        kids = [() if child[c] < 0 else
+                tuple(n for n in range(child[c], child[c] + 4) if mass[n])
+                for c in cells]
+        open_dist2 = [-1.0 if child[c] < 0 else cell_size[c] ** 2 / theta2
+                      for c in cells]
+
+        for i in range(count):
+            x, y = xs[i], ys[i]
+            fx = fy = 0.0
+            stack = [0]
+            pop, extend = stack.pop, stack.extend
+            while stack:
+                cell = pop()
+                ddx = x - com_x[cell]
+                ddy = y - com_y[cell]
+                dist2 = ddx * ddx + ddy * ddy
+                if open_dist2[cell] < dist2:
+                    m = mass[cell]
+                    if body[cell] == i:
+                        m -= 1
+                        if not m:
+                            continue
+                    if dist2 < 1e-4:
+                        # coincident nodes, push apart in a fixed direction.
+                        ddx, ddy, dist2 = 0.01 * (i % 7 - 3), 0.01 * (i % 5 - 2), 1e-4
+                    force = k2 * m / dist2
+                    fx += ddx * force
+                    fy += ddy * force
+                else:
+                    extend(kids[cell])
+            dx[i] += fx
+            dy[i] += fy
+
+    def _remove_overlaps(self: Self, xs: array, ys: array, widths: array, heights: array) -> None:
+        """
+        Push the overlapping node rectangles apart along the axis with the
+        least overlap, the overlapping pairs are found with a grid of the
+        largest node size.
+
+        Args:
+            xs (array): x centers.
+            ys (array): y centers.
+            widths (array): node widths.
+            heights (array): node heights.
+        """
+        count = len(xs)
+        gap = self.spacing / 2
+        cell_w = max(widths) + gap
+        cell_h = max(heights) + gap
+        for _ in range(50):
+            grid: dict[tuple[int, int], list[int]] = {}
+            for i in range(count):
+                grid.setdefault((int(xs[i] // cell_w), int(ys[i] // cell_h)), []).append(i)
+            moved = False
+            for (gx, gy), cell in grid.items():
+                neighbors = [j for ox in (-1, 0, 1) for oy in (-1, 0, 1)
+                             for j in grid.get((gx + ox, gy + oy), ())]
+                for i in cell:
+                    for j in neighbors:
+                        if j <= i:
+                            continue
+                        overlap_x = (widths[i] + widths[j]) / 2 + gap - abs(xs[j] - xs[i])
+                        if overlap_x <= 0:
+                            continue
+                        overlap_y = (heights[i] + heights[j]) / 2 + gap - abs(ys[j] - ys[i])
+                        if overlap_y <= 0:
+                            continue
+                        moved = True
+                        if overlap_x < overlap_y:
+                            shift = overlap_x / 2 if xs[j] >= xs[i] else -overlap_x / 2
+                            xs[i] -= shift
+                            xs[j] += shift
+                        else:
+                            shift = overlap_y / 2 if ys[j] >= ys[i] else -overlap_y / 2
+                            ys[i] -= shift
+                            ys[j] += shift
+            if not moved:
+                break
+
+
+class ForceLayoutWorker(QtCore.QObject):
+    """
+    Runs a :class:`ForceDirectedLayout` step by step, moved to a worker
+    thread so the intermediate positions can be animated in the viewer.
+
+    Args:
+        layout (ForceDirectedLayout): layout.
+        sizes (dict): {<node_id>: (width, height)} nodes to layout.
+        edges (list[tuple(str, str)]): connected node ids.
+        positions (dict): {<node_id>: (x, y)} start top left positions.
+        frame (int): emit the intermediate positions every n steps.
+    """
+
+    #: emits the intermediate {<node_id>: (x, y)} positions.
+    positions_changed: QtCore.Signal = QtCore.Signal(object)
+    #: emits the final {<node_id>: (x, y)} positions.
+    finished: QtCore.Signal = QtCore.Signal(object)
+
+    def __init__(self: Self,
+                 layout: ForceDirectedLayout,
+                 sizes: Mapping[str, TSIZE],
+                 edges: Iterable[tuple[str, str]],
+                 positions: Mapping[str, Sequence[float]] | None = None,
+                 frame: int = 5) -> None:
+        super(ForceLayoutWorker, self).__init__()
+        self._layout: ForceDirectedLayout = layout
+        self._sizes: Mapping[str, TSIZE] = sizes
+        self._edges: list[tuple[str, str]] = list(edges)
+        self._positions: Mapping[str, Sequence[float]] | None = positions
+        self._frame: int = frame
+        self._stopped: bool = False
+
+    def stop(self: Self) -> None:
+        """
+        Stop the layout, the finished signal isn't emitted.
+        """
+        self._stopped = True
+
+    def run(self: Self) -> None:
+        """
+        Run the layout emitting the intermediate positions.
+        """
+        iterations = self._layout.iterate(
+            self._sizes, self._edges, self._positions, self._frame)
+        positions = {}
+        for positions in iterations:
+            if self._stopped:
+                return
+            self.positions_changed.emit(positions)
+        self.finished.emit(positions)
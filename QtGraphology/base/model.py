@@ -1,15 +1,51 @@
 #!/usr/bin/python
 from __future__ import annotations
-from typing import Self, Any
+from typing import TYPE_CHECKING, Self, Any
 
+import copy
+import itertools
 import json
-from collections import defaultdict
+import re
+import uuid
+from array import array
+from collections import Counter
 
 from QtGraphology import BaseNode
 from QtGraphology.base.node import NodeObject
-from ..constants import TCOLOR, LayoutDirectionEnum, NodePropWidgetEnum, PipeLayoutEnum
+from QtGraphology.base.geometry import NodeGeometryTable
+from QtGraphology.base.topology import TopologicalOrder
+from ..constants import TCOLOR, LayoutDirectionEnum, NodePropWidgetEnum, PipeLayoutEnum, PortTypeEnum
 from QtGraphology.errors import NodePropertyError
 
+if TYPE_CHECKING:
+    from QtGraphology.base.port import Port
+
+# matches the trailing version number of a node name e.g. "foo node 3"
+_NAME_SUFFIX_REGEX = re.compile(r'\w+ (\d+)$')
+
+# connections added or removed since the connection index was built
+# before it's rebuilt. (or the number of indexed connections if larger)
+_EDGE_INDEX_SLACK = 1024
+
+# node and port handles pack the table slot in the low bits and the slot
+# generation in the high bits, a released slot is reused with the next
+# generation so a stale handle doesn't resolve to the new occupant.
+_HANDLE_SLOT_BITS = 32
+_HANDLE_SLOT_MASK = (1 << _HANDLE_SLOT_BITS) - 1
+
+
+def new_node_id() -> str:
+    """
+    Returns a new node id, unlike ``hex(id(model))`` or a process counter
+    the id is unique across processes so serialized connections to nodes
+    outside the pasted or imported data never resolve to a local node.
+    (the integer handles stay internal to the graph model)
+
+    Returns:
+        str: new unique node id string.
+    """
+    return uuid.uuid4().hex
+
 
 class PortModel(object):
     """
@@ -24,12 +60,27 @@ class PortModel(object):
         self.multi_connection: bool = False
         self.visible: bool = True
         self.locked: bool = False
-        self.connected_ports: defaultdict[str, list] = defaultdict(list)
+        self.data_type: type | tuple[type, ...] | None = None
+        # graph model port handle (None when the node isn't in a graph).
+        self.handle: int | None = None
 
     def __repr__(self: Self) -> str:
         return '<{}(\'{}\') object at {}>'.format(
             self.__class__.__name__, self.name, hex(id(self)))
 
+    @property
+    def connected_ports(self: Self) -> dict[str, list[str]]:
+        """
+        Returns the connected ports from the graph model connection table.
+
+        Returns:
+            dict: {<node_id>: [<port_name>, <port_name>]} in connection order.
+        """
+        graph = self.node.graph if self.node is not None else None
+        if graph is None or self.handle is None:
+            return {}
+        return graph.model.port_connections(self)
+
     @property
     def to_dict(self: Self) -> dict[str, Any]:
         """
@@ -49,17 +100,136 @@ class PortModel(object):
         """
         props: dict[str, Any] = self.__dict__.copy()
         props.pop('node')
-        props['connected_ports'] = dict(props.pop('connected_ports'))
+        props.pop('data_type')
+        props.pop('handle')
+        props['connected_ports'] = self.connected_ports
         return props
 
+class NodePropertySchema(object):
+    """
+    Compiled layout of the custom properties on a node model.
+
+    Schemas are immutable and interned, node models that add the same
+    custom properties in the same order (every instance of a node type)
+    share the same schema objects. The schema maps a property name to an
+    index into the plain value list stored on the model.
+
+    Args:
+        names (tuple[str]): custom property names in storage order.
+    """
+
+    __slots__ = ('names', 'index', '_extended')
+
+    def __init__(self: Self, names: tuple[str, ...] = ()) -> None:
+        self.names: tuple[str, ...] = names
+        self.index: dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._extended: dict[str, NodePropertySchema] = {}
+
+    def __repr__(self: Self) -> str:
+        return '<{}({}) object at {}>'.format(
+            self.__class__.__name__, len(self.names), hex(id(self)))
+
+    def extend(self: Self, name: str) -> NodePropertySchema:
+        """
+        Returns the shared schema with a custom property appended.
+
+        Args:
+            name (str): property name.
+
+        Returns:
+            NodePropertySchema: extended schema.
+        """
+        schema = self._extended.get(name)
+        if schema is None:
+            schema = NodePropertySchema(self.names + (name,))
+            self._extended[name] = schema
+        return schema
+
+
+_EMPTY_SCHEMA = NodePropertySchema()
+
+# built-in node model properties (in serialization order).
+BUILTIN_NODE_PROPERTIES: tuple[str, ...] = (
+    'type_',
+    'id',
+    'icon',
+    'name',
+    'color',
+    'border_color',
+    'text_color',
+    'disabled',
+    'selected',
+    'visible',
+    'width',
+    'height',
+    'pos',
+    'layout_direction',
+    'inputs',
+    'outputs',
+    'port_deletion_allowed',
+    'subgraph_session',
+)
+_BUILTIN_NODE_PROPERTIES = frozenset(BUILTIN_NODE_PROPERTIES)
+
+# built-in properties stored in the graph model geometry table.
+_GEOMETRY_NODE_PROPERTIES = frozenset(('pos', 'width', 'height'))
+
+# built-in properties that only change how a node is drawn, editing them
+# doesn't invalidate the executor outputs of the node.
+_DISPLAY_NODE_PROPERTIES = frozenset((
+    'icon',
+    'color',
+    'border_color',
+    'text_color',
+    'selected',
+    'visible',
+    'width',
+    'height',
+    'pos',
+    'layout_direction',
+))
+
+# built-in properties shared as is by "NodeModel.clone" (immutable values).
+_CLONED_NODE_PROPERTIES: tuple[str, ...] = tuple(
+    name for name in BUILTIN_NODE_PROPERTIES
+    if name not in _GEOMETRY_NODE_PROPERTIES and name not in (
+        'id', 'inputs', 'outputs', 'subgraph_session')
+)
+
+# built-in properties written as is by "NodeModel.to_dict".
+_SERIAL_NODE_PROPERTIES: tuple[str, ...] = tuple(
+    name for name in BUILTIN_NODE_PROPERTIES
+    if name not in ('id', 'inputs', 'outputs', 'subgraph_session')
+)
+
+
 class NodeModel(object):
     """
     Data dump for a node object.
     """
 
+    __slots__ = tuple(
+        name for name in BUILTIN_NODE_PROPERTIES
+        if name not in _GEOMETRY_NODE_PROPERTIES
+    ) + (
+        '_pos',
+        '_width',
+        '_height',
+        '_geometry',
+        '_geometry_handle',
+        'handle',
+        '_schema',
+        '_custom_values',
+        '_graph_model',
+        '_TEMP_property_attrs',
+        '_TEMP_property_widget_types',
+        '_TEMP_accept_connection_types',
+        '_TEMP_reject_connection_types',
+    )
+
     def __init__(self: Self) -> None:
         self.type_: str = ''
-        self.id: str = hex(id(self))
+        self.id: str = new_node_id()
         self.icon: str = ''
         self.name: str = 'node'
         self.color: TCOLOR = (13, 18, 23, 255)
@@ -68,9 +238,18 @@ class NodeModel(object):
         self.disabled: bool = False
         self.selected: bool = False
         self.visible: bool = True
-        self.width: float = 100.0
-        self.height: float = 80.0
-        self.pos: list[float] = [0.0, 0.0]
+
+        # position and size, stored in the graph model geometry table
+        # while the node is added to a graph.
+        self._geometry: NodeGeometryTable | None = None
+        self._geometry_handle: int | None = None
+        self._width: float = 100.0
+        self._height: float = 80.0
+        self._pos: list[float] = [0.0, 0.0]
+
+        # graph model node handle (None when the node isn't in a graph).
+        self.handle: int | None = None
+
         self.layout_direction: LayoutDirectionEnum = LayoutDirectionEnum.HORIZONTAL
 
         # BaseNode attrs.
@@ -81,19 +260,21 @@ class NodeModel(object):
         # GroupNode attrs.
         self.subgraph_session: dict[str, Any] = {}
 
-        # Custom
-        self._custom_prop: dict[str,Any] = {}
+        # Custom properties, the shared schema maps the property names
+        # to indices in the value list.
+        self._schema: NodePropertySchema = _EMPTY_SCHEMA
+        self._custom_values: list[Any] = []
 
         # node graph model set at node added time.
         self._graph_model: NodeGraphModel | None = None
 
         # store the property attributes.
-        # (deleted when node is added to the graph)
-        self._TEMP_property_attrs: dict[str,Any] = {}
+        # (released when node is added to the graph)
+        self._TEMP_property_attrs: dict[str,Any] | None = {}
 
         # temps store the property widget types.
-        # (deleted when node is added to the graph)
-        self._TEMP_property_widget_types: dict[str, Any] = {
+        # (released when node is added to the graph)
+        self._TEMP_property_widget_types: dict[str, Any] | None = {
             'type_': NodePropWidgetEnum.QLABEL.value,
             'id': NodePropWidgetEnum.QLABEL.value,
             'icon': NodePropWidgetEnum.HIDDEN.value,
@@ -112,14 +293,95 @@ class NodeModel(object):
         }
 
         # temp store connection constrains.
-        # (deleted when node is added to the graph)
+        # (released when node is added to the graph)
         # OGQ-1: refer to NodeGraph.add_node for the temp key pop
-        self._TEMP_accept_connection_types: dict[str, Any] = {}
-        self._TEMP_reject_connection_types: dict[str, Any] = {}
+        self._TEMP_accept_connection_types: dict[str, Any] | None = {}
+        self._TEMP_reject_connection_types: dict[str, Any] | None = {}
 
     def __repr__(self: Self) -> str:
         return f'<{self.__class__.__name__}(\'{self.name}\') object at {self.id}>'
 
+    @property
+    def pos(self: Self) -> list[float]:
+        geometry = self._geometry
+        if geometry is None:
+            return self._pos
+        handle = self._geometry_handle
+        return [geometry.x[handle], geometry.y[handle]]
+
+    @pos.setter
+    def pos(self: Self, pos: list[float]) -> None:
+        geometry = self._geometry
+        if geometry is None:
+            self._pos = pos
+            return
+        handle = self._geometry_handle
+        geometry.x[handle] = pos[0]
+        geometry.y[handle] = pos[1]
+
+    @property
+    def width(self: Self) -> float:
+        if self._geometry is None:
+            return self._width
+        return self._geometry.width[self._geometry_handle]
+
+    @width.setter
+    def width(self: Self, width: float) -> None:
+        if self._geometry is None:
+            self._width = width
+            return
+        self._geometry.width[self._geometry_handle] = width
+
+    @property
+    def height(self: Self) -> float:
+        if self._geometry is None:
+            return self._height
+        return self._geometry.height[self._geometry_handle]
+
+    @height.setter
+    def height(self: Self, height: float) -> None:
+        if self._geometry is None:
+            self._height = height
+            return
+        self._geometry.height[self._geometry_handle] = height
+
+    @property
+    def geometry_handle(self: Self) -> int | None:
+        """
+        Returns:
+            int: row handle in the graph model geometry table or None.
+        """
+        return self._geometry_handle
+
+    def attach_geometry(self: Self, geometry: NodeGeometryTable) -> None:
+        """
+        Move the node position and size into a geometry table row.
+        (used internally by the node graph model)
+
+        Args:
+            geometry (NodeGeometryTable): geometry table.
+        """
+        if self._geometry is geometry:
+            return
+        self.detach_geometry()
+        x, y = self._pos[0], self._pos[1]
+        self._geometry_handle = geometry.add(x, y, self._width, self._height)
+        self._geometry = geometry
+
+    def detach_geometry(self: Self) -> None:
+        """
+        Move the node position and size out of the geometry table back
+        into the model.
+        (used internally by the node graph model)
+        """
+        if self._geometry is None:
+            return
+        x, y, self._width, self._height = \
+            self._geometry.remove(self._geometry_handle)
+        self._pos = [x, y]
+        self._geometry = None
+        self._geometry_handle = None
+
     def add_property(
             self: Self,
             name: str,
@@ -147,22 +409,21 @@ class NodeModel(object):
         widget_type: NodePropWidgetEnum = widget_type
         tab: str | None = tab or 'Properties'
 
-        if name in self.properties.keys():
+        if name in _BUILTIN_NODE_PROPERTIES:
             raise NodePropertyError(f'"{name}" reserved for default property.')
 
-        if name in self._custom_prop.keys():
+        if name in self._schema.index:
             raise NodePropertyError(
                 '"{}" property already exists.'.format(name))
 
-        self._custom_prop[name] = value
+        self._schema = self._schema.extend(name)
+        self._custom_values.append(value)
 
         if self._graph_model is None:
             self._TEMP_property_widget_types[name] = widget_type
             self._TEMP_property_attrs[name] = {'tab': tab}
             if items:
                 self._TEMP_property_attrs[name]['items'] = items
-            if range:
-                self._TEMP_property_attrs[name]['range'] = range
             if widget_tooltip:
                 self._TEMP_property_attrs[name]['tooltip'] = widget_tooltip
             if kwargs:
@@ -178,8 +439,6 @@ class NodeModel(object):
             }
             if items:
                 attrs[self.type_][name]['items'] = items
-            if range:
-                attrs[self.type_][name]['range'] = range
             if widget_tooltip:
                 attrs[self.type_][name]['tooltip'] = widget_tooltip
             if kwargs:
@@ -193,12 +452,13 @@ class NodeModel(object):
             name (str): property name.
             value (object): property value.
         """
-        if name in self.properties.keys():
+        if name in _BUILTIN_NODE_PROPERTIES:
             setattr(self, name, value)
-        elif name in self._custom_prop.keys():
-            self._custom_prop[name] = value
-        else:
+            return
+        index = self._schema.index.get(name)
+        if index is None:
             raise NodePropertyError('No property "{}"'.format(name))
+        self._custom_values[index] = value
 
     def get_property(self, name):
         """
@@ -208,9 +468,32 @@ class NodeModel(object):
         Returns:
             object: property value.
         """
-        if name in self.properties.keys():
-            return self.properties[name]
-        return self._custom_prop.get(name)
+        if name in _BUILTIN_NODE_PROPERTIES:
+            return getattr(self, name)
+        index = self._schema.index.get(name)
+        if index is None:
+            return None
+        return self._custom_values[index]
+
+    def is_builtin_property(self, name):
+        """
+        Args:
+            name (str): property name.
+
+        Returns:
+            bool: true if built-in property.
+        """
+        return name in _BUILTIN_NODE_PROPERTIES
+
+    def is_display_property(self, name):
+        """
+        Args:
+            name (str): property name.
+
+        Returns:
+            bool: true if the property only affects how the node is drawn.
+        """
+        return name in _DISPLAY_NODE_PROPERTIES
 
     def is_custom_property(self, name):
         """
@@ -220,7 +503,7 @@ class NodeModel(object):
         Returns:
             bool: true if custom property.
         """
-        return name in self._custom_prop
+        return name in self._schema.index
 
     def get_widget_type(self: Self, name: str) -> Any:
         """
@@ -251,6 +534,65 @@ class NodeModel(object):
             return None
         return model.get_node_common_properties(self.type_)[name]['tab']
 
+    def clone(self: Self) -> NodeModel:
+        """
+        Copy the model of a node that isn't added to a graph, used to stamp
+        out new node instances from a node type prototype.
+
+        The custom property schema is shared, the property values are deep
+        copied and the ports are left for the node to add.
+        (used internally by the node factory)
+
+        Returns:
+            NodeModel: new node model with its own id.
+        """
+        model = NodeModel.__new__(NodeModel)
+        for name in _CLONED_NODE_PROPERTIES:
+            setattr(model, name, getattr(self, name))
+        model.id = new_node_id()
+        model.handle = None
+        model.subgraph_session = copy.deepcopy(self.subgraph_session)
+        model.inputs = {}
+        model.outputs = {}
+        model._pos = list(self._pos)
+        model._width = self._width
+        model._height = self._height
+        model._geometry = None
+        model._geometry_handle = None
+        model._schema = self._schema
+        model._custom_values = copy.deepcopy(self._custom_values)
+        model._graph_model = None
+        model._TEMP_property_attrs = dict(self._TEMP_property_attrs or {})
+        model._TEMP_property_widget_types = dict(
+            self._TEMP_property_widget_types or {})
+        model._TEMP_accept_connection_types = dict(
+            self._TEMP_accept_connection_types or {})
+        model._TEMP_reject_connection_types = dict(
+            self._TEMP_reject_connection_types or {})
+        return model
+
+    def release_temp_data(self: Self) -> tuple[dict[str, Any], ...]:
+        """
+        Hand over the temp property attributes and port connection
+        constrains stored before the node was added to a graph.
+        (used internally by the node graph)
+
+        Returns:
+            tuple(dict, dict, dict, dict): property widget types, property
+                attributes, accept connection types and reject connection types.
+        """
+        data = (
+            self._TEMP_property_widget_types or {},
+            self._TEMP_property_attrs or {},
+            self._TEMP_accept_connection_types or {},
+            self._TEMP_reject_connection_types or {},
+        )
+        self._TEMP_property_widget_types = None
+        self._TEMP_property_attrs = None
+        self._TEMP_accept_connection_types = None
+        self._TEMP_reject_connection_types = None
+        return data
+
     def add_port_accept_connection_type(
             self: Self,
             port_name: str,
@@ -316,22 +658,19 @@ class NodeModel(object):
 
     @property
     def properties(self: Self) -> dict[str, Any]:
-        props: dict[str, Any] = self.__dict__.copy()
-        exclude: list[str] = [
-            "_custom_prop",
-            "_graph_model",
-            "_TEMP_property_attrs",
-            "_TEMP_property_widget_types"
-        ]
-        exclude_keys = [i for i in exclude if i in props.keys()]
-        for key in exclude_keys:
-            props.pop(key)
-
-        return props
+        """
+        Returns:
+            dict: built-in property names and values.
+        """
+        return {name: getattr(self, name) for name in BUILTIN_NODE_PROPERTIES}
 
-#    @property
-#    def properties(self: Self) -> dict[str, Any]:
-#        return self._custom_prop
+    @property
+    def custom_properties(self: Self) -> dict[str, Any]:
+        """
+        Returns:
+            dict: custom property names and values. (copy)
+        """
+        return dict(zip(self._schema.names, self._custom_values))
 
     @property
     def to_dict(self)-> dict[str, dict[str, Any]]:
@@ -366,33 +705,32 @@ class NodeModel(object):
                     subgraph_session: <sub graph session data>
                 }
         """
-        node_dict: dict[str, Any] = self.__dict__.copy()
-        node_id: str = node_dict.pop('id')
+        node_dict: dict[str, Any] = {
+            name: getattr(self, name) for name in _SERIAL_NODE_PROPERTIES
+        }
 
         inputs: dict[str, Any] = {}
         outputs: dict[str, Any] = {}
         input_ports: list[dict[str, Any]] = []
         output_ports: list[dict[str, Any]] = []
-        for name, model in node_dict.pop('inputs').items():
+        for name, model in self.inputs.items():
             if self.port_deletion_allowed:
-                output_ports.append({
+                input_ports.append({
                     'name': name,
                     'multi_connection': model.multi_connection,
                     'display_name': model.display_name,
                 })
-            connected_ports: dict[str, Any] = model.to_dict['connected_ports']
+            connected_ports: dict[str, Any] = model.connected_ports
             if connected_ports:
                 inputs[name] = connected_ports
-        for name, model in node_dict.pop('outputs').items():
+        for name, model in self.outputs.items():
             if self.port_deletion_allowed:
                 output_ports.append({
                     'name': name,
                     'multi_connection': model.multi_connection,
                     'display_name': model.display_name,
                 })
-            connected_ports: dict[str, Any] = model.to_dict['connected_ports']
-            if connected_ports:
-                outputs[name] = connected_ports
+            connected_ports: dict[str, Any] = model.connected_ports
             if connected_ports:
                 outputs[name] = connected_ports
         if inputs:
@@ -407,16 +745,10 @@ class NodeModel(object):
         if self.subgraph_session:
             node_dict['subgraph_session'] = self.subgraph_session
 
-        custom_props = node_dict.pop('_custom_prop', {})
-        if custom_props:
-            node_dict['custom'] = custom_props
-
-        exclude: list[str] = ['_graph_model',
-                   '_TEMP_property_attrs',
-                   '_TEMP_property_widget_types']
-        [node_dict.pop(i) for i in exclude if i in node_dict.keys()]
+        if self._custom_values:
+            node_dict['custom'] = self.custom_properties
 
-        return {node_id: node_dict}
+        return {self.id: node_dict}
 
     @property
     def serial(self) -> str:
@@ -429,15 +761,175 @@ class NodeModel(object):
         model_dict: dict[str, Any] = self.to_dict
         return json.dumps(model_dict)
 
+
+class NodeHydrationPlan(object):
+    """
+    Compiled steps restoring serialized node data onto a freshly created
+    node model of a node type.
+
+    The plan is compiled from the first instance of a node type and reused
+    for every other instance in the same session: built-in properties are
+    written straight to their slots, custom properties to their index in
+    the value list of the shared property schema, and the serialized port
+    layout is compared against the node type default ports so the ports are
+    only rebuilt when they actually changed.
+
+    Args:
+        model (NodeModel): node model of a new node instance.
+    """
+
+    __slots__ = ('type_', 'schema', 'port_layout')
+
+    def __init__(self: Self, model: NodeModel) -> None:
+        self.type_: str = model.type_
+        self.schema: NodePropertySchema = model._schema
+        self.port_layout: tuple[list, list] | None = self._port_layout(model)
+
+    def __repr__(self: Self) -> str:
+        return '<{}(\'{}\') object at {}>'.format(
+            self.__class__.__name__, self.type_, hex(id(self)))
+
+    @staticmethod
+    def _port_layout(model: NodeModel) -> tuple[list, list] | None:
+        """
+        Returns the default ports in the serialized "input_ports" and
+        "output_ports" format.
+
+        Args:
+            model (NodeModel): node model.
+
+        Returns:
+            tuple[list[dict], list[dict]]: input ports, output ports or None
+                if the default ports can't be compared (locked ports).
+        """
+        layout: tuple[list, list] = ([], [])
+        for ports, port_models in zip(layout, (model.inputs, model.outputs)):
+            for name, port_model in port_models.items():
+                if port_model.locked:
+                    return None
+                ports.append({
+                    'name': name,
+                    'multi_connection': port_model.multi_connection,
+                    'display_name': port_model.display_name,
+                })
+        return layout
+
+    def apply(self: Self, model: NodeModel, data: dict[str, Any]) -> None:
+        """
+        Restore the serialized properties onto a node model.
+
+        Args:
+            model (NodeModel): node model of a new node instance.
+            data (dict): serialized node data.
+        """
+        for name in _SERIAL_NODE_PROPERTIES:
+            if name in data:
+                setattr(model, name, data[name])
+        if 'subgraph_session' in data:
+            model.subgraph_session = data['subgraph_session']
+
+        custom = data.get('custom')
+        if not custom:
+            return
+        if model._schema is not self.schema:
+            for name, value in custom.items():
+                model.set_property(name, value)
+            return
+        index = self.schema.index
+        values = model._custom_values
+        for name, value in custom.items():
+            i = index.get(name)
+            if i is None:
+                raise NodePropertyError('No property "{}"'.format(name))
+            values[i] = value
+
+    def needs_ports(self: Self, data: dict[str, Any]) -> bool:
+        """
+        Args:
+            data (dict): serialized node data.
+
+        Returns:
+            bool: True if the node ports must be rebuilt from the serialized
+                "input_ports" and "output_ports".
+        """
+        if not data.get('port_deletion_allowed'):
+            return False
+        layout = self.port_layout
+        return (layout is None or
+                data['input_ports'] != layout[0] or
+                data['output_ports'] != layout[1])
+
+
 class NodeGraphModel(object):
     """
     Data dump for a node graph.
+
+    Note:
+        Only the connection store (edge arrays and CSR index) is keyed by
+        the integer node and port handles. ``nodes``, the topological
+        order, the dirty set and the executors stay keyed by the string
+        node id. That id is what the public API, the signals and the
+        session format hand out, so keying those lookups by handle would
+        only add an id to handle translation on every call.
     """
 
     def __init__(self: Self) -> None:
-        self.nodes = None
+        self.nodes: dict[str, NodeObject] = {}
         self.__common_node_props: dict[str, Any] = {}
 
+        # dense node and port tables indexed by the slot of an integer
+        # handle, released slots are recycled from the free lists and their
+        # generation is bumped so a stale handle resolves to None.
+        # (node id -> handle for the string ids used by the session format)
+        self.__node_table: list[NodeObject | None] = []
+        self.__node_generations: list[int] = []
+        self.__node_free: list[int] = []
+        self.__node_handles: dict[str, int] = {}
+        self.__port_table: list[PortModel | None] = []
+        self.__port_generations: list[int] = []
+        self.__port_free: list[int] = []
+        # port objects of the connected port slots.
+        self.__port_objects: list[Port | None] = []
+        # slots of removed ports that are released once their last
+        # connection is removed.
+        self.__port_pending: set[int] = set()
+
+        # node x, y, width and height columns.
+        self.geometry: NodeGeometryTable = NodeGeometryTable()
+
+        # connection table kept in sync by the "PortConnectedCmd" and
+        # "PortDisconnectedCmd" commands, output and input port slots in
+        # connection order (removed connections are set to -1 until the
+        # next rebuild). The connections of port slot "h" are indexed
+        # CSR style by "csr_edges[csr_offsets[h]:csr_offsets[h + 1]]",
+        # connections added after the index was built are in the overlay.
+        self.__edge_src: array = array('q')
+        self.__edge_dst: array = array('q')
+        self.__edge_removed: int = 0
+        self.__csr_offsets: array = array('q', [0])
+        self.__csr_edges: array = array('q')
+        self.__csr_count: int = 0
+        self.__edge_overlay: dict[int, list[int]] = {}
+
+        # node adjacency index. (node id -> {connected node id: edge count})
+        self.__node_successors: dict[str, Counter] = {}
+        self.__node_predecessors: dict[str, Counter] = {}
+
+        # node name index (name -> node id) and the last suffix number
+        # allocated for a base name (kept in sync by the node commands).
+        self.__node_names: dict[str, str] = {}
+        self.__name_counters: dict[str, int] = {}
+
+        # nodes with stale executor outputs, always holds the downstream
+        # closure of a dirty node so invalidation stops at dirty nodes.
+        self.__dirty: set[str] = set()
+
+        # topological order of the nodes, updated with the adjacency index.
+        self.topology: TopologicalOrder = TopologicalOrder(
+            successors=lambda node_id: self.__node_successors.get(node_id, ()),
+            predecessors=lambda node_id: self.__node_predecessors.get(node_id, ()),
+        )
+
         self.accept_connection_types: dict[str, Any] = {}
         self.reject_connection_types: dict[str, Any] = {}
 
@@ -511,6 +1003,523 @@ class NodeGraphModel(object):
         """
         return self.__common_node_props.get(node_type)
 
+    def add_node(self: Self, node: NodeObject) -> None:
+        """
+        Register a node in the graph model.
+
+        Args:
+            node (QtGraphology.NodeObject): node object.
+        """
+        self.nodes[node.id] = node
+        self.__node_names[node.name()] = node.id
+        self.topology.add_node(node.id)
+        self.__dirty.add(node.id)
+        node.model.attach_geometry(self.geometry)
+
+        if self.__node_free:
+            slot = self.__node_free.pop()
+            self.__node_table[slot] = node
+        else:
+            slot = len(self.__node_table)
+            self.__node_table.append(node)
+            self.__node_generations.append(0)
+        handle = (self.__node_generations[slot] << _HANDLE_SLOT_BITS) | slot
+        self.__node_handles[node.id] = handle
+        node.model.handle = handle
+        for port_model in (*node.model.inputs.values(),
+                           *node.model.outputs.values()):
+            self.port_handle(port_model)
+
+    def remove_node(self: Self, node_id: str) -> NodeObject | None:
+        """
+        Unregister a node from the graph model.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            QtGraphology.NodeObject: the removed node.
+        """
+        self.topology.remove_node(node_id)
+        self.__dirty.discard(node_id)
+        node: NodeObject | None = self.nodes.pop(node_id, None)
+        if node is None:
+            return None
+        node.model.detach_geometry()
+
+        handle = self.__node_handles.pop(node_id, None)
+        if handle is not None:
+            slot = handle & _HANDLE_SLOT_MASK
+            self.__node_table[slot] = None
+            self.__node_generations[slot] += 1
+            self.__node_free.append(slot)
+        node.model.handle = None
+        for port_model in (*node.model.inputs.values(),
+                           *node.model.outputs.values()):
+            self.remove_port(port_model)
+        if self.__node_names.get(node.name()) == node_id:
+            del self.__node_names[node.name()]
+        return node
+
+    def node_handle(self: Self, node_id: str) -> int | None:
+        """
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            int: node handle or None if the node isn't in the graph.
+        """
+        return self.__node_handles.get(node_id)
+
+    def node_by_handle(self: Self, handle: int) -> NodeObject | None:
+        """
+        Args:
+            handle (int): node handle.
+
+        Returns:
+            QtGraphology.NodeObject: node or None if the node was removed.
+        """
+        slot = handle & _HANDLE_SLOT_MASK
+        if (0 <= handle and slot < len(self.__node_table)
+                and self.__node_generations[slot] == handle >> _HANDLE_SLOT_BITS):
+            return self.__node_table[slot]
+        return None
+
+    def node_id(self: Self, handle: int) -> str | None:
+        """
+        Args:
+            handle (int): node handle.
+
+        Returns:
+            str: id of the node or None if the node was removed.
+        """
+        node = self.node_by_handle(handle)
+        return node.id if node is not None else None
+
+    def port_handle(self: Self, port_model: PortModel) -> int:
+        """
+        Returns the handle of a port, allocated on the first call for ports
+        added after their node was added to the graph.
+
+        Args:
+            port_model (PortModel): port model.
+
+        Returns:
+            int: port handle.
+        """
+        handle = port_model.handle
+        if handle is not None:
+            self.__port_pending.discard(handle & _HANDLE_SLOT_MASK)
+            return handle
+        if self.__port_free:
+            slot = self.__port_free.pop()
+            self.__port_table[slot] = port_model
+        else:
+            slot = len(self.__port_table)
+            self.__port_table.append(port_model)
+            self.__port_objects.append(None)
+            self.__port_generations.append(0)
+        handle = (self.__port_generations[slot] << _HANDLE_SLOT_BITS) | slot
+        port_model.handle = handle
+        return handle
+
+    def port_by_handle(self: Self, handle: int) -> PortModel | None:
+        """
+        Args:
+            handle (int): port handle.
+
+        Returns:
+            PortModel: port model or None if the port was removed.
+        """
+        slot = handle & _HANDLE_SLOT_MASK
+        if (0 <= handle and slot < len(self.__port_table)
+                and self.__port_generations[slot] == handle >> _HANDLE_SLOT_BITS):
+            return self.__port_table[slot]
+        return None
+
+    def remove_port(self: Self, port_model: PortModel) -> None:
+        """
+        Release the handle of a deleted port, the handle of a port that's
+        still connected is kept so its connections can be restored and
+        released when its last connection is removed.
+
+        Args:
+            port_model (PortModel): port model.
+        """
+        handle = port_model.handle
+        if handle is None:
+            return
+        slot = handle & _HANDLE_SLOT_MASK
+        if self.__port_table[slot] is not port_model:
+            port_model.handle = None
+        elif self.__port_edges(slot):
+            self.__port_pending.add(slot)
+        else:
+            self.__release_port(slot)
+
+    def __release_port(self: Self, slot: int) -> None:
+        """
+        Free a port slot for reuse and bump its generation.
+
+        Args:
+            slot (int): port slot.
+        """
+        self.__port_pending.discard(slot)
+        port_model = self.__port_table[slot]
+        if port_model is None:
+            return
+        port_model.handle = None
+        self.__port_table[slot] = None
+        self.__port_objects[slot] = None
+        self.__port_generations[slot] += 1
+        self.__port_free.append(slot)
+
+    def rename_node(self: Self, node_id: str, old_name: str, new_name: str) -> None:
+        """
+        Update the name index for a renamed node.
+
+        Args:
+            node_id (str): node id.
+            old_name (str): previous node name.
+            new_name (str): new node name.
+        """
+        if node_id not in self.nodes:
+            return
+        if self.__node_names.get(old_name) == node_id:
+            del self.__node_names[old_name]
+        self.__node_names[new_name] = node_id
+
+    def reserve_node_name(self: Self, node_id: str, name: str) -> None:
+        """
+        Reserve a node name for a node that's about to be added.
+
+        Args:
+            node_id (str): node id.
+            name (str): node name.
+        """
+        self.__node_names[name] = node_id
+
+    def get_node_id_by_name(self: Self, name: str) -> str | None:
+        """
+        Args:
+            name (str): node name.
+
+        Returns:
+            str: id of the node with the name or None.
+        """
+        return self.__node_names.get(name)
+
+    def unique_node_name(self: Self, name: str) -> str:
+        """
+        Creates a unique node name to avoid having nodes with the same name.
+
+        Suffix numbers are allocated from a counter per base name so
+        previously allocated numbers aren't handed out twice.
+
+        Args:
+            name (str): node name.
+
+        Returns:
+            str: unique node name.
+        """
+        name = ' '.join(name.split())
+        if name not in self.__node_names:
+            return name
+
+        search = _NAME_SUFFIX_REGEX.search(name)
+        if search:
+            name = name[:len(search.group(1)) * -1].strip()
+
+        count: int = self.__name_counters.get(name, 0)
+        while True:
+            count += 1
+            new_name = '{} {}'.format(name, count)
+            if new_name not in self.__node_names:
+                break
+        self.__name_counters[name] = count
+        return new_name
+
+    def __build_edge_index(self: Self) -> None:
+        """
+        Drop the removed connections and rebuild the CSR port index.
+        """
+        src, dst = self.__edge_src, self.__edge_dst
+        if self.__edge_removed:
+            src = self.__edge_src = array('q', (h for h in src if h >= 0))
+            dst = self.__edge_dst = array('q', (h for h in dst if h >= 0))
+            self.__edge_removed = 0
+
+        # a port is either an output or an input so it's only on one side
+        # of the connections, a stable sort by port slot keeps the
+        # connections of a port in connection order.
+        count = len(src)
+        handles = src.tolist() + dst.tolist()
+        order = sorted(range(count * 2), key=handles.__getitem__)
+        counts = Counter(handles)
+        self.__csr_offsets = array('q', itertools.accumulate(
+            map(counts.get, range(len(self.__port_table)), itertools.repeat(0)),
+            initial=0))
+        self.__csr_edges = array('q', [i if i < count else i - count
+                                       for i in order])
+        self.__csr_count = count
+        self.__edge_overlay = {}
+
+    def __port_edges(self: Self, slot: int) -> list[int]:
+        """
+        Returns the connection indices of a port, the index is rebuilt once
+        enough connections were added or removed since the last build.
+
+        Args:
+            slot (int): port slot.
+
+        Returns:
+            list[int]: connection indices in connection order.
+        """
+        changes = len(self.__edge_src) - self.__csr_count + self.__edge_removed
+        if changes > max(_EDGE_INDEX_SLACK, self.__csr_count):
+            self.__build_edge_index()
+
+        src = self.__edge_src
+        edges = []
+        offsets = self.__csr_offsets
+        if slot + 1 < len(offsets):
+            edges = [i for i in self.__csr_edges[offsets[slot]:offsets[slot + 1]]
+                     if src[i] >= 0]
+        overlay = self.__edge_overlay.get(slot)
+        if overlay:
+            edges.extend(i for i in overlay if src[i] >= 0)
+        return edges
+
+    def add_connection(self: Self, out_port: Port, in_port: Port) -> None:
+        """
+        Register a connection in the connection table.
+
+        Args:
+            out_port (QtGraphology.Port): output port.
+            in_port (QtGraphology.Port): input port.
+        """
+        out_handle = self.port_handle(out_port.model) & _HANDLE_SLOT_MASK
+        in_handle = self.port_handle(in_port.model) & _HANDLE_SLOT_MASK
+        # inputs usually have the fewest connections.
+        edges = self.__port_edges(in_handle)
+        src = self.__edge_src
+        for i in edges:
+            if src[i] == out_handle:
+                return
+        self.__port_objects[out_handle] = out_port
+        self.__port_objects[in_handle] = in_port
+
+        index = len(src)
+        src.append(out_handle)
+        self.__edge_dst.append(in_handle)
+        self.__edge_overlay.setdefault(out_handle, []).append(index)
+        self.__edge_overlay.setdefault(in_handle, []).append(index)
+
+        out_id: str = out_port.node().id
+        in_id: str = in_port.node().id
+        successors: Counter | None = self.__node_successors.get(out_id)
+        if not successors or in_id not in successors:
+            self.topology.add_edge(out_id, in_id)
+        self.__node_successors.setdefault(out_id, Counter())[in_id] += 1
+        self.__node_predecessors.setdefault(in_id, Counter())[out_id] += 1
+
+    def remove_connection(self: Self, out_port: Port, in_port: Port) -> None:
+        """
+        Remove a connection from the connection table.
+
+        Args:
+            out_port (QtGraphology.Port): output port.
+            in_port (QtGraphology.Port): input port.
+        """
+        out_handle = out_port.model.handle
+        in_handle = in_port.model.handle
+        if out_handle is None or in_handle is None:
+            return
+        out_handle &= _HANDLE_SLOT_MASK
+        in_handle &= _HANDLE_SLOT_MASK
+        edges = self.__port_edges(in_handle)
+        src = self.__edge_src
+        for i in edges:
+            if src[i] == out_handle:
+                src[i] = -1
+                self.__edge_dst[i] = -1
+                self.__edge_removed += 1
+                break
+        else:
+            return
+        for slot in (out_handle, in_handle):
+            if slot in self.__port_pending and not self.__port_edges(slot):
+                self.__release_port(slot)
+
+        out_id: str = out_port.node().id
+        in_id: str = in_port.node().id
+        for index, key, value in ((self.__node_successors, out_id, in_id),
+                                  (self.__node_predecessors, in_id, out_id)):
+            counter: Counter = index[key]
+            counter[value] -= 1
+            if counter[value] <= 0:
+                del counter[value]
+            if not counter:
+                del index[key]
+        if in_id not in self.__node_successors.get(out_id, ()):
+            self.topology.remove_edge(out_id, in_id)
+
+    def connections(self: Self) -> list[tuple[Port, Port]]:
+        """
+        Returns all the connections in the connection table.
+
+        Returns:
+            list[tuple(QtGraphology.Port, QtGraphology.Port)]:
+                output port, input port pairs.
+        """
+        ports = self.__port_objects
+        return [(ports[out_handle], ports[in_handle])
+                for out_handle, in_handle in zip(self.__edge_src, self.__edge_dst)
+                if out_handle >= 0]
+
+    def acyclic_check(self: Self, src_port: Port, trg_port: Port) -> bool:
+        """
+        Validate a port connection so it doesn't loop the graph.
+
+        Args:
+            src_port (QtGraphology.Port): source port.
+            trg_port (QtGraphology.Port): target port.
+
+        Returns:
+            bool: True if port connection is valid.
+        """
+        if src_port.type_() == PortTypeEnum.IN.value:
+            src_port, trg_port = trg_port, src_port
+        return not self.topology.would_create_cycle(
+            src_port.node().id, trg_port.node().id)
+
+    def topological_order(self: Self) -> list[str]:
+        """
+        Returns the node ids sorted so upstream nodes come first.
+
+        Returns:
+            list[str]: node ids.
+        """
+        return self.topology.order()
+
+    def connected_ports(self: Self, port: Port) -> list[Port]:
+        """
+        Returns the ports connected to the specified port.
+
+        Args:
+            port (QtGraphology.Port): node port.
+
+        Returns:
+            list[QtGraphology.Port]: connected ports in connection order.
+        """
+        handle = port.model.handle
+        if handle is None:
+            return []
+        handle &= _HANDLE_SLOT_MASK
+        edges = self.__port_edges(handle)
+        src, dst = self.__edge_src, self.__edge_dst
+        ports = self.__port_objects
+        return [ports[dst[i] if src[i] == handle else src[i]] for i in edges]
+
+    def port_connections(self: Self, port_model: PortModel) -> dict[str, list[str]]:
+        """
+        Returns the ports connected to a port by node id and port name.
+
+        Args:
+            port_model (PortModel): port model.
+
+        Returns:
+            dict: {<node_id>: [<port_name>, <port_name>]} in connection order.
+        """
+        handle = port_model.handle
+        if handle is None:
+            return {}
+        handle &= _HANDLE_SLOT_MASK
+        edges = self.__port_edges(handle)
+        src, dst = self.__edge_src, self.__edge_dst
+        table = self.__port_table
+        connected: dict[str, list[str]] = {}
+        for i in edges:
+            other = table[dst[i] if src[i] == handle else src[i]]
+            connected.setdefault(other.node.id, []).append(other.name)
+        return connected
+
+    def node_successors(self: Self, node_id: str) -> list[str]:
+        """
+        Returns the ids of the nodes connected downstream from a node.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            list[str]: node ids connected to the node outputs.
+        """
+        counter: Counter | None = self.__node_successors.get(node_id)
+        return list(counter) if counter else []
+
+    def node_predecessors(self: Self, node_id: str) -> list[str]:
+        """
+        Returns the ids of the nodes connected upstream from a node.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            list[str]: node ids connected to the node inputs.
+        """
+        counter: Counter | None = self.__node_predecessors.get(node_id)
+        return list(counter) if counter else []
+
+    def invalidate_node(self: Self, node_id: str) -> None:
+        """
+        Mark a node and the nodes downstream from it as dirty so the
+        executor re-evaluates them.
+
+        Args:
+            node_id (str): node id.
+        """
+        dirty = self.__dirty
+        successors = self.__node_successors
+        stack = [node_id]
+        while stack:
+            node_id = stack.pop()
+            if node_id in dirty:
+                continue
+            dirty.add(node_id)
+            stack.extend(successors.get(node_id, ()))
+
+    def invalidate_all(self: Self) -> None:
+        """
+        Mark all the nodes as dirty.
+        """
+        self.__dirty.update(self.nodes)
+
+    def is_dirty(self: Self, node_id: str) -> bool:
+        """
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            bool: True if the node outputs are stale.
+        """
+        return node_id in self.__dirty
+
+    def dirty_nodes(self: Self) -> set[str]:
+        """
+        Returns:
+            set[str]: ids of the nodes with stale outputs.
+        """
+        return set(self.__dirty)
+
+    def clean_node(self: Self, node_id: str) -> None:
+        """
+        Clear the dirty state of a node once it's been evaluated.
+
+        Args:
+            node_id (str): node id.
+        """
+        self.__dirty.discard(node_id)
+
     def add_port_accept_connection_type(
             self: Self,
             port_name: str,
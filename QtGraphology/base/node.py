@@ -50,12 +50,10 @@ class NodeObject(object):
                 'No qgraphics item specified for the node object!'
             )
 
-        self._view: AbstractNodeItem = AbstractNodeItem()
-        self._view.identifier = self.__identifier__
-        self._view.type_ = self.type_
-        self._view.name = self.model.name
-        self._view.id = self._model.id
-        self._view.layout_direction = self._model.layout_direction
+        # the node item is built from the model on the first "view" access
+        # so the nodes of a headless node graph never build one.
+        self._view_cls: type[AbstractNodeItem] = _NodeItem
+        self._view: AbstractNodeItem | None = None
 
     def __repr__(self: Self) -> str:
         return f'<{self.__class__.__name__}("{self.NODE_NAME}") object at {hex(id(self))}>'
@@ -93,16 +91,76 @@ class NodeObject(object):
         """
         return self._graph
 
+    def _is_headless(self: Self) -> bool:
+        """
+        Returns true if the node is in a headless node graph, the node model
+        is then the only source of truth as the view isn't in a scene.
+        """
+        return self._graph is not None and self._graph.headless()
+
+    def has_view(self: Self) -> bool:
+        """
+        Returns true if the node item was built, until then the node model
+        is the only source of truth.
+
+        Returns:
+            bool: true if the node item exists.
+        """
+        return self._view is not None
+
     @property
     def view(self: Self) -> AbstractNodeItem | NodeItem:
         """
         Returns the :class:`QtWidgets.QGraphicsItem` used in the scene.
 
+        The node item is built from the node model on the first access.
+
         Returns:
             QtGraphology.qgraphics.node_abstract.AbstractNodeItem: node item.
         """
+        if self._view is None:
+            self._build_view()
         return self._view
 
+    def _build_view(self: Self) -> None:
+        """
+        Build the node item and sync it from the node model.
+        (called on the first access of :attr:`NodeObject.view`)
+        """
+        view = self._view_cls()
+        view.identifier = self.__identifier__
+        view.type_ = self.type_
+        self._view = view
+        self._populate_view()
+        self.update()
+
+    def _populate_view(self: Self) -> None:
+        """
+        Create the child items of a newly built node item.
+        (re-implemented by the nodes with ports or widgets)
+        """
+        return
+
+    def release_view(self: Self) -> None:
+        """
+        Sync the node model from the node item and drop the node item, it's
+        built again from the node model on the next :attr:`NodeObject.view`
+        access. (used by the viewer in virtualized mode, the node item must
+        already be out of the scene)
+        """
+        if self._view is None:
+            return
+        self.update_model()
+        self._release_view()
+        self._view = None
+
+    def _release_view(self: Self) -> None:
+        """
+        Drop the references to the child items of the released node item.
+        (re-implemented by the nodes with ports or widgets)
+        """
+        return
+
     def set_view(self: Self, item: AbstractNodeItem) -> None:
         """
         Set a new ``QGraphicsItem`` item to be used as the view.
@@ -120,6 +178,8 @@ class NodeObject(object):
             scene.addItem(self._view)
         else:
             self._view = item
+        # the node item is built again from this class once released.
+        self._view_cls = type(item)
         self.NODE_NAME = self._view.name
 
         # update the view.
@@ -143,9 +203,10 @@ class NodeObject(object):
         Args:
             model (QtGraphology.base.model.NodeModel): node model object.
         """
+        node_id = self._model.id
         self._model = model
         self._model.type_ = self.type_
-        self._model.id = self.view.id
+        self._model.id = node_id
 
         # update the view.
         self.update()
@@ -154,19 +215,22 @@ class NodeObject(object):
         """
         Update the node model from view.
         """
-        for name, val in self.view.properties.items():
-            if name in self.model.properties.keys():
-                setattr(self.model, name, val)
-            if name in self.model.custom_properties.keys():
-                self.model.custom_properties[name] = val
+        if self._view is None or self._is_headless():
+            return
+        for name, val in self._view.properties.items():
+            if (self.model.is_builtin_property(name) or
+                    self.model.is_custom_property(name)):
+                self.model.set_property(name, val)
 
     def update(self):
         """
         Update the node view from model.
         """
+        if self._view is None:
+            return
         settings = self.model.to_dict[self.model.id]
         settings["id"] = self.model.id
-        self.view.from_dict(settings)
+        self._view.from_dict(settings)
 
     def serialize(self):
         """
@@ -271,7 +335,8 @@ class NodeObject(object):
         Returns:
             bool: True if the node is selected.
         """
-        self.model.selected = self.view.isSelected()
+        if self._view is not None and not self._is_headless():
+            self.model.selected = self._view.isSelected()
         return self.model.selected
 
     def set_selected(self, selected=True):
@@ -346,8 +411,8 @@ class NodeObject(object):
         Returns:
             object: property data.
         """
-        if self.graph and name == 'selected':
-            self.model.set_property(name, self.view.selected)
+        if self.graph and name == 'selected' and self._view is not None:
+            self.model.set_property(name, self._view.selected)
 
         return self.model.get_property(name)
 
@@ -386,13 +451,13 @@ class NodeObject(object):
             else:
                 undo_cmd.redo()
         else:
-            if hasattr(self.view, name):
-                setattr(self.view, name, value)
+            if self._view is not None and hasattr(self._view, name):
+                setattr(self._view, name, value)
             self.model.set_property(name, value)
 
         # redraw the node for custom properties.
-        if self.model.is_custom_property(name):
-            self.view.draw_node()
+        if self._view is not None and self.model.is_custom_property(name):
+            self._view.draw_node()
 
     def has_property(self, name):
         """
@@ -404,7 +469,7 @@ class NodeObject(object):
         Returns:
             bool: true if property name exists in the Node.
         """
-        return name in self.model.custom_properties.keys()
+        return self.model.is_custom_property(name)
 
     def set_x_pos(self, x):
         """
@@ -462,8 +527,10 @@ class NodeObject(object):
         Returns:
             list[float, float]: x, y position.
         """
-        if self.view.xy_pos and self.view.xy_pos != self.model.pos:
-            self.model.pos = self.view.xy_pos
+        if self._view is None or self._is_headless():
+            return self.model.pos
+        if self._view.xy_pos and self._view.xy_pos != self.model.pos:
+            self.model.pos = self._view.xy_pos
 
         return self.model.pos
 
@@ -497,4 +564,5 @@ class NodeObject(object):
             value (int): layout direction mode.
         """
         self.model.layout_direction = value
-        self.view.layout_direction = value
+        if self._view is not None:
+            self._view.layout_direction = value
@@ -43,11 +43,12 @@ class Port(object):
 
     Args:
         node (QtGraphology.NodeObject): parent node.
-        port_item (PortItem): graphic item used for drawing.
+        port_item (PortItem): graphic item used for drawing, None until the
+            node item is built.
     """
 
-    def __init__(self: Self, node: NodeObject, port_item: PortItem) -> None:
-        self.__port_item_view: PortItem = port_item
+    def __init__(self: Self, node: NodeObject, port_item: PortItem | None) -> None:
+        self.__port_item_view: PortItem | None = port_item
         self.__model = PortModel(node=node)
         self.__node: NodeObject = node
 
@@ -57,7 +58,7 @@ class Port(object):
 
     @property
     def port_item(self: Self) -> PortItem:
-        return self.__port_item_view
+        return self.view
 
     @property
     def port_node(self: Self) -> NodeObject:
@@ -68,11 +69,35 @@ class Port(object):
         """
         Returns the :class:`QtWidgets.QGraphicsItem` used in the scene.
 
+        The port item is built with the node item on the first access.
+
         Returns:
             QtGraphology.qgraphics.port.PortItem: port item.
         """
+        if self.__port_item_view is None:
+            # building the node item creates the port items.
+            self.__node.view
         return self.__port_item_view
 
+    def has_view(self: Self) -> bool:
+        """
+        Returns true if the port item was built.
+
+        Returns:
+            bool: true if the port item exists.
+        """
+        return self.__port_item_view is not None
+
+    def _set_view(self: Self, port_item: PortItem | None) -> None:
+        """
+        Set the port item.
+        (used internally by the node when the node item is built)
+
+        Args:
+            port_item (PortItem): port item.
+        """
+        self.__port_item_view = port_item
+
     @property
     def model(self: Self) -> PortModel:
         """
@@ -107,6 +132,16 @@ class Port(object):
         """
         return self.model.multi_connection
 
+    def data_type(self: Self) -> type | tuple[type, ...] | None:
+        """
+        Returns the type of the values flowing through the port when the
+        graph is executed.
+
+        Returns:
+            type: value type or None if the port accepts any value.
+        """
+        return self.model.data_type
+
     def node(self: Self) -> NodeObject:
         """
         Return the parent node.
@@ -229,16 +264,26 @@ class Port(object):
         Returns:
             list[QtGraphology.Port]: list of connected ports.
         """
-        ports: list[Port]= []
         graph: NodeGraph = self.node().graph
-        for node_id, port_names in self.model.connected_ports.items():
-            for port_name in port_names:
-                node = graph.get_node_by_id(node_id)
-                if self.type_() == PortTypeEnum.IN.value:
-                    ports.append(node.outputs()[port_name])
-                elif self.type_() == PortTypeEnum.OUT.value:
-                    ports.append(node.inputs()[port_name])
-        return ports
+        if graph is None:
+            return []
+        return graph.model.connected_ports(self)
+
+    def value(self: Self) -> Any:
+        """
+        Lazily evaluate the port value with the graph executor, only the
+        nodes upstream from the port are evaluated.
+
+        See Also:
+            :meth:`QtGraphology.base.executor.GraphExecutor.pull`
+
+        Returns:
+            object: port value or None if the node isn't in a graph.
+        """
+        graph: NodeGraph = self.node().graph
+        if graph is None:
+            return None
+        return graph.executor().pull(self)
 
     def connect_to(self: Self, target_port=None, push_undo=True, emit_signal=True) -> None:
         """
@@ -253,7 +298,12 @@ class Port(object):
         if not target_port:
             return
 
-        is_valid_accept_constraint: bool = target_port.port_item.validate_accept_constraint(self.port_item)
+        # accept constraints are only set on the port items, a port without
+        # a built port item has none. (and the check mustn't build one)
+        is_valid_accept_constraint: bool | None = None
+        if self.has_view() and target_port.has_view():
+            is_valid_accept_constraint = \
+                target_port.view.validate_accept_constraint(self.view)
         if not is_valid_accept_constraint and self in target_port.connected_ports():
             return
 
@@ -291,7 +341,6 @@ class Port(object):
 
         # make the connection from here.
         graph: NodeGraph = self.node().graph
-        viewer: NodeViewer = graph.viewer()
 
         # FIXME: undo_stack needs to be declare early or outside or try except blah
         if push_undo:
@@ -319,20 +368,25 @@ class Port(object):
                     NodeInputDisconnectedCmd(self, target_port).redo()
             return
 
-        if graph.acyclic() and viewer.acyclic_check(self.view, target_port.view):
-            if not is_valid_accept_constraint and pre_conn_port:
-                if push_undo:
-                    undo_stack.push(
-                        PortDisconnectedCmd(self, pre_conn_port, emit_signal)
-                    )
-                    undo_stack.push(
-                        NodeInputDisconnectedCmd(self, pre_conn_port)
-                    )
-                    undo_stack.endMacro()
-                else:
-                    PortDisconnectedCmd(self, pre_conn_port, emit_signal).redo()
-                    NodeInputDisconnectedCmd(self, pre_conn_port).redo()
-                return
+        # the connection would loop the graph.
+        if graph.acyclic() and not graph.model.acyclic_check(self, target_port):
+            if push_undo:
+                undo_stack.endMacro()
+            return
+
+        if not is_valid_accept_constraint and pre_conn_port:
+            if push_undo:
+                undo_stack.push(
+                    PortDisconnectedCmd(self, pre_conn_port, emit_signal)
+                )
+                undo_stack.push(
+                    NodeInputDisconnectedCmd(self, pre_conn_port)
+                )
+                undo_stack.endMacro()
+            else:
+                PortDisconnectedCmd(self, pre_conn_port, emit_signal).redo()
+                NodeInputDisconnectedCmd(self, pre_conn_port).redo()
+            return
 
         trg_conn_ports = target_port.connected_ports()
         if not target_port.multi_connection() and trg_conn_ports:
@@ -515,16 +569,16 @@ class Port(object):
 
     @property
     def color(self):
-        return self.__port_item_view.color
+        return self.view.color
 
     @color.setter
     def color(self, color=(0, 0, 0, 255)):
-        self.__port_item_view.color = color
+        self.view.color = color
 
     @property
     def border_color(self):
-        return self.__port_item_view.border_color
+        return self.view.border_color
 
     @border_color.setter
     def border_color(self, color=(0, 0, 0, 255)):
-        self.__port_item_view.border_color = color
+        self.view.border_color = color
@@ -0,0 +1,275 @@
+#!/usr/bin/python
+from __future__ import annotations
+import heapq
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING, Any, Callable, Self
+
+from QtGraphology.base.executor import GraphExecutor
+from QtGraphology.constants import NodeExecutorEnum
+from QtGraphology.errors import NodeExecutionError
+from QtGraphology.nodes.base_node import BaseNode
+from QtGraphology.nodes.group_node import GroupNode
+from QtGraphology.nodes.port_node import PortInputNode
+
+if TYPE_CHECKING:
+    from QtGraphology.base.graph import NodeGraph
+
+# estimated run time (seconds) for a node that hasn't been timed yet.
+_DEFAULT_NODE_COST = 1e-3
+
+
+def _timed_call(func: Callable, *args: Any) -> tuple[Any, float]:
+    """
+    Call a function and time it, runs in the pool workers.
+    (module level so it can be pickled for the process pool)
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class ParallelGraphExecutor(GraphExecutor):
+    """
+    Graph executor that evaluates independent branches concurrently.
+
+    Nodes are dispatched as soon as their upstream nodes are evaluated,
+    to a thread pool, a process pool or the calling thread depending on
+    the node type :attr:`BaseNode.EXECUTOR`. When more nodes are ready
+    than there are workers the node with the longest remaining chain
+    (critical path, weighted by the node run times measured on the
+    previous executions) is dispatched first.
+
+    Note:
+        A ``NodeExecutorEnum.PROCESS`` node only has :meth:`BaseNode.compute`
+        evaluated in the worker process so the node custom properties, the
+        input and output values must be picklable.
+
+    Args:
+        graph (QtGraphology.NodeGraph): node graph.
+        max_workers (int): maximum workers per pool. (default: pool default)
+        thread_pool (concurrent.futures.ThreadPoolExecutor): shared thread pool. (optional)
+        process_pool (concurrent.futures.ProcessPoolExecutor): shared process pool. (optional)
+    """
+
+    def __init__(self: Self,
+                 graph: NodeGraph,
+                 max_workers: int | None = None,
+                 thread_pool: futures.ThreadPoolExecutor | None = None,
+                 process_pool: futures.ProcessPoolExecutor | None = None) -> None:
+        super(ParallelGraphExecutor, self).__init__(graph)
+        self._max_workers: int | None = max_workers
+        self._thread_pool: futures.ThreadPoolExecutor | None = thread_pool
+        self._process_pool: futures.ProcessPoolExecutor | None = process_pool
+        self._shared_pools: tuple = (thread_pool, process_pool)
+        # sub graph executors share the pools of the top level executor.
+        self._pool_owner: ParallelGraphExecutor = self
+        self._costs: dict[str, float] = {}
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *args: Any) -> None:
+        self.shutdown()
+
+    def shutdown(self: Self, wait: bool = True) -> None:
+        """
+        Shutdown the worker pools created by the executor, pools passed
+        to the constructor are left to the caller.
+
+        Args:
+            wait (bool): wait for the running nodes to finish.
+        """
+        if self._pool_owner is not self:
+            return
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None and pool not in self._shared_pools:
+                pool.shutdown(wait=wait)
+        self._thread_pool, self._process_pool = self._shared_pools
+
+    def thread_pool(self: Self) -> futures.ThreadPoolExecutor:
+        """
+        Returns:
+            concurrent.futures.ThreadPoolExecutor: thread pool (created on demand).
+        """
+        if self._pool_owner is not self:
+            return self._pool_owner.thread_pool()
+        if self._thread_pool is None:
+            self._thread_pool = futures.ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix='QtGraphology')
+        return self._thread_pool
+
+    def process_pool(self: Self) -> futures.ProcessPoolExecutor:
+        """
+        Returns:
+            concurrent.futures.ProcessPoolExecutor: process pool (created on demand).
+        """
+        if self._pool_owner is not self:
+            return self._pool_owner.process_pool()
+        if self._process_pool is None:
+            self._process_pool = futures.ProcessPoolExecutor(
+                max_workers=self._max_workers)
+        return self._process_pool
+
+    def new_sub_executor(self: Self, sub_graph: NodeGraph) -> GraphExecutor:
+        executor = self.__class__(sub_graph, max_workers=self._max_workers)
+        executor._pool_owner = self._pool_owner
+        executor._costs = self._costs
+        return executor
+
+    def node_cost(self: Self, node: BaseNode) -> float:
+        """
+        Returns the measured run time of a node from the last execution.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+
+        Returns:
+            float: seconds.
+        """
+        return self._costs.get(node.id, _DEFAULT_NODE_COST)
+
+    def critical_path(self: Self, node_ids: list[str]) -> dict[str, float]:
+        """
+        Compute the length of the longest downstream chain for each node,
+        memoized nodes don't add to the chain.
+
+        Args:
+            node_ids (list[str]): node ids in topological order.
+
+        Returns:
+            dict: {<node_id>: <chain cost including the node>}
+        """
+        model = self._graph.model
+        nodes = model.nodes
+        ranks: dict[str, float] = {}
+        for node_id in reversed(node_ids):
+            successors = [ranks[n] for n in model.node_successors(node_id)
+                          if n in ranks]
+            cost = 0.0 if self.is_cached(node_id) else self.node_cost(nodes[node_id])
+            ranks[node_id] = cost + (max(successors) if successors else 0.0)
+        return ranks
+
+    def execute(self: Self,
+                nodes: list[BaseNode] | None = None,
+                port_inputs: dict[str, Any] | None = None) -> dict[str, dict[str, Any]]:
+        model = self._graph.model
+        graph_nodes = model.nodes
+        order = [n_id for n_id in self.execution_order(nodes)
+                 if isinstance(graph_nodes.get(n_id), BaseNode)]
+        position = {n_id: i for i, n_id in enumerate(order)}
+
+        # pending upstream count (connections closing a cycle are ignored).
+        pending: dict[str, int] = {}
+        for node_id in order:
+            pending[node_id] = sum(
+                1 for n in model.node_predecessors(node_id)
+                if position.get(n, len(order)) < position[node_id]
+            )
+
+        ranks = self.critical_path(order)
+        ready: list[tuple[float, int, str]] = [
+            (-ranks[n_id], position[n_id], n_id)
+            for n_id in order if not pending[n_id]
+        ]
+        heapq.heapify(ready)
+
+        running: dict[futures.Future, BaseNode] = {}
+
+        def node_done(node_id: str) -> None:
+            for n_id in model.node_successors(node_id):
+                if n_id not in pending or position[n_id] <= position[node_id]:
+                    continue
+                pending[n_id] -= 1
+                if not pending[n_id]:
+                    heapq.heappush(ready, (-ranks[n_id], position[n_id], n_id))
+
+        try:
+            while ready or running:
+                # dispatch the pool nodes first so the workers are busy
+                # while the main thread nodes are evaluated.
+                main_nodes = []
+                while ready:
+                    node_id = heapq.heappop(ready)[2]
+                    node = graph_nodes[node_id]
+                    if isinstance(node, PortInputNode):
+                        if port_inputs is None:
+                            port_inputs = self.parent_inputs()
+                        self.set_port_inputs(node, port_inputs)
+                        node_done(node_id)
+                        continue
+                    if self.is_cached(node_id):
+                        node_done(node_id)
+                        continue
+                    future = self._submit(node)
+                    if future is None:
+                        main_nodes.append(node)
+                    else:
+                        running[future] = node
+
+                if main_nodes:
+                    node = main_nodes.pop(0)
+                    for other in main_nodes:
+                        heapq.heappush(ready, (-ranks[other.id],
+                                               position[other.id], other.id))
+                    start = time.perf_counter()
+                    self.evaluate_node(node)
+                    self._costs[node.id] = time.perf_counter() - start
+                    node_done(node.id)
+                    continue
+
+                if not running:
+                    continue
+                done, _ = futures.wait(running,
+                                       return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    self._collect(node, future)
+                    node_done(node.id)
+        finally:
+            for future in running:
+                future.cancel()
+        return self._results
+
+    def _submit(self: Self, node: BaseNode) -> futures.Future | None:
+        """
+        Submit a node to its pool.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+
+        Returns:
+            concurrent.futures.Future: or None if the node is evaluated on
+                the calling thread.
+        """
+        executor = NodeExecutorEnum(getattr(node, 'EXECUTOR', NodeExecutorEnum.MAIN.value))
+        if executor is NodeExecutorEnum.MAIN or isinstance(node, GroupNode):
+            return None
+        inputs = self.node_inputs(node)
+        if executor is NodeExecutorEnum.PROCESS:
+            return self.process_pool().submit(
+                _timed_call, type(node).compute, node.model.custom_properties, inputs)
+        return self.thread_pool().submit(_timed_call, self.run_node, node, inputs)
+
+    def _collect(self: Self, node: BaseNode, future: futures.Future) -> None:
+        """
+        Store the output values of a node evaluated in a pool.
+
+        Args:
+            node (QtGraphology.BaseNode): node.
+            future (concurrent.futures.Future): node future.
+        """
+        try:
+            outputs, duration = future.result()
+        except NodeExecutionError:
+            raise
+        except Exception as error:
+            raise NodeExecutionError(
+                '"{}" failed to execute: {}'.format(node.name(), error)
+            ) from error
+        if NodeExecutorEnum(node.EXECUTOR) is NodeExecutorEnum.PROCESS:
+            # thread pool nodes are validated by "run_node" in the worker.
+            outputs = self.check_outputs(node, outputs)
+        self.store_outputs(node.id, outputs)
+        self._costs[node.id] = duration
@@ -0,0 +1,628 @@
+#!/usr/bin/python
+"""
+Binary node graph session format.
+
+A binary session is a peer of the ``JSON`` session file and stores the same
+data produced by ``NodeGraph._serialize`` as a stream of chunks:
+
+.. code-block:: text
+
+    header  <magic:4s><version:H><flags:H>
+    chunk   <tag:4s><payload size:I><payload>
+
+    STRS    strings appended to the interned string table (node ids, types,
+            property names, ...) stored as a length per string followed by
+            the utf-8 data.
+    GRPH    graph properties.
+    NODE    batch of nodes sharing the same property keys, the values are
+            stored column by column as packed arrays.
+    ORDR    batch of the original node order, written ahead of the nodes.
+    EDGE    batch of the packed connection table
+            (in node, in port, out node, out port).
+    END     end of the session.
+
+Chunks are written and read one at a time, a ``STRS`` chunk is written
+ahead of every chunk that interns new strings so a reader never holds more
+than a single chunk payload.
+"""
+from __future__ import annotations
+from typing import Any, BinaryIO, Self
+
+import gc
+import struct
+import sys
+from array import array
+from itertools import accumulate
+
+from QtGraphology.base.types import TSerializedData
+from QtGraphology.constants import PortTypeEnum
+from QtGraphology.errors import SessionError
+
+BINARY_SESSION_EXT: str = '.qgs'
+BINARY_SESSION_MAGIC: bytes = b'QTGS'
+BINARY_SESSION_VERSION: int = 1
+
+_HEADER = struct.Struct('<4sHH')
+_CHUNK = struct.Struct('<4sI')
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+_VECTOR = struct.Struct('<BBI')
+_GROUP = struct.Struct('<II')
+
+_INT_MIN: int = -(1 << 63)
+_INT_MAX: int = (1 << 63) - 1
+
+# rows stored per node, order and edge chunk.
+_BATCH_SIZE: int = 4096
+
+# value tags.
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_LIST = 6
+_TUPLE = 7
+_DICT = 8
+_BIG_INT = 10
+
+# node table column kinds.
+_COL_VALUES = 0
+_COL_NONE = 1
+_COL_BOOL = 2
+_COL_INT = 3
+_COL_FLOAT = 4
+_COL_STR = 5
+_COL_VECTOR = 6
+_COL_STRUCT = 7
+_COL_LIST = 8
+_COL_CONST = 9
+
+# value types a constant column may share between the decoded rows.
+_CONST_TYPES = (bool, int, float, str)
+
+# lone surrogates are valid in python strings and JSON sessions.
+_STR_ERRORS: str = 'surrogatepass'
+
+# packed tables are stored little endian.
+_SWAP_BYTES: bool = sys.byteorder == 'big'
+
+_PORT_IN: str = PortTypeEnum.IN.value
+_PORT_OUT: str = PortTypeEnum.OUT.value
+
+
+def is_binary_session(file_path: str) -> bool:
+    """
+    Check if a file is a binary session file.
+
+    Args:
+        file_path (str): path to the session file.
+
+    Returns:
+        bool: true if the file starts with the binary session magic.
+    """
+    with open(file_path, 'rb') as file_in:
+        return file_in.read(len(BINARY_SESSION_MAGIC)) == BINARY_SESSION_MAGIC
+
+
+def _pack_array(buf: bytearray, values: array) -> None:
+    if _SWAP_BYTES:
+        values.byteswap()
+    buf += values.tobytes()
+
+
+def _unpack_array(typecode: str, data: bytes, offset: int, count: int) -> tuple[array, int]:
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values, end
+
+
+class _StringTable(object):
+    """
+    Interned string table used while writing a session.
+    """
+
+    def __init__(self: Self) -> None:
+        self.strings: list[str] = []
+        self.indices: dict[str, int] = {}
+        self.written: int = 0
+
+    def index(self: Self, value: str) -> int:
+        idx = self.indices.get(value)
+        if idx is None:
+            idx = self.indices[value] = len(self.strings)
+            self.strings.append(value)
+        return idx
+
+    def pending_chunk(self: Self) -> bytearray | None:
+        """
+        Returns the ``STRS`` payload for the strings interned since the
+        last call.
+
+        Returns:
+            bytearray: chunk payload or None if there are no new strings.
+        """
+        pending = self.strings[self.written:]
+        if not pending:
+            return None
+        self.written = len(self.strings)
+        buf = bytearray(_U32.pack(len(pending)))
+        _pack_array(buf, array('I', map(len, pending)))
+        buf += ''.join(pending).encode('utf-8', _STR_ERRORS)
+        return buf
+
+
+class _Writer(object):
+    """
+    Encodes python values into the binary session format.
+    """
+
+    def __init__(self: Self, strings: _StringTable) -> None:
+        self.strings: _StringTable = strings
+
+    def write(self: Self, buf: bytearray, value: Any) -> None:
+        """
+        Write a single tagged value.
+        """
+        if value is None:
+            buf.append(_NONE)
+        elif value is True:
+            buf.append(_TRUE)
+        elif value is False:
+            buf.append(_FALSE)
+        elif isinstance(value, int):
+            if _INT_MIN <= value <= _INT_MAX:
+                buf.append(_INT)
+                buf += _I64.pack(value)
+            else:
+                buf.append(_BIG_INT)
+                buf += _U32.pack(self.strings.index(str(value)))
+        elif isinstance(value, float):
+            buf.append(_FLOAT)
+            buf += _F64.pack(value)
+        elif isinstance(value, str):
+            buf.append(_STR)
+            buf += _U32.pack(self.strings.index(value))
+        elif isinstance(value, dict):
+            buf.append(_DICT)
+            buf += _U32.pack(len(value))
+            for key, val in value.items():
+                self.write(buf, key)
+                self.write(buf, val)
+        elif isinstance(value, tuple):
+            buf.append(_TUPLE)
+            buf += _U32.pack(len(value))
+            for val in value:
+                self.write(buf, val)
+        elif isinstance(value, (list, set, frozenset)):
+            # sets are stored as lists same as the JSON session.
+            buf.append(_LIST)
+            buf += _U32.pack(len(value))
+            for val in value:
+                self.write(buf, val)
+        elif hasattr(value, 'value'):
+            # enum members.
+            self.write(buf, value.value)
+        else:
+            raise SessionError(
+                'Can\'t serialize value of type "{}"'.format(type(value).__name__))
+
+    def write_column(self: Self, buf: bytearray, values: list[Any]) -> None:
+        """
+        Write a node table column, columns with a single value type are
+        stored as packed arrays.
+        """
+        if all(v is None for v in values):
+            buf.append(_COL_NONE)
+            return
+        first = values[0]
+        kind = type(first)
+        if self._write_const_column(buf, values):
+            pass
+        elif kind is bool and all(type(v) is bool for v in values):
+            buf.append(_COL_BOOL)
+            _pack_array(buf, array('B', values))
+        elif kind is int and all(type(v) is int and _INT_MIN <= v <= _INT_MAX
+                                 for v in values):
+            buf.append(_COL_INT)
+            _pack_array(buf, array('q', values))
+        elif kind is float and all(type(v) is float for v in values):
+            buf.append(_COL_FLOAT)
+            _pack_array(buf, array('d', values))
+        elif kind is str and all(type(v) is str for v in values):
+            buf.append(_COL_STR)
+            _pack_array(buf, array('I', map(self.strings.index, values)))
+        elif kind is dict and self._write_struct_column(buf, values):
+            pass
+        elif self._write_vector_column(buf, values):
+            pass
+        elif kind is list and self._write_list_column(buf, values):
+            pass
+        else:
+            buf.append(_COL_VALUES)
+            for value in values:
+                self.write(buf, value)
+
+    def _write_const_column(self: Self, buf: bytearray, values: list[Any]) -> bool:
+        """
+        Write a column holding the same immutable value on every row
+        (node type, colors, flags) as the single value.
+
+        Returns:
+            bool: false if the column isn't a constant column.
+        """
+        first = values[0]
+        kind = type(first)
+        if kind is tuple:
+            types = tuple(map(type, first))
+            if not all(t in _CONST_TYPES for t in types):
+                return False
+            if not all(type(v) is tuple and v == first and
+                       tuple(map(type, v)) == types for v in values):
+                return False
+        elif kind not in _CONST_TYPES:
+            return False
+        elif not all(type(v) is kind and v == first for v in values):
+            return False
+        buf.append(_COL_CONST)
+        self.write(buf, first)
+        return True
+
+    def _write_struct_column(self: Self, buf: bytearray, values: list[Any]) -> bool:
+        """
+        Write a column of dicts sharing the same keys (custom properties)
+        as nested columns.
+
+        Returns:
+            bool: false if the column isn't a struct column.
+        """
+        keys = tuple(values[0].keys())
+        if not all(type(v) is dict and tuple(v.keys()) == keys for v in values):
+            return False
+        if not all(type(k) is str for k in keys):
+            return False
+        buf.append(_COL_STRUCT)
+        buf += _U32.pack(len(keys))
+        _pack_array(buf, array('I', map(self.strings.index, keys)))
+        for key in keys:
+            self.write_column(buf, [v[key] for v in values])
+        return True
+
+    def _write_list_column(self: Self, buf: bytearray, values: list[Any]) -> bool:
+        """
+        Write a column of lists (port definitions) as the list sizes
+        followed by a nested column of the flattened items.
+
+        Returns:
+            bool: false if the column isn't a list column.
+        """
+        if not all(type(v) is list for v in values):
+            return False
+        buf.append(_COL_LIST)
+        _pack_array(buf, array('I', map(len, values)))
+        self.write_column(buf, [i for v in values for i in v])
+        return True
+
+    @staticmethod
+    def _write_vector_column(buf: bytearray, values: list[Any]) -> bool:
+        """
+        Write a column of same sized numeric lists or tuples
+        (positions, colors) as one packed array.
+
+        Returns:
+            bool: false if the column isn't a vector column.
+        """
+        first = values[0]
+        kind = type(first)
+        if kind not in (list, tuple) or not first:
+            return False
+        size = len(first)
+        if not all(type(v) is kind and len(v) == size for v in values):
+            return False
+        flat = [i for v in values for i in v]
+        if all(type(i) is int and _INT_MIN <= i <= _INT_MAX for i in flat):
+            typecode, elem_kind = 'q', 0
+        elif all(type(i) is float for i in flat):
+            typecode, elem_kind = 'd', 1
+        else:
+            return False
+        buf.append(_COL_VECTOR)
+        buf += _VECTOR.pack(int(kind is tuple), elem_kind, size)
+        _pack_array(buf, array(typecode, flat))
+        return True
+
+
+class _Reader(object):
+    """
+    Decodes the binary session format.
+    """
+
+    def __init__(self: Self) -> None:
+        self.strings: list[str] = []
+
+    def read_strings(self: Self, data: bytes) -> None:
+        """
+        Append the strings of a ``STRS`` chunk to the string table.
+        """
+        count = _U32.unpack_from(data, 0)[0]
+        sizes, offset = _unpack_array('I', data, 4, count)
+        text = bytes(data[offset:]).decode('utf-8', _STR_ERRORS)
+        ends = list(accumulate(sizes))
+        if ends and ends[-1] != len(text):
+            raise SessionError('Corrupted string table in session data.')
+        self.strings.extend(map(text.__getitem__, map(slice, [0] + ends, ends)))
+
+    def read(self: Self, data: bytes, offset: int) -> tuple[Any, int]:
+        """
+        Read a single tagged value.
+        """
+        tag = data[offset]
+        offset += 1
+        if tag == _STR:
+            return self.strings[_U32.unpack_from(data, offset)[0]], offset + 4
+        if tag == _INT:
+            return _I64.unpack_from(data, offset)[0], offset + 8
+        if tag == _FLOAT:
+            return _F64.unpack_from(data, offset)[0], offset + 8
+        if tag == _NONE:
+            return None, offset
+        if tag == _TRUE:
+            return True, offset
+        if tag == _FALSE:
+            return False, offset
+        if tag == _DICT:
+            count = _U32.unpack_from(data, offset)[0]
+            offset += 4
+            result = {}
+            read = self.read
+            for _ in range(count):
+                key, offset = read(data, offset)
+                result[key], offset = read(data, offset)
+            return result, offset
+        if tag == _LIST or tag == _TUPLE:
+            count = _U32.unpack_from(data, offset)[0]
+            offset += 4
+            items = []
+            read = self.read
+            for _ in range(count):
+                item, offset = read(data, offset)
+                items.append(item)
+            return (tuple(items) if tag == _TUPLE else items), offset
+        if tag == _BIG_INT:
+            return int(self.strings[_U32.unpack_from(data, offset)[0]]), offset + 4
+        raise SessionError('Unknown value tag "{}" in session data.'.format(tag))
+
+    def read_column(self: Self, data: bytes, offset: int, count: int) -> tuple[list[Any], int]:
+        """
+        Read a node table column.
+        """
+        kind = data[offset]
+        offset += 1
+        if kind == _COL_FLOAT:
+            values, offset = _unpack_array('d', data, offset, count)
+            return values.tolist(), offset
+        if kind == _COL_STR:
+            values, offset = _unpack_array('I', data, offset, count)
+            return list(map(self.strings.__getitem__, values)), offset
+        if kind == _COL_BOOL:
+            values, offset = _unpack_array('B', data, offset, count)
+            return list(map(bool, values)), offset
+        if kind == _COL_INT:
+            values, offset = _unpack_array('q', data, offset, count)
+            return values.tolist(), offset
+        if kind == _COL_NONE:
+            return [None] * count, offset
+        if kind == _COL_VECTOR:
+            is_tuple, elem_kind, size = _VECTOR.unpack_from(data, offset)
+            offset += _VECTOR.size
+            typecode = 'd' if elem_kind else 'q'
+            values, offset = _unpack_array(typecode, data, offset, count * size)
+            flat = iter(values.tolist())
+            rows = list(zip(*[flat] * size))
+            return (rows if is_tuple else list(map(list, rows))), offset
+        if kind == _COL_STRUCT:
+            key_count = _U32.unpack_from(data, offset)[0]
+            keys, offset = _unpack_array('I', data, offset + 4, key_count)
+            return self.read_rows(data, offset, count,
+                                  [self.strings[k] for k in keys])
+        if kind == _COL_LIST:
+            sizes, offset = _unpack_array('I', data, offset, count)
+            ends = list(accumulate(sizes))
+            items, offset = self.read_column(data, offset, ends[-1] if ends else 0)
+            return list(map(items.__getitem__, map(slice, [0] + ends, ends))), offset
+        if kind == _COL_CONST:
+            value, offset = self.read(data, offset)
+            return [value] * count, offset
+        if kind == _COL_VALUES:
+            values = []
+            read = self.read
+            for _ in range(count):
+                value, offset = read(data, offset)
+                values.append(value)
+            return values, offset
+        raise SessionError('Unknown column kind "{}" in session data.'.format(kind))
+
+    def read_rows(self: Self, data: bytes, offset: int, count: int,
+                  keys: list[str]) -> tuple[list[dict[str, Any]], int]:
+        """
+        Read a column per key into a dict per row, constant columns are
+        filled in once on a template copied for every row.
+        """
+        template = dict.fromkeys(keys)
+        columns = []
+        for key in keys:
+            kind = data[offset]
+            if kind == _COL_NONE:
+                offset += 1
+            elif kind == _COL_CONST:
+                template[key], offset = self.read(data, offset + 1)
+            else:
+                column, offset = self.read_column(data, offset, count)
+                columns.append((key, column))
+        copy = template.copy
+        rows = [copy() for _ in range(count)]
+        for key, column in columns:
+            for row, value in zip(rows, column):
+                row[key] = value
+        return rows, offset
+
+    def read_nodes(self: Self, data: bytes, nodes: dict[str, dict[str, Any]]) -> None:
+        """
+        Decode a ``NODE`` chunk into the nodes dict.
+        """
+        node_count, key_count = _GROUP.unpack_from(data, 0)
+        keys, offset = _unpack_array('I', data, _GROUP.size, key_count)
+        keys = [self.strings[k] for k in keys]
+        node_ids, offset = _unpack_array('I', data, offset, node_count)
+        rows, _offset = self.read_rows(data, offset, node_count, keys)
+        nodes.update(zip(map(self.strings.__getitem__, node_ids), rows))
+
+    def read_edges(self: Self, data: bytes, connections: list[dict[str, Any]]) -> None:
+        """
+        Decode an ``EDGE`` chunk into the connections list.
+        """
+        count = _U32.unpack_from(data, 0)[0]
+        edges, _offset = _unpack_array('I', data, 4, count * 4)
+        names = iter(list(map(self.strings.__getitem__, edges)))
+        connections += [
+            {_PORT_IN: [in_id, in_port], _PORT_OUT: [out_id, out_port]}
+            for in_id, in_port, out_id, out_port in zip(names, names, names, names)
+        ]
+
+
+def _batches(values: list[Any]) -> list[list[Any]]:
+    return [values[i:i + _BATCH_SIZE] for i in range(0, len(values), _BATCH_SIZE)]
+
+
+def _write_chunk(file_out: BinaryIO, strings: _StringTable,
+                 tag: bytes, payload: bytes | bytearray) -> None:
+    # strings interned while building the payload go out first.
+    string_chunk = strings.pending_chunk()
+    if string_chunk is not None:
+        file_out.write(_CHUNK.pack(b'STRS', len(string_chunk)))
+        file_out.write(string_chunk)
+    file_out.write(_CHUNK.pack(tag, len(payload)))
+    file_out.write(payload)
+
+
+def dump_session(data: TSerializedData, file_out: BinaryIO) -> None:
+    """
+    Write serialized node graph data as a binary session.
+
+    Args:
+        data (dict): serialized data from ``NodeGraph._serialize``.
+        file_out (BinaryIO): file like object opened in binary mode.
+    """
+    strings = _StringTable()
+    writer = _Writer(strings)
+
+    file_out.write(_HEADER.pack(BINARY_SESSION_MAGIC, BINARY_SESSION_VERSION, 0))
+
+    graph_chunk = bytearray()
+    writer.write(graph_chunk, data.get('graph', {}))
+    _write_chunk(file_out, strings, b'GRPH', graph_chunk)
+
+    # group the nodes by their property keys.
+    nodes = data.get('nodes', {})
+    groups: dict[tuple[str, ...], list[str]] = {}
+    for node_id, node_data in nodes.items():
+        groups.setdefault(tuple(node_data.keys()), []).append(node_id)
+
+    # the node order goes first so the nodes are decoded in place.
+    index = strings.index
+    for node_ids in _batches(list(nodes)):
+        order_chunk = bytearray()
+        _pack_array(order_chunk, array('I', map(index, node_ids)))
+        _write_chunk(file_out, strings, b'ORDR', order_chunk)
+
+    for keys, group_ids in groups.items():
+        for node_ids in _batches(group_ids):
+            node_chunk = bytearray(_GROUP.pack(len(node_ids), len(keys)))
+            _pack_array(node_chunk, array('I', map(index, keys)))
+            _pack_array(node_chunk, array('I', map(index, node_ids)))
+            rows = [nodes[n] for n in node_ids]
+            for key in keys:
+                writer.write_column(node_chunk, [r[key] for r in rows])
+            _write_chunk(file_out, strings, b'NODE', node_chunk)
+
+    # packed edge table.
+    for connections in _batches(data.get('connections', [])):
+        edges = array('I')
+        for connection in connections:
+            in_id, in_port = connection[_PORT_IN]
+            out_id, out_port = connection[_PORT_OUT]
+            edges.extend((index(in_id), index(in_port),
+                          index(out_id), index(out_port)))
+        edge_chunk = bytearray(_U32.pack(len(connections)))
+        _pack_array(edge_chunk, edges)
+        _write_chunk(file_out, strings, b'EDGE', edge_chunk)
+
+    _write_chunk(file_out, strings, b'END ', b'')
+
+
+def _read_exact(file_in: BinaryIO, size: int) -> bytes:
+    data = file_in.read(size)
+    if len(data) != size:
+        raise SessionError('Unexpected end of binary session data.')
+    return data
+
+
+def load_session(file_in: BinaryIO) -> TSerializedData:
+    """
+    Read a binary session into serialized node graph data.
+
+    Args:
+        file_in (BinaryIO): file like object opened in binary mode.
+
+    Returns:
+        dict: serialized data for ``NodeGraph._deserialize``.
+    """
+    magic, version, _flags = _HEADER.unpack(_read_exact(file_in, _HEADER.size))
+    if magic != BINARY_SESSION_MAGIC:
+        raise SessionError('Not a binary node graph session.')
+    if version > BINARY_SESSION_VERSION:
+        raise SessionError(
+            'Unsupported binary session version "{}".'.format(version))
+
+    reader = _Reader()
+    serial_data: TSerializedData = {'graph': {}, 'nodes': {}}
+    nodes: dict[str, dict[str, Any]] = {}
+    connections: list[dict[str, Any]] = []
+
+    # the session data has no reference cycles, don't let the collector
+    # rescan the containers allocated while decoding.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while True:
+            tag, size = _CHUNK.unpack(_read_exact(file_in, _CHUNK.size))
+            payload = _read_exact(file_in, size)
+
+            if tag == b'STRS':
+                reader.read_strings(payload)
+            elif tag == b'NODE':
+                reader.read_nodes(payload, nodes)
+            elif tag == b'EDGE':
+                reader.read_edges(payload, connections)
+            elif tag == b'ORDR':
+                node_ids, _offset = _unpack_array('I', payload, 0, size // 4)
+                nodes.update(dict.fromkeys(map(reader.strings.__getitem__, node_ids)))
+            elif tag == b'GRPH':
+                serial_data['graph'] = reader.read(payload, 0)[0]
+            elif tag == b'END ':
+                break
+            # unknown chunks from newer revisions are skipped.
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    serial_data['nodes'] = nodes
+    if connections:
+        serial_data['connections'] = connections
+
+    return serial_data
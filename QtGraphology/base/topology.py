@@ -0,0 +1,271 @@
+#!/usr/bin/python
+from __future__ import annotations
+from collections.abc import Callable, Iterable
+from typing import Self
+
+
+class TopologicalOrder(object):
+    """
+    Incrementally maintained topological order of the nodes in a graph.
+
+    Uses the Pearce-Kelly dynamic topological sort so a new connection only
+    reorders the nodes between the two connected node indices, and the
+    "would this connection create a cycle" check is bounded by the same
+    affected region instead of walking the whole downstream graph.
+
+    Connections that close a cycle (when the graph isn't acyclic) are kept
+    aside as "back edges" and are ignored by the order.
+
+    Args:
+        successors (Callable): returns the downstream node ids for a node id.
+        predecessors (Callable): returns the upstream node ids for a node id.
+    """
+
+    def __init__(self: Self,
+                 successors: Callable[[str], Iterable[str]],
+                 predecessors: Callable[[str], Iterable[str]]) -> None:
+        self._successors: Callable[[str], Iterable[str]] = successors
+        self._predecessors: Callable[[str], Iterable[str]] = predecessors
+        self._index: dict[str, int] = {}
+        self._next_index: int = 0
+        self._back_edges: set[tuple[str, str]] = set()
+        self._order: list[str] | None = None
+
+    def __repr__(self: Self) -> str:
+        return '<{}({} nodes) object at {}>'.format(
+            self.__class__.__name__, len(self._index), hex(id(self)))
+
+    def __contains__(self: Self, node_id: str) -> bool:
+        return node_id in self._index
+
+    def add_node(self: Self, node_id: str) -> None:
+        """
+        Append a node to the end of the order.
+
+        Args:
+            node_id (str): node id.
+        """
+        if node_id in self._index:
+            return
+        self._index[node_id] = self._next_index
+        self._next_index += 1
+        self._order = None
+
+    def remove_node(self: Self, node_id: str) -> None:
+        """
+        Remove a node from the order.
+
+        Args:
+            node_id (str): node id.
+        """
+        if self._index.pop(node_id, None) is None:
+            return
+        self._back_edges = {
+            e for e in self._back_edges if node_id not in e
+        }
+        self._order = None
+
+    def clear(self: Self) -> None:
+        """
+        Remove all nodes.
+        """
+        self._index.clear()
+        self._back_edges.clear()
+        self._next_index = 0
+        self._order = None
+
+    def index(self: Self, node_id: str) -> int | None:
+        """
+        Returns the current order index of a node, indices are only
+        comparable to each other and aren't contiguous.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            int: order index or None if the node isn't tracked.
+        """
+        return self._index.get(node_id)
+
+    def order(self: Self) -> list[str]:
+        """
+        Returns the node ids in topological order (upstream first).
+
+        Returns:
+            list[str]: node ids.
+        """
+        if self._order is None:
+            self._order = sorted(self._index, key=self._index.__getitem__)
+        return list(self._order)
+
+    def is_acyclic(self: Self) -> bool:
+        """
+        Returns:
+            bool: false if any connection currently closes a cycle.
+        """
+        return not self._back_edges
+
+    def would_create_cycle(self: Self, src_id: str, dst_id: str) -> bool:
+        """
+        Check if a connection from the source node to the destination node
+        would create a cycle.
+
+        Args:
+            src_id (str): upstream (output) node id.
+            dst_id (str): downstream (input) node id.
+
+        Returns:
+            bool: true if the connection would create a cycle. (false if
+                either node isn't in the order, it has no connections)
+        """
+        if src_id == dst_id:
+            return True
+        index = self._index
+        if src_id not in index or dst_id not in index:
+            return False
+        if self._back_edges:
+            # with cycles present the order bounds can't be trusted.
+            return self._reaches(dst_id, src_id, None)
+        upper_bound = index[src_id]
+        if upper_bound < index[dst_id]:
+            return False
+        return self._reaches(dst_id, src_id, upper_bound)
+
+    def add_edge(self: Self, src_id: str, dst_id: str) -> bool:
+        """
+        Update the order for a new connection between two nodes.
+        (call before the connection is visible from the successor functions)
+
+        Args:
+            src_id (str): upstream (output) node id.
+            dst_id (str): downstream (input) node id.
+
+        Returns:
+            bool: false if the connection closes a cycle.
+        """
+        self.add_node(src_id)
+        self.add_node(dst_id)
+        if not self._insert(src_id, dst_id):
+            self._back_edges.add((src_id, dst_id))
+            return False
+        return True
+
+    def remove_edge(self: Self, src_id: str, dst_id: str) -> None:
+        """
+        Update the order for a removed connection between two nodes.
+
+        Args:
+            src_id (str): upstream (output) node id.
+            dst_id (str): downstream (input) node id.
+        """
+        if (src_id, dst_id) in self._back_edges:
+            self._back_edges.discard((src_id, dst_id))
+            return
+        # removing a connection may have opened up a cycle.
+        for edge in list(self._back_edges):
+            self._back_edges.discard(edge)
+            if not self._insert(*edge):
+                self._back_edges.add(edge)
+
+    def _insert(self: Self, src_id: str, dst_id: str) -> bool:
+        """
+        Pearce-Kelly reorder for the "src -> dst" connection.
+
+        Returns:
+            bool: false if the connection closes a cycle.
+        """
+        if src_id == dst_id:
+            return False
+        lower_bound = self._index[dst_id]
+        upper_bound = self._index[src_id]
+        if lower_bound > upper_bound:
+            return True
+
+        forward = self._discover(dst_id, upper_bound, True, src_id)
+        if forward is None:
+            return False
+        backward = self._discover(src_id, lower_bound, False)
+
+        index = self._index
+        forward.sort(key=index.__getitem__)
+        backward.sort(key=index.__getitem__)
+        affected = backward + forward
+        slots = sorted(index[n] for n in affected)
+        for node_id, slot in zip(affected, slots):
+            index[node_id] = slot
+        self._order = None
+        return True
+
+    def _discover(self: Self,
+                  start_id: str,
+                  bound: int,
+                  forward: bool,
+                  target_id: str | None = None) -> list[str] | None:
+        """
+        Collect the nodes reachable from the start node within the affected
+        region of the order.
+
+        Args:
+            start_id (str): node id to start from.
+            bound (int): order index bound of the affected region.
+            forward (bool): walk downstream if true else upstream.
+            target_id (str): node id that makes the search fail when reached.
+
+        Returns:
+            list[str]: visited node ids or None if the target was reached.
+        """
+        index = self._index
+        neighbours = self._successors if forward else self._predecessors
+        back_edges = self._back_edges
+        visited = {start_id}
+        stack = [start_id]
+        while stack:
+            node_id = stack.pop()
+            for other_id in neighbours(node_id):
+                if other_id == target_id:
+                    return None
+                if other_id in visited:
+                    continue
+                edge = (node_id, other_id) if forward else (other_id, node_id)
+                if edge in back_edges:
+                    continue
+                if other_id not in index:
+                    self.add_node(other_id)
+                other_index = index[other_id]
+                if forward and other_index >= bound:
+                    continue
+                if not forward and other_index <= bound:
+                    continue
+                visited.add(other_id)
+                stack.append(other_id)
+        return list(visited)
+
+    def _reaches(self: Self,
+                 start_id: str,
+                 target_id: str,
+                 bound: int | None) -> bool:
+        """
+        Depth first search from the start node for the target node.
+
+        Args:
+            start_id (str): node id to start from.
+            target_id (str): node id to find.
+            bound (int): skip nodes ordered after this index (optional).
+
+        Returns:
+            bool: true if the target node is downstream of the start node.
+        """
+        index = self._index
+        visited = {start_id}
+        stack = [start_id]
+        while stack:
+            for other_id in self._successors(stack.pop()):
+                if other_id == target_id:
+                    return True
+                if other_id in visited:
+                    continue
+                if bound is not None and index.get(other_id, bound + 1) > bound:
+                    continue
+                visited.add(other_id)
+                stack.append(other_id)
+        return False
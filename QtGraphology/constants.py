@@ -41,9 +41,18 @@ Z_VAL_NODE_WIDGET = 3
 # QGraphicsItem.ItemCoordinateCache
 ITEM_CACHE_MODE = QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
 
+# LEVEL OF DETAIL
+# view scale below which the nodes drop to the next detail tier.
+LOD_SCALE_SIMPLIFIED = 0.5
+LOD_SCALE_RECT = 0.25
+LOD_SCALE_CLUSTER = 0.1
+# scene size of the grid cells nodes are aggregated into as cluster blobs.
+LOD_CLUSTER_CELL_SIZE = 600
+
 TCOLOR: TypeAlias =  tuple[int, int, int, int] | tuple[int, int, int]
 TPOSITION: TypeAlias = list[float]
 TSIZE: TypeAlias = tuple[float, float]
+TRECT: TypeAlias = tuple[float, float, float, float]
 TPROPERTY: TypeAlias = TCOLOR | TPOSITION | TSIZE |Enum | int | str | float | bool | None
 TPROPERTIES: TypeAlias = dict[str, TPROPERTY]
 
@@ -96,6 +105,10 @@ class ViewerEnum(Enum):
     GRID_SIZE = 50
     #: grid line color.
     GRID_COLOR = (45, 45, 45)
+    #: virtualized mode spatial index grid cell size.
+    VIRTUAL_CELL_SIZE = 512
+    #: virtualized mode margin around the visible rect. (ratio of the rect size)
+    VIRTUAL_MARGIN = 0.5
 
 
 class ViewerNavEnum(Enum):
@@ -130,6 +143,53 @@ class NodeEnum(Enum):
 # ==================================== PORT ====================================
 
 
+class NodeLODEnum(Enum):
+    """
+    Node level of detail tiers picked from the viewer zoom:
+    :py:mod:`QtGraphology.constants.NodeLODEnum`
+    """
+    #: full detail node.
+    FULL = 0
+    #: node body only, no text, icon, port labels or widgets.
+    SIMPLIFIED = 1
+    #: node drawn as a plain colored rect without ports.
+    RECT = 2
+    #: nodes aggregated into cluster blobs drawn by the viewer.
+    CLUSTER = 3
+
+
+class NodeExecutorEnum(Enum):
+    """
+    Where a node is evaluated by the parallel graph executor:
+    :py:mod:`QtGraphology.constants.NodeExecutorEnum`
+    """
+    #: evaluated on the calling thread (nodes touching Qt objects).
+    MAIN = 'main'
+    #: evaluated in a thread pool (I/O or GIL releasing work).
+    THREAD = 'thread'
+    #: "BaseNode.compute" evaluated in a process pool (CPU bound python).
+    PROCESS = 'process'
+
+
+class NodeAlignEnum(Enum):
+    """
+    Node bulk alignment edges:
+    :py:mod:`QtGraphology.constants.NodeAlignEnum`
+    """
+    #: align the node left edges.
+    LEFT = 'left'
+    #: align the node right edges.
+    RIGHT = 'right'
+    #: align the node top edges.
+    TOP = 'top'
+    #: align the node bottom edges.
+    BOTTOM = 'bottom'
+    #: align the node horizontal centers.
+    CENTER_X = 'center_x'
+    #: align the node vertical centers.
+    CENTER_Y = 'center_y'
+
+
 class PortEnum(Enum):
     """
     Port styling layout:
@@ -25,3 +25,9 @@ class PortError(Exception): pass
 
 
 class PortRegistrationError(Exception): pass
+
+
+class SessionError(Exception): pass
+
+
+class NodeExecutionError(Exception): pass
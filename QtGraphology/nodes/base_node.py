@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from collections import OrderedDict
 from typing import Any, Self
 
@@ -7,7 +8,7 @@ from QtGraphology import Port
 from QtGraphology.base.commands import NodeVisibleCmd, NodeWidgetVisibleCmd
 from QtGraphology.base.node import NodeObject
 from QtGraphology.base.port import Port
-from QtGraphology.constants import NodePropWidgetEnum, PortTypeEnum
+from QtGraphology.constants import NodeExecutorEnum, NodePropWidgetEnum, PortTypeEnum
 from QtGraphology.errors import (
     PortError,
     PortRegistrationError,
@@ -64,15 +65,257 @@ class BaseNode(NodeObject):
 
     NODE_NAME = 'Node'
 
+    #: where the node is evaluated by the parallel graph executor.
+    #: :attr:`QtGraphology.constants.NodeExecutorEnum`
+    EXECUTOR = NodeExecutorEnum.MAIN.value
+
+    #: maximum number of nodes of this type evaluated at the same time by
+    #: the asynchronous graph executor. (None for no limit)
+    MAX_CONCURRENCY = None
+
+    #: create new instances of this node type from a prototype instance
+    #: built once by the node factory instead of calling ``__init__``.
+    #: (only for nodes that build their ports, properties and the built-in
+    #: widgets in ``__init__``, other instance attributes are copied by
+    #: :meth:`BaseNode._clone_state`)
+    PROTOTYPE = False
+
     def __init__(self: Self, qgraphics_item: NodeItem | None=None) -> None:
         super().__init__(qgraphics_item=qgraphics_item or NodeItem)
         self._inputs: list[PortInputNode] = []
         self._outputs: list[PortOutputNode] = []
+        # port items and widgets created whenever the node item is built.
+        self._view_steps: list[tuple] = []
+        # port item colors and hidden widgets kept while the node item
+        # is released.
+        self._port_colors: dict[Port, tuple] = {}
+        self._hidden_widgets: list[str] = []
+        # false once a custom widget instance is embedded in the node item.
+        self._view_releasable: bool = True
+        # steps replayed on the view of the node clones. (prototype only)
+        self._recipe: list[tuple] | None = \
+            [('init', qgraphics_item)] if self.PROTOTYPE else None
+
+    def clone(self: Self) -> BaseNode | None:
+        """
+        Create a new node from this node used as a prototype, the model is
+        copied and the port items and widgets recorded while the prototype
+        was built are recreated without calling the node ``__init__``.
+        (used internally by the node factory see :attr:`BaseNode.PROTOTYPE`)
+
+        Returns:
+            QtGraphology.BaseNode: new node or None if the node can't be
+                cloned (custom widgets or deleted ports).
+        """
+        recipe = self._recipe
+        if recipe is None:
+            return None
+        node = self.__class__.__new__(self.__class__)
+        BaseNode.__init__(node, recipe[0][1])
+        node._recipe = None
+        node._clone_state(self)
+
+        model = self._model.clone()
+        node._model = model
+        for step, *args in recipe[1:]:
+            if step == 'widget':
+                node._view_steps.append((step, *args))
+                continue
+            port_args, color = args
+            if step == 'input':
+                source = self._model.inputs[port_args[0]]
+                ports, port_models = node._inputs, model.inputs
+            else:
+                source = self._model.outputs[port_args[0]]
+                ports, port_models = node._outputs, model.outputs
+            port = Port(node=node, port_item=None)
+            port.model.type = source.type
+            port.model.name = source.name
+            port.model.display_name = source.display_name
+            port.model.multi_connection = source.multi_connection
+            port.model.locked = source.locked
+            port.model.data_type = source.data_type
+            ports.append(port)
+            port_models[port.name()] = port.model
+            node._view_steps.append((step, port_args, color, port))
+        return node
+
+    def _clone_state(self: Self, prototype: BaseNode) -> None:
+        """
+        Copy the instance attributes a node subclass sets in ``__init__``
+        from the prototype onto this clone, the attributes are deep copied
+        so nested lists and dicts aren't shared between the node instances.
+        (override it for attributes that can't be deep copied)
+
+        Args:
+            prototype (QtGraphology.BaseNode): node this node is cloned from.
+        """
+        # references back to the prototype point to the clone instead.
+        memo: dict[int, Any] = {id(prototype): self}
+        for name, value in prototype.__dict__.items():
+            if name not in self.__dict__:
+                self.__dict__[name] = copy.deepcopy(value, memo)
+
+    def _populate_view(self) -> None:
+        """
+        Create the recorded port items and widgets in a newly built node
+        item, the port item states are synced from the port models.
+        """
+        view = self._view
+        port_colors, self._port_colors = self._port_colors, {}
+        for step, *args in self._view_steps:
+            if step == 'widget':
+                self._create_widget(*args)
+                continue
+            port_args, color, port = args
+            port_item = self._create_port_item(step, port_args, color)
+            if port in port_colors:
+                port_item.color, port_item.border_color = port_colors[port]
+            port._set_view(port_item)
+            if port_item.locked != port.model.locked:
+                port_item.locked = port.model.locked
+            if not port.model.visible:
+                port_item.setVisible(False)
+                if step == 'input':
+                    text_item = view.get_input_text_item(port_item)
+                else:
+                    text_item = view.get_output_text_item(port_item)
+                if text_item:
+                    text_item.setVisible(False)
+        hidden_widgets, self._hidden_widgets = self._hidden_widgets, []
+        for name in hidden_widgets:
+            view.get_widget(name).setVisible(False)
+
+    def release_view(self) -> None:
+        """
+        Sync the node model from the node item and drop the node item, it's
+        built again from the node model on the next :attr:`NodeObject.view`
+        access. (nodes with a custom widget always keep their node item)
+        """
+        if self._view_releasable:
+            super().release_view()
+
+    def _release_view(self) -> None:
+        """
+        Drop the port items of the released node item, the port colors and
+        hidden widgets are kept for when the node item is built again.
+        """
+        self._hidden_widgets = [
+            name for name, widget in self._view.widgets.items()
+            if not widget.isVisible()
+        ]
+        for port in self._inputs + self._outputs:
+            if not port.has_view():
+                continue
+            port_item = port.view
+            self._port_colors[port] = (port_item.color, port_item.border_color)
+            port._set_view(None)
+
+    def _create_port_item(self, step, port_args, color):
+        """
+        Create a port item in the node item.
+        (used internally by the node)
+
+        Args:
+            step (str): "input" or "output".
+            port_args (list): port item arguments.
+            color (tuple): port color (r, g, b) ``0-255``.
+
+        Returns:
+            PortItem: port item.
+        """
+        if step == 'input':
+            port_item = self._view.add_input(*port_args)
+        else:
+            port_item = self._view.add_output(*port_args)
+        if color:
+            port_item.color = color
+            port_item.border_color = [min([255, max([0, i + 80])]) for i in color]
+        return port_item
+
+    def _create_widget(self, widget_cls, widget_args, tooltip):
+        """
+        Create a built-in node widget in the node item.
+        (used internally by the node)
+
+        Args:
+            widget_cls (type): node widget class.
+            widget_args (tuple): widget arguments after the parent item.
+            tooltip (str): widget tooltip.
+
+        Returns:
+            NodeBaseWidget: node widget.
+        """
+        widget = widget_cls(self._view, *widget_args)
+        widget.setToolTip(tooltip or "")
+        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
+        self._view.add_widget(widget)
+        return widget
+
+    def _add_widget(self, widget_cls, widget_args, tooltip):
+        """
+        Add a built-in node widget, the widget is recorded for whenever the
+        node item is built and created right away if the node item exists.
+        (used internally by the node)
+
+        Args:
+            widget_cls (type): node widget class.
+            widget_args (tuple): widget arguments after the parent item.
+            tooltip (str): widget tooltip.
+        """
+        if self._recipe is not None:
+            self._recipe.append(('widget', widget_cls, widget_args, tooltip))
+        self._view_steps.append(('widget', widget_cls, widget_args, tooltip))
+        if self._view is None:
+            return
+        self._create_widget(widget_cls, widget_args, tooltip)
+        #: redraw node to address calls outside the "__init__" func.
+        self._view.draw_node()
+
+    def _add_port(self, step, port_args, color, port):
+        """
+        Record the port item of a new port for whenever the node item is
+        built and create it right away if the node item exists.
+        (used internally by the node)
+
+        Args:
+            step (str): "input" or "output".
+            port_args (list): port item arguments.
+            color (tuple): port color (r, g, b) ``0-255``.
+            port (QtGraphology.Port): port object.
+        """
+        if self._recipe is not None:
+            self._recipe.append((step, tuple(port_args), color))
+        self._view_steps.append((step, tuple(port_args), color, port))
+        if self._view is None:
+            return
+        port._set_view(self._create_port_item(step, port_args, color))
+
+    def _remove_port_view(self, port):
+        """
+        Drop a port from the recorded steps and delete its port item.
+        (used internally by the node)
+
+        Args:
+            port (QtGraphology.Port): port object.
+        """
+        self._view_steps = [s for s in self._view_steps
+                            if s[0] == 'widget' or s[3] is not port]
+        self._port_colors.pop(port, None)
+        if self._view is None:
+            return
+        if port.type_() == PortTypeEnum.IN.value:
+            self._view.delete_input(port.view)
+        else:
+            self._view.delete_output(port.view)
+        port._set_view(None)
 
     def update_model(self) -> None:
         """
         Update the node model from view.
         """
+        if self._view is None:
+            return
         reserved_names: list[str] = [
             "inputs",
             "outputs",
@@ -107,9 +350,9 @@ class BaseNode(NodeObject):
                 else:
                     undo_cmd.redo()
                 return
-        elif name == 'disabled':
+        elif name == 'disabled' and self._view is not None:
             # redraw the connected pipes in the scene.
-            ports = self.view.inputs + self.view.outputs
+            ports = self._view.inputs + self._view.outputs
             for port in ports:
                 for pipe in port.connected_pipes:
                     pipe.update()
@@ -136,7 +379,8 @@ class BaseNode(NodeObject):
         # base logic to update the model and view attributes only.
         super(BaseNode, self).set_layout_direction(value)
         # redraw the node.
-        self._view.draw_node()
+        if self._view is not None:
+            self._view.draw_node()
 
     def set_icon(self, icon=None):
         """
@@ -218,6 +462,10 @@ class BaseNode(NodeObject):
         widget.value_changed.connect(lambda k, v: self.set_property(k, v))
         widget._node = self
         self.view.add_widget(widget)
+        # custom widget instances can't be recreated for the clones or
+        # when a released node item is built again.
+        self._recipe = None
+        self._view_releasable = False
         #: redraw node to address calls outside the "__init__" func.
         self.view.draw_node()
 
@@ -246,12 +494,7 @@ class BaseNode(NodeObject):
             widget_tooltip=tooltip,
             tab=tab,
         )
-        widget = NodeComboBox(self.view, name, label, items)
-        widget.setToolTip(tooltip or "")
-        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
-        self.view.add_widget(widget)
-        #: redraw node to address calls outside the "__init__" func.
-        self.view.draw_node()
+        self._add_widget(NodeComboBox, (name, label, list(items or [])), tooltip)
 
     def add_text_input(
             self,
@@ -284,12 +527,7 @@ class BaseNode(NodeObject):
             widget_tooltip=tooltip,
             tab=tab
         )
-        widget = NodeLineEdit(self.view, name, label, text, placeholder_text)
-        widget.setToolTip(tooltip or "")
-        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
-        self.view.add_widget(widget)
-        #: redraw node to address calls outside the "__init__" func.
-        self.view.draw_node()
+        self._add_widget(NodeLineEdit, (name, label, text, placeholder_text), tooltip)
 
     def add_checkbox(self, name, label='', text='', state=False, tooltip=None, tab=None):
         """
@@ -316,12 +554,7 @@ class BaseNode(NodeObject):
             widget_tooltip=tooltip,
             tab=tab,
         )
-        widget = NodeCheckBox(self.view, name, label, text, state)
-        widget.setToolTip(tooltip or "")
-        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
-        self.view.add_widget(widget)
-        #: redraw node to address calls outside the "__init__" func.
-        self.view.draw_node()
+        self._add_widget(NodeCheckBox, (name, label, text, state), tooltip)
 
     def hide_widget(self, name: str, push_undo=True):
         """
@@ -368,7 +601,7 @@ class BaseNode(NodeObject):
             undo_cmd.redo()
 
     def add_input(self, name='input', multi_input: bool=False, display_name=True,
-                  color=None, locked=False, painter_func=None) -> Port:
+                  color=None, locked=False, painter_func=None, data_type=None) -> Port:
         """
         Add input :class:`Port` to node.
 
@@ -383,6 +616,8 @@ class BaseNode(NodeObject):
             locked (bool): locked state see :meth:`Port.set_locked`
             painter_func (function or None): custom function to override the drawing
                 of the port shape see example: :ref:`Creating Custom Shapes`
+            data_type (type): type of the values accepted when the graph is
+                executed, ``None`` accepts any value.
 
         Returns:
             QtGraphology.Port: the created port object.
@@ -395,24 +630,20 @@ class BaseNode(NodeObject):
         if painter_func and callable(painter_func):
             port_args.append(painter_func)
 
-        port_item: PortItem = self.view.add_input(*port_args)
-
-        if color:
-            port_item.color = color
-            port_item.border_color = [min([255, max([0, i + 80])]) for i in color]
-
-        port = Port(node=self, port_item=port_item)
-        port.model.type_ = PortTypeEnum.IN
+        port = Port(node=self, port_item=None)
+        self._add_port('input', port_args, color, port)
+        port.model.type = PortTypeEnum.IN.value
         port.model.name = name
         port.model.display_name = display_name
         port.model.multi_connection = multi_input
         port.model.locked = locked
+        port.model.data_type = data_type
         self._inputs.append(port)
         self.model.inputs[port.name()] = port.model
         return port
 
     def add_output(self, name='output', multi_output=True, display_name=True,
-                   color=None, locked=False, painter_func=None):
+                   color=None, locked=False, painter_func=None, data_type=None):
         """
         Add output :class:`Port` to node.
 
@@ -427,6 +658,8 @@ class BaseNode(NodeObject):
             locked (bool): locked state see :meth:`Port.set_locked`
             painter_func (function or None): custom function to override the drawing
                 of the port shape see example: :ref:`Creating Custom Shapes`
+            data_type (type): type of the values produced when the graph is
+                executed, ``None`` produces any value.
 
         Returns:
             QtGraphology.Port: the created port object.
@@ -438,17 +671,15 @@ class BaseNode(NodeObject):
         port_args = [name, multi_output, display_name, locked]
         if painter_func and callable(painter_func):
             port_args.append(painter_func)
-        view = self.view.add_output(*port_args)
 
-        if color:
-            view.color = color
-            view.border_color = [min([255, max([0, i + 80])]) for i in color]
-        port: Port = Port(self, view)
-        port.model.type_ = PortTypeEnum.OUT.value
+        port: Port = Port(self, None)
+        self._add_port('output', port_args, color, port)
+        port.model.type = PortTypeEnum.OUT.value
         port.model.name = name
         port.model.display_name = display_name
         port.model.multi_connection = multi_output
         port.model.locked = locked
+        port.model.data_type = data_type
         self._outputs.append(port)
         self.model.outputs[port.name()] = port.model
         return port
@@ -511,9 +742,13 @@ class BaseNode(NodeObject):
             raise PortError('Error: Can\'t delete a port that is locked!')
         self._inputs.remove(port)
         self._model.inputs.pop(port.name())
-        self._view.delete_input(port.view)
+        if self.graph is not None:
+            self.graph.model.remove_port(port.model)
+        self._remove_port_view(port)
         port.model.node = None
-        self._view.draw_node()
+        if self._view is not None:
+            self._view.draw_node()
+        self._recipe = None
 
     def delete_output(self, port):
         """
@@ -541,9 +776,13 @@ class BaseNode(NodeObject):
             raise PortError('Error: Can\'t delete a port that is locked!')
         self._outputs.remove(port)
         self._model.outputs.pop(port.name())
-        self._view.delete_output(port.view)
+        if self.graph is not None:
+            self.graph.model.remove_port(port.model)
+        self._remove_port_view(port)
         port.model.node = None
-        self._view.draw_node()
+        if self._view is not None:
+            self._view.draw_node()
+        self._recipe = None
 
     def set_port_deletion_allowed(self, mode=False):
         """
@@ -611,15 +850,20 @@ class BaseNode(NodeObject):
                 '"set_port_deletion_allowed" is not enabled on this node.')
 
         for port in self._inputs:
-            self._view.delete_input(port.view)
+            self._remove_port_view(port)
+            if self.graph is not None:
+                self.graph.model.remove_port(port.model)
             port.model.node = None
         for port in self._outputs:
-            self._view.delete_output(port.view)
+            self._remove_port_view(port)
+            if self.graph is not None:
+                self.graph.model.remove_port(port.model)
             port.model.node = None
         self._inputs = []
         self._outputs = []
         self._model.outputs = {}
         self._model.inputs = {}
+        self._recipe = None
 
         [self.add_input(name=port['name'],
                         multi_input=port['multi_connection'],
@@ -631,7 +875,8 @@ class BaseNode(NodeObject):
                          display_name=port['display_name'],
                          locked=port.get('locked') or False)
          for port in port_data['output_ports']]
-        self._view.draw_node()
+        if self._view is not None:
+            self._view.draw_node()
 
     def inputs(self):
         """
@@ -859,3 +1104,46 @@ class BaseNode(NodeObject):
             out_port (QtGraphology.Port): output port that was disconnected.
         """
         return
+
+    def run(self, inputs):
+        """
+        Evaluate the node when the node graph is executed.
+
+        *The default of this function calls* :meth:`BaseNode.compute` *with
+        the node custom properties, re-implement if the node needs access
+        to the node object.*
+
+        See Also:
+            :class:`QtGraphology.base.executor.GraphExecutor`
+
+        Args:
+            inputs (dict): {<input_port_name>: <value>} a multi input port
+                gets the list of values from the connected ports.
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        return self.compute(self.model.custom_properties, inputs)
+
+    @staticmethod
+    def compute(properties, inputs):
+        """
+        Compute the node output values.
+
+        *The default of this function does nothing re-implement to produce
+        the node output values.*
+
+        Note:
+            this function has no access to the node object so it can be
+            evaluated outside of the main thread. It can be re-implemented
+            as a coroutine (``async def``) for I/O bound nodes evaluated by
+            the :class:`QtGraphology.base.async_executor.AsyncGraphExecutor`.
+
+        Args:
+            properties (dict): node custom property names and values.
+            inputs (dict): {<input_port_name>: <value>}
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        return {}
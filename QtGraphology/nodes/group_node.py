@@ -111,40 +111,42 @@ class GroupNode(BaseNode):
                         break
 
     def add_input(self, name='input', multi_input=False, display_name=True,
-                  color=None, locked=False, painter_func=None):
+                  color=None, locked=False, painter_func=None, data_type=None):
         port = super(GroupNode, self).add_input(
             name=name,
             multi_input=multi_input,
             display_name=display_name,
             color=color,
             locked=locked,
-            painter_func=painter_func
+            painter_func=painter_func,
+            data_type=data_type
         )
         if self.is_expanded:
             input_node = PortInputNode(parent_port=port)
             input_node.NODE_NAME = port.name()
             input_node.model.set_property('name', port.name())
-            input_node.add_output(port.name())
+            input_node.add_output(port.name(), data_type=port.data_type())
             sub_graph = self.get_sub_graph()
             sub_graph.add_node(input_node, selected=False, push_undo=False)
 
         return port
 
     def add_output(self, name='output', multi_output=True, display_name=True,
-                   color=None, locked=False, painter_func=None):
+                   color=None, locked=False, painter_func=None, data_type=None):
         port = super(GroupNode, self).add_output(
             name=name,
             multi_output=multi_output,
             display_name=display_name,
             color=color,
             locked=locked,
-            painter_func=painter_func
+            painter_func=painter_func,
+            data_type=data_type
         )
         if self.is_expanded:
             output_port = PortOutputNode(parent_port=port)
             output_port.NODE_NAME = port.name()
             output_port.model.set_property('name', port.name())
-            output_port.add_input(port.name())
+            output_port.add_input(port.name(), data_type=port.data_type())
             sub_graph = self.get_sub_graph()
             sub_graph.add_node(output_port, selected=False, push_undo=False)
 
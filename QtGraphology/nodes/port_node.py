@@ -41,7 +41,7 @@ class PortInputNode(BaseNode):
         return self._parent_port
 
     def add_input(self: Self, name: str='input', multi_input: bool=False, display_name: bool=True,
-                  color: Any=None, locked: bool=False, painter_func: Any=None) -> NoReturn:
+                  color: Any=None, locked: bool=False, painter_func: Any=None, data_type: Any=None) -> NoReturn:
         """
         Warnings:
             This is not available for the ``PortInputNode`` class.
@@ -50,7 +50,7 @@ class PortInputNode(BaseNode):
 
 
     def add_output(self, name='output', multi_output=True, display_name=True,
-                   color=None, locked=False, painter_func=None):
+                   color=None, locked=False, painter_func=None, data_type=None):
         """
         Warnings:
             This function is called by :meth:`QtGraphology.SubGraph.expand_group_node`
@@ -65,7 +65,8 @@ class PortInputNode(BaseNode):
             display_name=False,
             color=color,
             locked=locked,
-            painter_func=None
+            painter_func=None,
+            data_type=data_type
         )
 
 
@@ -103,7 +104,7 @@ class PortOutputNode(BaseNode):
         return self._parent_port
 
     def add_input(self, name='input', multi_input=False, display_name=True,
-                  color=None, locked=False, painter_func=None):
+                  color=None, locked=False, painter_func=None, data_type=None):
         """
         Warnings:
             This function is called by :meth:`QtGraphology.SubGraph.expand_group_node`
@@ -120,11 +121,12 @@ class PortOutputNode(BaseNode):
             display_name=False,
             color=color,
             locked=locked,
-            painter_func=None
+            painter_func=None,
+            data_type=data_type
         )
 
     def add_output(self, name='output', multi_output=True, display_name=True,
-                   color=None, locked=False, painter_func=None):
+                   color=None, locked=False, painter_func=None, data_type=None):
         """
         Warnings:
             This is not available for the ``PortOutputNode`` class.
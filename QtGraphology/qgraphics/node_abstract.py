@@ -65,6 +65,8 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         }
         self._width: float = NodeEnum.WIDTH.value
         self._height: float = NodeEnum.HEIGHT.value
+        # viewer tracking the node when it's in virtualized mode.
+        self._virtual_viewer: NodeViewer | None = None
 
     def __repr__(self: Self) -> str:
         return f'{self.__module__}.{self.__class__.__name__}(\'{self.name}\')'
@@ -226,6 +228,8 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         """
         pos = pos or [0.0, 0.0]
         self.setPos(pos[0], pos[1])
+        if self._virtual_viewer:
+            self._virtual_viewer.update_virtual_node(self)
 
     @property
     def name(self: Self) -> str:
@@ -265,12 +269,15 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
             QtGraphology.widgets.viewer.NodeViewer: viewer object.
         """
         if self.scene():
-            return self.scene.viewer() # type: ignore
+            return self.scene().viewer() # type: ignore
+        return self._virtual_viewer
 
     def delete(self) -> None:
         """
         remove node view from the scene.
         """
+        if self._virtual_viewer:
+            self._virtual_viewer.remove_virtual_node(self.id)
         if self.scene():
             self.scene().removeItem(self)
 
@@ -12,6 +12,7 @@ from QtGraphology.constants import (
     ICON_NODE_BASE,
     LayoutDirectionEnum,
     NodeEnum,
+    NodeLODEnum,
     PortEnum,
     PortTypeEnum,
     Z_VAL_NODE,
@@ -50,7 +51,7 @@ class NodeItem(AbstractNodeItem):
         self._output_items = OrderedDict()
         self._widgets = OrderedDict()
         self._proxy_mode = False
-        self._proxy_mode_threshold = 70
+        self._lod = NodeLODEnum.FULL
 
     def _post_init(self, viewer: Optional[NodeViewer] = None, pos: Optional[TPOSITION] = None) -> None:
         """
@@ -121,7 +122,7 @@ class NodeItem(AbstractNodeItem):
                                     rect.width(), rect.height())
 
         pen = QtGui.QPen(border_color, border_width)
-        pen.setCosmetic(self.viewer().get_zoom() < 0.0)
+        pen.setCosmetic(self.scene().zoom < 0.0)
         path = QtGui.QPainterPath()
         path.addRoundedRect(border_rect, radius, radius)
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
@@ -178,13 +179,32 @@ class NodeItem(AbstractNodeItem):
                                     rect.width(), rect.height())
 
         pen = QtGui.QPen(border_color, border_width)
-        pen.setCosmetic(self.viewer().get_zoom() < 0.0)
+        pen.setCosmetic(self.scene().zoom < 0.0)
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
         painter.setPen(pen)
         painter.drawRoundedRect(border_rect, radius, radius)
 
         painter.restore()
 
+    def _paint_simplified(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem, widget: Optional[QtWidgets.QWidget]) -> None:
+        painter.save()
+        if self.selected:
+            pen = QtGui.QPen(QtGui.QColor(*NodeEnum.SELECTED_BORDER_COLOR.value), 1.2)
+        else:
+            pen = QtGui.QPen(QtGui.QColor(*self.border_color), 0.8)
+        pen.setCosmetic(True)
+        painter.setPen(pen)
+        painter.setBrush(QtGui.QColor(*self.color))
+        painter.drawRect(self.boundingRect().adjusted(1.0, 1.0, -1.0, -1.0))
+        painter.restore()
+
+    def _paint_rect(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem, widget: Optional[QtWidgets.QWidget]) -> None:
+        if self.selected:
+            color = NodeEnum.SELECTED_BORDER_COLOR.value
+        else:
+            color = self.color
+        painter.fillRect(self.boundingRect(), QtGui.QColor(*color))
+
     def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem, widget: Optional[QtWidgets.QWidget]) -> None:
         """
         Draws the node base not the ports.
@@ -195,6 +215,16 @@ class NodeItem(AbstractNodeItem):
             widget (QtWidgets.QWidget): not used.
         """
         self.auto_switch_mode()
+        lod = self._lod
+        if lod is NodeLODEnum.CLUSTER:
+            # drawn by the viewer as part of a cluster blob.
+            return
+        if lod is NodeLODEnum.RECT:
+            self._paint_rect(painter, option, widget)
+            return
+        if lod is NodeLODEnum.SIMPLIFIED:
+            self._paint_simplified(painter, option, widget)
+            return
         if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
             self._paint_horizontal(painter, option, widget)
         elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
@@ -741,21 +771,34 @@ class NodeItem(AbstractNodeItem):
 
     def auto_switch_mode(self) -> None:
         """
-        Decide whether to draw the node with proxy mode.
+        Sync the node level of detail with the tier the viewer picked for
+        the current zoom.
         (this is called at the start in the "self.paint()" function.)
         """
-        if ITEM_CACHE_MODE is QtWidgets.QGraphicsItem.ItemCoordinateCache:
-            return
+        scene = self.scene()
+        if scene is not None:
+            self.set_lod(scene.lod)
+
+    def set_lod(self, lod: NodeLODEnum) -> None:
+        """
+        Set the node level of detail tier, anything below full detail draws
+        the node in proxy mode.
 
-        rect = self.sceneBoundingRect()
-        l = self.viewer().mapToGlobal(
-            self.viewer().mapFromScene(rect.topLeft()))
-        r = self.viewer().mapToGlobal(
-            self.viewer().mapFromScene(rect.topRight()))
-        # width is the node width in screen
-        width = r.x() - l.x()
+        Args:
+            lod (NodeLODEnum): level of detail tier.
+        """
+        if lod is self._lod:
+            return
+        self._lod = lod
+        self.set_proxy_mode(lod is not NodeLODEnum.FULL)
 
-        self.set_proxy_mode(width < self._proxy_mode_threshold)
+    @property
+    def lod(self) -> NodeLODEnum:
+        """
+        Returns:
+            NodeLODEnum: current level of detail tier.
+        """
+        return self._lod
 
     def set_proxy_mode(self, mode: bool) -> None:
         """
@@ -1000,8 +1043,9 @@ class NodeItem(AbstractNodeItem):
         """
         port.setParentItem(None)
         text.setParentItem(None)
-        self.scene().removeItem(port)
-        self.scene().removeItem(text)
+        if self.scene():
+            self.scene().removeItem(port)
+            self.scene().removeItem(text)
         del port
         del text
 
@@ -204,6 +204,34 @@ class CircleNodeItem(NodeItem):
                     port_x += (port_width / 2) + delta
                     port_y -= (port_height / 2)
 
+    def _circle_rect(self):
+        rect = self.boundingRect()
+        width = min(rect.width(), rect.height()) / 1.8
+        return QtCore.QRectF(
+            rect.center().x() - (width / 2),
+            rect.center().y() - (width / 2),
+            width, width
+        )
+
+    def _paint_simplified(self, painter, option, widget):
+        painter.save()
+        if self.selected:
+            pen = QtGui.QPen(QtGui.QColor(*NodeEnum.SELECTED_BORDER_COLOR.value), 1.2)
+        else:
+            pen = QtGui.QPen(QtGui.QColor(*self.border_color), 0.8)
+        pen.setCosmetic(True)
+        painter.setPen(pen)
+        painter.setBrush(QtGui.QColor(*self.color))
+        painter.drawEllipse(self._circle_rect())
+        painter.restore()
+
+    def _paint_rect(self, painter, option, widget):
+        if self.selected:
+            color = NodeEnum.SELECTED_BORDER_COLOR.value
+        else:
+            color = self.color
+        painter.fillRect(self._circle_rect(), QtGui.QColor(*color))
+
     def _paint_horizontal(self, painter, option, widget):
         painter.save()
 
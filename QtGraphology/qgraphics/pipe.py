@@ -8,6 +8,7 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 from QtGraphology.constants import (
     LayoutDirectionEnum,
+    NodeLODEnum,
     PipeEnum,
     PipeLayoutEnum,
     PortTypeEnum,
@@ -26,6 +27,68 @@ PIPE_STYLES = {
 }
 
 
+def compute_pipe_geometry(endpoints, direction, layout):
+    """
+    Compute the path geometry for many pipes in one pass without touching
+    any graphics items.
+
+    The curved and angled paths are point symmetric around the middle of
+    the two end points so the direction pointer position and angle are
+    solved directly instead of sampling the painter path.
+
+    Args:
+        endpoints (list[tuple]): rows of
+            (x1, y1, x2, y2, start_is_input, node_width, node_height).
+        direction (int): layout direction.
+        layout (int): pipe layout mode.
+
+    Returns:
+        list[tuple]: rows of (control_points, mid_x, mid_y, degrees, dist)
+            where the control points are (c1x, c1y, c2x, c2y) or None for
+            a straight pipe.
+    """
+    vertical = direction == LayoutDirectionEnum.VERTICAL.value
+    straight = layout == PipeLayoutEnum.STRAIGHT.value
+    curved = layout == PipeLayoutEnum.CURVED.value
+    hypot, atan2, degrees = math.hypot, math.atan2, math.degrees
+
+    geometry = []
+    for x1, y1, x2, y2, start_is_input, node_w, node_h in endpoints:
+        mid_x, mid_y = (x1 + x2) * 0.5, (y1 + y2) * 0.5
+        chord = hypot(x2 - x1, y2 - y1)
+        if straight:
+            ctrl = None
+            dx, dy = x2 - x1, y2 - y1
+            length = chord
+        else:
+            sign = -1.0 if start_is_input else 1.0
+            if vertical:
+                offset = abs(y1 - y2)
+                offset = min(offset, node_h) if curved else offset * 0.5
+                ctrl = (x1, y1 + sign * offset, x2, y2 - sign * offset)
+            else:
+                offset = abs(x1 - x2)
+                offset = min(offset, node_w) if curved else offset * 0.5
+                ctrl = (x1 + sign * offset, y1, x2 - sign * offset, y2)
+            c1x, c1y, c2x, c2y = ctrl
+            polygon = (hypot(c1x - x1, c1y - y1) +
+                       hypot(c2x - c1x, c2y - c1y) +
+                       hypot(x2 - c2x, y2 - c2y))
+            if curved:
+                # bezier tangent at t=0.5 and approximated arc length.
+                dx = 0.75 * (c1x - x1 + x2 - c2x) + 1.5 * (c2x - c1x)
+                dy = 0.75 * (c1y - y1 + y2 - c2y) + 1.5 * (c2y - c1y)
+                length = (chord + polygon) * 0.5
+            else:
+                dx, dy = c2x - c1x, c2y - c1y
+                if not (dx or dy):
+                    dx, dy = x2 - x1, y2 - y1
+                length = polygon
+        angle = degrees(atan2(dy, dx)) - 90
+        geometry.append((ctrl, mid_x, mid_y, angle, length * 0.01))
+    return geometry
+
+
 class PipeItem(QtWidgets.QGraphicsPathItem):
     """
     Base Pipe item used for drawing node connections.
@@ -44,6 +107,8 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         self._highlight: bool = False
         self._input_port: 'PortItem' | None = input_port # type: ignore
         self._output_port: 'PortItem' | None = output_port # type: ignore
+        # key of the inputs the current path geometry was built from.
+        self._path_key: tuple | None = None
 
         size: float = 6.0
         self._poly: QtGui.QPolygonF = QtGui.QPolygonF()
@@ -94,6 +159,10 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
+        if self.scene().lod is NodeLODEnum.CLUSTER:
+            # nodes are drawn as cluster blobs by the viewer.
+            return
+
         painter.save()
 
         pen = self.pen()
@@ -127,6 +196,25 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             self._dir_pointer.setVisible(False)
             return
 
+        loc_pt: QtCore.QPointF = self.path().pointAtPercent(0.49)
+        tgt_pt: QtCore.QPointF = self.path().pointAtPercent(0.51)
+        cen_pt: QtCore.QPointF = self.path().pointAtPercent(0.5)
+        radians = math.atan2(tgt_pt.y() - loc_pt.y(),
+                             tgt_pt.x() - loc_pt.x())
+        degrees = math.degrees(radians) - 90
+        dist: float = math.hypot(tgt_pt.x() - cen_pt.x(), tgt_pt.y() - cen_pt.y())
+        self._place_direction_pointer(cen_pt, degrees, dist)
+
+    def _place_direction_pointer(self: Self, pos: QtCore.QPointF, degrees: float, dist: float) -> None:
+        """
+        Position the pipe direction pointer arrow.
+
+        Args:
+            pos (QtCore.QPointF): pipe middle point.
+            degrees (float): arrow rotation.
+            dist (float): path length around the middle point used to
+                shrink or hide the arrow on short pipes.
+        """
         if self.disabled():
             if not (self._active or self._highlight):
                 color: QtGui.QColor = QtGui.QColor(*PipeEnum.DISABLED_COLOR.value)
@@ -135,18 +223,8 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
                 self._dir_pointer.setPen(pen)
                 self._dir_pointer.setBrush(color.darker(200))
 
-        self._dir_pointer.setVisible(True)
-        loc_pt: QtCore.QPointF = self.path().pointAtPercent(0.49)
-        tgt_pt: QtCore.QPointF = self.path().pointAtPercent(0.51)
-        radians = math.atan2(tgt_pt.y() - loc_pt.y(),
-                             tgt_pt.x() - loc_pt.x())
-        degrees = math.degrees(radians) - 90
         self._dir_pointer.setRotation(degrees)
-        self._dir_pointer.setPos(self.path().pointAtPercent(0.5))
-
-        cen_x: float = self.path().pointAtPercent(0.5).x()
-        cen_y: float = self.path().pointAtPercent(0.5).y()
-        dist: float = math.hypot(tgt_pt.x() - cen_x, tgt_pt.y() - cen_y)
+        self._dir_pointer.setPos(pos)
 
         self._dir_pointer.setVisible(True)
         if dist < 0.3:
@@ -207,7 +285,7 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         path.lineTo(end_pos)
         self.setPath(path)
 
-    def _draw_path_vertical(self, start_port, pos1, pos2, path):
+    def _draw_path_vertical(self, start_port, pos1, pos2, path, layout=None):
         """
         Draws the vertical path between ports.
 
@@ -216,8 +294,11 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             pos1 (QPointF): start port position.
             pos2 (QPointF): end port position.
             path (QPainterPath): path to draw.
+            layout (int): pipe layout mode. (optional)
         """
-        if self.viewer_pipe_layout() == PipeLayoutEnum.CURVED.value:
+        if layout is None:
+            layout = self.viewer_pipe_layout()
+        if layout == PipeLayoutEnum.CURVED.value:
             ctr_offset_y1, ctr_offset_y2 = pos1.y(), pos2.y()
             tangent = abs(ctr_offset_y1 - ctr_offset_y2)
 
@@ -234,7 +315,7 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             ctr_point2 = QtCore.QPointF(pos2.x(), ctr_offset_y2)
             path.cubicTo(ctr_point1, ctr_point2, pos2)
             self.setPath(path)
-        elif self.viewer_pipe_layout() == PipeLayoutEnum.ANGLE.value:
+        elif layout == PipeLayoutEnum.ANGLE.value:
             ctr_offset_y1, ctr_offset_y2 = pos1.y(), pos2.y()
             distance = abs(ctr_offset_y1 - ctr_offset_y2)/2
             if start_port.port_type == PortTypeEnum.IN.value:
@@ -251,7 +332,7 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             path.lineTo(pos2)
             self.setPath(path)
 
-    def _draw_path_horizontal(self, start_port, pos1, pos2, path):
+    def _draw_path_horizontal(self, start_port, pos1, pos2, path, layout=None):
         """
         Draws the horizontal path between ports.
 
@@ -260,8 +341,11 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             pos1 (QPointF): start port position.
             pos2 (QPointF): end port position.
             path (QPainterPath): path to draw.
+            layout (int): pipe layout mode. (optional)
         """
-        if self.viewer_pipe_layout() == PipeLayoutEnum.CURVED.value:
+        if layout is None:
+            layout = self.viewer_pipe_layout()
+        if layout == PipeLayoutEnum.CURVED.value:
             ctr_offset_x1, ctr_offset_x2 = pos1.x(), pos2.x()
             tangent = abs(ctr_offset_x1 - ctr_offset_x2)
 
@@ -278,7 +362,7 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             ctr_point2 = QtCore.QPointF(ctr_offset_x2, pos2.y())
             path.cubicTo(ctr_point1, ctr_point2, pos2)
             self.setPath(path)
-        elif self.viewer_pipe_layout() == PipeLayoutEnum.ANGLE.value:
+        elif layout == PipeLayoutEnum.ANGLE.value:
             ctr_offset_x1, ctr_offset_x2 = pos1.x(), pos2.x()
             distance = abs(ctr_offset_x1 - ctr_offset_x2) / 2
             if start_port.port_type == PortTypeEnum.IN.value:
@@ -335,12 +419,34 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             if not is_visible:
                 return
 
+        # resolve the viewer settings once per draw.
+        viewer = self.viewer()
+        if viewer:
+            direction = viewer.get_layout_direction()
+            layout = viewer.get_pipe_layout()
+            acyclic = viewer.acyclic
+        else:
+            direction = layout = None
+            acyclic = True
+
+        # skip rebuilding the path geometry if nothing it depends on changed.
+        if end_port and not cursor_pos:
+            n_rect = start_port.node.boundingRect()
+            path_key = (
+                pos1.x(), pos1.y(), pos2.x(), pos2.y(),
+                start_port.port_type, n_rect.width(), n_rect.height(),
+                direction, layout, acyclic
+            )
+            if path_key == self._path_key:
+                return
+            self._path_key = path_key
+        else:
+            self._path_key = None
+
         line = QtCore.QLineF(pos1, pos2)
         path = QtGui.QPainterPath()
 
-        direction = self.viewer_layout_direction()
-
-        if end_port and not self.viewer().acyclic:
+        if end_port and not acyclic:
             if end_port.node == start_port.node:
                 if direction is LayoutDirectionEnum.VERTICAL.value:
                     self._draw_path_cycled_vertical(
@@ -357,23 +463,61 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
 
         path.moveTo(line.x1(), line.y1())
 
-        if self.viewer_pipe_layout() == PipeLayoutEnum.STRAIGHT.value:
+        if layout == PipeLayoutEnum.STRAIGHT.value:
             path.lineTo(pos2)
             self.setPath(path)
             self._draw_direction_pointer()
             return
 
         if direction is LayoutDirectionEnum.VERTICAL.value:
-            self._draw_path_vertical(start_port, pos1, pos2, path)
+            self._draw_path_vertical(start_port, pos1, pos2, path, layout)
         elif direction is LayoutDirectionEnum.HORIZONTAL.value:
-            self._draw_path_horizontal(start_port, pos1, pos2, path)
+            self._draw_path_horizontal(start_port, pos1, pos2, path, layout)
 
         self._draw_direction_pointer()
 
+    def apply_geometry(self, pos1, pos2, geometry, layout, path_key=None):
+        """
+        Set the pipe path from precomputed geometry.
+        (see: :func:`compute_pipe_geometry`)
+
+        Args:
+            pos1 (QtCore.QPointF): start port position.
+            pos2 (QtCore.QPointF): end port position.
+            geometry (tuple): (control_points, mid_x, mid_y, degrees, dist).
+            layout (int): pipe layout mode the geometry was computed for.
+            path_key (tuple): geometry cache key. (optional)
+        """
+        ctrl, mid_x, mid_y, degrees, dist = geometry
+        path = QtGui.QPainterPath(pos1)
+        if ctrl is None:
+            path.lineTo(pos2)
+        elif layout == PipeLayoutEnum.CURVED.value:
+            path.cubicTo(ctrl[0], ctrl[1], ctrl[2], ctrl[3], pos2.x(), pos2.y())
+        else:
+            path.lineTo(ctrl[0], ctrl[1])
+            path.lineTo(ctrl[2], ctrl[3])
+            path.lineTo(pos2)
+        self.setPath(path)
+        self._path_key = path_key
+
+        if not (self._input_port and self._output_port):
+            self._dir_pointer.setVisible(False)
+            return
+        self._place_direction_pointer(QtCore.QPointF(mid_x, mid_y), degrees, dist)
+
+    def invalidate_path(self):
+        """
+        Discard the cached path geometry so the next "draw_path()" call
+        rebuilds it.
+        """
+        self._path_key = None
+
     def reset_path(self):
         """
         reset the pipe initial path position.
         """
+        self._path_key = None
         path = QtGui.QPainterPath(QtCore.QPointF(0.0, 0.0))
         self.setPath(path)
         self._draw_direction_pointer()
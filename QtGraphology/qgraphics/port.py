@@ -10,6 +10,7 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 from QtGraphology.constants import (
     ITEM_CACHE_MODE,
+    NodeLODEnum,
     PortEnum,
     PortTypeEnum,
     Z_VAL_PORT, TCOLOR,
@@ -172,6 +173,9 @@ class PortItem(QtWidgets.QGraphicsItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
+        if self.scene().lod.value >= NodeLODEnum.RECT.value:
+            return
+
         painter.save()
 
         #  display falloff collision for debugging
@@ -257,13 +261,19 @@ class PortItem(QtWidgets.QGraphicsItem):
             viewer.start_live_connection(self)
 
     def redraw_connected_pipes(self: Self) -> None:
+        """
+        Redraw the connected pipes, when the port is in a viewer the pipes
+        are only marked dirty and redrawn once in the next batched update.
+        """
         if not self.connected_pipes:
             return
+        scene = self.scene()
+        viewer = scene.viewer() if scene else None
+        if viewer:
+            viewer.update_pipes(self.connected_pipes)
+            return
         for pipe in self.connected_pipes:
-            if self.port_type == PortTypeEnum.IN.value:
-                pipe.draw_path(self, pipe.output_port)
-            elif self.port_type == PortTypeEnum.OUT.value:
-                pipe.draw_path(pipe.input_port, self)
+            pipe.draw_path(pipe.input_port, pipe.output_port)
 
     def add_pipe(self, pipe):
         self._pipes.append(pipe)
@@ -425,6 +435,8 @@ class CustomPortItem(PortItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
+        if self.scene().lod.value >= NodeLODEnum.RECT.value:
+            return
         if self._port_painter:
             rect_w = self._width / 1.8
             rect_h = self._height / 1.8
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from QtGraphology.constants import ViewerEnum
+from QtGraphology.constants import NodeLODEnum, ViewerEnum
 
 
 class NodeScene(QtWidgets.QGraphicsScene):
@@ -13,6 +13,10 @@ class NodeScene(QtWidgets.QGraphicsScene):
         self._grid_mode = ViewerEnum.GRID_DISPLAY_LINES.value
         self._grid_color = ViewerEnum.GRID_COLOR.value
         self._bg_color = ViewerEnum.BACKGROUND_COLOR.value
+        # view state set by the viewer once per zoom change so the items
+        # don't have to query the view when painting.
+        self._lod = NodeLODEnum.FULL
+        self._zoom = 0.0
         self.setBackgroundBrush(QtGui.QColor(*self._bg_color))
 
     def __repr__(self):
@@ -61,7 +65,7 @@ class NodeScene(QtWidgets.QGraphicsScene):
             pen (QtGui.QPen): pen object.
             grid_size (int): grid size.
         """
-        zoom = self.viewer().get_zoom()
+        zoom = self._zoom
         if zoom < 0:
             grid_size = int(abs(zoom) / 0.3 + 1) * grid_size
 
@@ -92,7 +96,7 @@ class NodeScene(QtWidgets.QGraphicsScene):
             self._draw_dots(painter, rect, pen, ViewerEnum.GRID_SIZE.value)
 
         elif self._grid_mode is ViewerEnum.GRID_DISPLAY_LINES.value:
-            zoom = self.viewer().get_zoom()
+            zoom = self._zoom
             if zoom > -0.5:
                 pen = QtGui.QPen(QtGui.QColor(*self.grid_color), 0.65)
                 self._draw_grid(
@@ -136,6 +140,22 @@ class NodeScene(QtWidgets.QGraphicsScene):
     def viewer(self):
         return self.views()[0] if self.views() else None
 
+    @property
+    def lod(self):
+        return self._lod
+
+    @lod.setter
+    def lod(self, lod=NodeLODEnum.FULL):
+        self._lod = lod
+
+    @property
+    def zoom(self):
+        return self._zoom
+
+    @zoom.setter
+    def zoom(self, value=0.0):
+        self._zoom = value
+
     @property
     def grid_mode(self):
         return self._grid_mode
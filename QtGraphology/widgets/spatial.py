@@ -0,0 +1,159 @@
+#!/usr/bin/python
+from __future__ import annotations
+from collections.abc import Hashable, Iterator
+from typing import Self
+
+from QtGraphology.constants import TRECT, ViewerEnum
+
+
+class SpatialGridIndex(object):
+    """
+    Uniform grid spatial hash of item bounding boxes.
+
+    Each item is stored in every grid cell its bounding box overlaps so a
+    rect query only has to look at the cells under the rect instead of
+    every item in the graph.
+
+    Args:
+        cell_size (float): width and height of a grid cell in scene units.
+    """
+
+    def __init__(self: Self, cell_size: float = ViewerEnum.VIRTUAL_CELL_SIZE.value) -> None:
+        self._cell_size: float = float(cell_size)
+        self._cells: dict[tuple[int, int], set[Hashable]] = {}
+        self._rects: dict[Hashable, TRECT] = {}
+
+    def __repr__(self: Self) -> str:
+        return '<{}({} items) object at {}>'.format(
+            self.__class__.__name__, len(self._rects), hex(id(self)))
+
+    def __len__(self: Self) -> int:
+        return len(self._rects)
+
+    def __contains__(self: Self, key: Hashable) -> bool:
+        return key in self._rects
+
+    def __iter__(self: Self) -> Iterator[Hashable]:
+        return iter(self._rects)
+
+    def _cell_range(self: Self, rect: TRECT) -> tuple[range, range]:
+        x, y, w, h = rect
+        size = self._cell_size
+        return (range(int(x // size), int((x + w) // size) + 1),
+                range(int(y // size), int((y + h) // size) + 1))
+
+    def rect(self: Self, key: Hashable) -> TRECT | None:
+        """
+        Returns the indexed bounding box of an item.
+
+        Args:
+            key (Hashable): item.
+
+        Returns:
+            tuple(float, float, float, float): x, y, width, height.
+        """
+        return self._rects.get(key)
+
+    def insert(self: Self, key: Hashable, rect: TRECT) -> None:
+        """
+        Add an item to the index (replaces the existing entry).
+
+        Args:
+            key (Hashable): item.
+            rect (tuple(float, float, float, float)): x, y, width, height.
+        """
+        if key in self._rects:
+            self.remove(key)
+        rect = tuple(rect)
+        self._rects[key] = rect
+        cells = self._cells
+        cols, rows = self._cell_range(rect)
+        for col in cols:
+            for row in rows:
+                cell = cells.get((col, row))
+                if cell is None:
+                    cells[(col, row)] = cell = set()
+                cell.add(key)
+
+    def remove(self: Self, key: Hashable) -> None:
+        """
+        Remove an item from the index.
+
+        Args:
+            key (Hashable): item.
+        """
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        cells = self._cells
+        cols, rows = self._cell_range(rect)
+        for col in cols:
+            for row in rows:
+                cell = cells.get((col, row))
+                if cell is None:
+                    continue
+                cell.discard(key)
+                if not cell:
+                    del cells[(col, row)]
+
+    def update(self: Self, key: Hashable, rect: TRECT) -> None:
+        """
+        Update the bounding box of an item, only the grid cells that
+        changed are touched.
+
+        Args:
+            key (Hashable): item.
+            rect (tuple(float, float, float, float)): x, y, width, height.
+        """
+        old_rect = self._rects.get(key)
+        if old_rect is None:
+            self.insert(key, rect)
+            return
+        rect = tuple(rect)
+        if self._cell_range(old_rect) == self._cell_range(rect):
+            self._rects[key] = rect
+            return
+        self.insert(key, rect)
+
+    def query(self: Self, rect: TRECT) -> set[Hashable]:
+        """
+        Returns the items with a bounding box intersecting the rect.
+
+        Args:
+            rect (tuple(float, float, float, float)): x, y, width, height.
+
+        Returns:
+            set: items.
+        """
+        x, y, w, h = rect
+        right, bottom = x + w, y + h
+        rects = self._rects
+        cells = self._cells
+        cols, rows = self._cell_range(rect)
+        if len(cols) * len(rows) > len(cells):
+            # zoomed far out, cheaper to walk the occupied cells.
+            candidates = (
+                cell for (col, row), cell in cells.items()
+                if col in cols and row in rows
+            )
+        else:
+            candidates = (
+                cells[(col, row)] for col in cols for row in rows
+                if (col, row) in cells
+            )
+        found = set()
+        for cell in candidates:
+            for key in cell:
+                if key in found:
+                    continue
+                kx, ky, kw, kh = rects[key]
+                if kx <= right and ky <= bottom and kx + kw >= x and ky + kh >= y:
+                    found.add(key)
+        return found
+
+    def clear(self: Self) -> None:
+        """
+        Remove all items from the index.
+        """
+        self._cells.clear()
+        self._rects.clear()
@@ -11,8 +11,14 @@ from PySide6.QtWidgets import QRubberBand, QWidget, QGraphicsItem
 from PySide6.QtGui import QPainterPath
 
 from QtGraphology.base.menu import BaseMenu
+from QtGraphology.base.topology import TopologicalOrder
 from QtGraphology.constants import (
+    LOD_CLUSTER_CELL_SIZE,
+    LOD_SCALE_CLUSTER,
+    LOD_SCALE_RECT,
+    LOD_SCALE_SIMPLIFIED,
     LayoutDirectionEnum,
+    NodeLODEnum,
     PortTypeEnum,
     PipeEnum,
     PipeLayoutEnum,
@@ -22,11 +28,12 @@ from QtGraphology.constants import (
 from QtGraphology.qgraphics.node_abstract import AbstractNodeItem
 from QtGraphology.qgraphics.node_backdrop import BackdropNodeItem
 from QtGraphology.qgraphics.node_base import NodeItem
-from QtGraphology.qgraphics.pipe import PipeItem, LivePipeItem
+from QtGraphology.qgraphics.pipe import PipeItem, LivePipeItem, compute_pipe_geometry
 from QtGraphology.qgraphics.port import PortItem
 from QtGraphology.qgraphics.slicer import SlicerPipeItem
 from QtGraphology.widgets.dialogs import BaseDialog, FileDialog
 from QtGraphology.widgets.scene import NodeScene
+from QtGraphology.widgets.spatial import SpatialGridIndex
 from QtGraphology.widgets.tab_search import TabSearchMenuWidget
 
 ZOOM_MIN: float = -0.95
@@ -77,6 +84,19 @@ class NodeViewer(QtWidgets.QGraphicsView):
             0, 0,
             self.size().width(), self.size().height(),
         )
+
+        # virtualized mode: only the nodes inside the visible rect have a
+        # node item in the scene, every node is tracked by its bounding box
+        # in the spatial index (keyed by node id) and the node items outside
+        # the visible rect are released.
+        self._virtualized: bool = False
+        self._virtual_margin: float = ViewerEnum.VIRTUAL_MARGIN.value
+        self._virtual_rect: QtCore.QRectF = QtCore.QRectF()
+        self._spatial_index: SpatialGridIndex = SpatialGridIndex()
+        self._materialized_nodes: dict[str, AbstractNodeItem] = {}
+        # node items out of the scene that aren't in the graph model.
+        self._detached_nodes: dict[str, AbstractNodeItem] = {}
+
         self._update_scene()
         self._last_size: QtCore.QSize = self.size()
 
@@ -120,6 +140,16 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self._SLICER_PIPE.setVisible(False)
         self.scene().addItem(self._SLICER_PIPE)
 
+        # pipes waiting to be redrawn in the next batched update.
+        self._dirty_pipes: dict[PipeItem, None] = {}
+        self._pipe_update_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._pipe_update_timer.setSingleShot(True)
+        self._pipe_update_timer.setInterval(0)
+        self._pipe_update_timer.timeout.connect(self._update_dirty_pipes)
+        # pipe redraws requested while set are dropped, the pipes are
+        # rerouted in one pass once the batch operation is done.
+        self._pipe_updates_suspended: bool = False
+
         self._search_widget: TabSearchMenuWidget = TabSearchMenuWidget()
         self._search_widget.search_submitted.connect(self._on_search_submitted)
 
@@ -160,6 +190,14 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self.accept_connection_types: dict[str, Any] | None = None
         self.reject_connection_types: dict[str, Any] | None = None
 
+        # reference to the graph model topological order used for
+        # the cycle check on the live pipe.
+        self.topology: TopologicalOrder | None = None
+
+        # reference to the graph model nodes used to build and release the
+        # node items in virtualized mode.
+        self.graph_nodes: dict[str, Any] | None = None
+
         # Text Overlay stuff
         self._text_overlay_align: Literal["left", "center", "right"] = "left"
         self._text_overlay_size: int = 40
@@ -248,16 +286,286 @@ class NodeViewer(QtWidgets.QGraphicsView):
     def _update_scene(self: Self) -> None:
         self.setSceneRect(self._scene_range)
         self.fitInView(self._scene_range, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        self._update_lod()
+        if self._virtualized:
+            self._update_virtual_nodes()
+
+    def _update_dirty_pipes(self: Self) -> None:
+        """
+        Redraw all the pipes marked dirty since the last update once.
+        """
+        pipes = list(self._dirty_pipes)
+        self._dirty_pipes.clear()
+        scene = self.scene()
+        for pipe in pipes:
+            if pipe.scene() is not scene:
+                continue
+            if pipe.input_port and pipe.output_port:
+                pipe.draw_path(pipe.input_port, pipe.output_port)
+
+    def _update_lod(self: Self) -> None:
+        """
+        Pick the node level of detail tier for the current view scale and
+        hand it to the scene. (node items sync to it when they're painted)
+        """
+        scale = self.transform().m11()
+        if scale < LOD_SCALE_CLUSTER:
+            lod = NodeLODEnum.CLUSTER
+        elif scale < LOD_SCALE_RECT:
+            lod = NodeLODEnum.RECT
+        elif scale < LOD_SCALE_SIMPLIFIED:
+            lod = NodeLODEnum.SIMPLIFIED
+        else:
+            lod = NodeLODEnum.FULL
+        scene = self.scene()
+        scene.zoom = scale - 1.0
+        scene.lod = lod
+
+    def _draw_node_clusters(self: Self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
+        """
+        Draw the nodes in the rect aggregated into grid cell blobs.
+        (used at the cluster level of detail where nodes don't paint)
+
+        Args:
+            painter (QtGui.QPainter): painter object.
+            rect (QtCore.QRectF): exposed scene rect.
+        """
+        if self._virtualized:
+            index = self._spatial_index
+            node_rects = [
+                (self._virtual_node_color(node_id),
+                 QtCore.QRectF(*index.rect(node_id)))
+                for node_id in index.query(
+                    (rect.x(), rect.y(), rect.width(), rect.height()))
+            ]
+        else:
+            node_rects = [
+                (item.color, item.sceneBoundingRect())
+                for item in self.scene().items(rect)
+                if isinstance(item, AbstractNodeItem) and
+                not isinstance(item, BackdropNodeItem)
+            ]
+        if not node_rects:
+            return
+
+        cell_size = LOD_CLUSTER_CELL_SIZE
+        clusters = {}
+        for node_color, node_rect in node_rects:
+            center = node_rect.center()
+            key = (int(center.x() // cell_size), int(center.y() // cell_size))
+            cluster = clusters.get(key)
+            if cluster is None:
+                clusters[key] = [node_rect, 1, node_color]
+            else:
+                cluster[0] = cluster[0].united(node_rect)
+                cluster[1] += 1
+
+        painter.save()
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        radius = cell_size * 0.1
+        for bounds, count, color in clusters.values():
+            blob_color = QtGui.QColor(*color[:3])
+            blob_color = blob_color.lighter(150)
+            blob_color.setAlpha(min(255, 80 + count * 10))
+            painter.setBrush(blob_color)
+            painter.drawRoundedRect(bounds, radius, radius)
+        painter.restore()
 
     def _combined_rect(self: Self, nodes: Sequence[AbstractNodeItem]) -> QtCore.QRectF:
         """
         Returns a QRectF with the combined size of the provided node items.
+        (works for node items that aren't currently in the scene)
         """
-        group: QtWidgets.QGraphicsItemGroup = self.scene().createItemGroup(nodes)
-        rect: QtCore.QRectF = group.boundingRect()
-        self.scene().destroyItemGroup(group)
+        rect = QtCore.QRectF()
+        for node in nodes:
+            rect = rect.united(node.sceneBoundingRect())
         return rect
 
+    def _virtual_window(self: Self) -> QtCore.QRectF:
+        """
+        Returns the visible scene rect grown by the virtualized mode margin.
+        """
+        rect = QtCore.QRectF(self._scene_range)
+        dx = rect.width() * self._virtual_margin
+        dy = rect.height() * self._virtual_margin
+        return rect.adjusted(-dx, -dy, dx, dy)
+
+    def _update_virtual_nodes(self: Self) -> None:
+        """
+        Build the node items of the nodes inside the visible rect (plus
+        margin) and release the node items of the nodes that left it.
+        """
+        window = self._virtual_window()
+        if window == self._virtual_rect:
+            return
+        self._virtual_rect = window
+
+        visible = self._spatial_index.query(
+            (window.x(), window.y(), window.width(), window.height()))
+        materialized = self._materialized_nodes
+        # selected nodes keep their node item so the selection isn't lost.
+        hidden = [node_id for node_id, node in materialized.items()
+                  if node_id not in visible and not node.isSelected()]
+        shown = [node_id for node_id in visible if node_id not in materialized]
+        if not hidden and not shown:
+            return
+        self._set_materialized(shown, hidden)
+
+    def _set_materialized(self: Self, shown: Sequence[str], hidden: Sequence[str] = ()) -> None:
+        """
+        Release the node items of the hidden nodes and build the node items
+        of the shown nodes with the scene item index suspended, the pipes
+        between the shown nodes and the other nodes with a node item are
+        established once after.
+
+        Args:
+            shown (list[str]): ids of the nodes to add into the scene.
+            hidden (list[str]): ids of the nodes to take out of the scene.
+        """
+        scene = self.scene()
+        index_method = scene.itemIndexMethod()
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        connections = []
+        try:
+            for node_id in hidden:
+                self._dematerialize_node(node_id)
+            for node_id in shown:
+                connections += self._materialize_node(node_id)
+        finally:
+            scene.setItemIndexMethod(index_method)
+        if connections:
+            self.establish_connections(connections)
+
+    @staticmethod
+    def _node_pipes(node: AbstractNodeItem) -> list[PipeItem]:
+        pipes = []
+        for port in getattr(node, 'inputs', []) + getattr(node, 'outputs', []):
+            pipes += port.connected_pipes
+        return pipes
+
+    def _virtual_node(self: Self, node_id: str) -> Any | None:
+        """
+        Returns the graph model node of a virtualized node.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            QtGraphology.NodeObject: node or None.
+        """
+        if self.graph_nodes is None:
+            return None
+        return self.graph_nodes.get(node_id)
+
+    def _virtual_node_color(self: Self, node_id: str) -> tuple:
+        """
+        Returns the color of a virtualized node without building its node item.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            tuple(int, int, int, int): r, g, b, a.
+        """
+        item = (self._materialized_nodes.get(node_id) or
+                self._detached_nodes.get(node_id))
+        if item is not None:
+            return item.color
+        return self._virtual_node(node_id).model.color
+
+    def _materialize_node(self: Self, node_id: str) -> list[tuple[PortItem, PortItem]]:
+        """
+        Build the node item of a virtualized node from the node model and add
+        it into the scene.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            list[tuple(PortItem, PortItem)]: port item pairs of the pipes
+                to the other nodes with a node item in the scene.
+        """
+        materialized = self._materialized_nodes
+        node = self._virtual_node(node_id)
+        item = self._detached_nodes.pop(node_id, None)
+        if item is None:
+            if node is None:
+                # node removed from the graph model.
+                self._spatial_index.remove(node_id)
+                return []
+            # built from the node model if the node item was released.
+            item = node.view
+        materialized[node_id] = item
+        if item.scene() is not self.scene():
+            item._virtual_viewer = None
+            pos = item.xy_pos
+            item.pre_init(self, pos)
+            self.scene().addItem(item)
+            item.post_init(self, pos)
+        item._virtual_viewer = self
+        rect = item.sceneBoundingRect()
+        self._spatial_index.insert(
+            node_id, (rect.x(), rect.y(), rect.width(), rect.height()))
+
+        connections = []
+        if node is None or not hasattr(node, 'input_ports'):
+            return connections
+        for port in node.input_ports():
+            for connected in port.connected_ports():
+                if connected.node().id in materialized:
+                    connections.append((port.view, connected.view))
+        for port in node.output_ports():
+            for connected in port.connected_ports():
+                # self connected pipes were added from the input port.
+                connected_id = connected.node().id
+                if connected_id != node_id and connected_id in materialized:
+                    connections.append((connected.view, port.view))
+        return connections
+
+    def _dematerialize_node(self: Self, node_id: str) -> None:
+        """
+        Take the node item of a virtualized node and its pipes out of the
+        scene and release the node item, only the node model is kept.
+
+        Args:
+            node_id (str): node id.
+        """
+        item = self._materialized_nodes.pop(node_id)
+        for pipe in self._node_pipes(item):
+            pipe.delete()
+        if item.scene() is not None:
+            item.scene().removeItem(item)
+        item._virtual_viewer = None
+        node = self._virtual_node(node_id)
+        if node is None:
+            self._detached_nodes[node_id] = item
+        else:
+            node.release_view()
+
+    def _is_virtual_port(self: Self, port: PortItem) -> bool:
+        """
+        Returns:
+            bool: true if the port node item isn't in the scene.
+        """
+        node = port.node
+        return self._materialized_nodes.get(node.id) is not node
+
+    def _register_virtual_node(self: Self, node: AbstractNodeItem) -> bool:
+        """
+        Add a node item to the spatial index and return if it should be
+        in the scene.
+
+        Args:
+            node (AbstractNodeItem): node item.
+
+        Returns:
+            bool: true if the node is inside the visible rect (plus margin).
+        """
+        rect = node.sceneBoundingRect()
+        self._spatial_index.insert(
+            node.id, (rect.x(), rect.y(), rect.width(), rect.height()))
+        return self._virtual_window().intersects(rect)
+
     def _items_near(self: Self, pos: QtCore.QPoint, item_type: type | None = None, width: int = 20, height: int = 20) -> list[QGraphicsItem]:
         """
         Filter node graph items from the specified position, width and
@@ -373,6 +681,8 @@ class NodeViewer(QtWidgets.QGraphicsView):
 
     def drawForeground(self: Self, painter, rect):
         super().drawForeground(painter, rect)
+        if self.scene().lod is NodeLODEnum.CLUSTER:
+            self._draw_node_clusters(painter, rect)
         # Note for devs, this can be implemented in any applicable functions just that I prefer
         # to put this logic in drawForeground as "text overlay should be drawn at foreground"
         self._draw_text_overlay(
@@ -599,6 +909,8 @@ class NodeViewer(QtWidgets.QGraphicsView):
             n for n, xy_pos in self._node_positions.items()
             if isinstance(n, AbstractNodeItem) and hasattr(n, 'xy_pos') and n.xy_pos != xy_pos
         }
+        for node in moved_nodes:
+            self.update_virtual_node(node)
         # only emit of node is not colliding with a pipe.
         if moved_nodes and not self.COLLIDING_state:
             self.moved_nodes.emit(moved_nodes)
@@ -857,6 +1169,8 @@ class NodeViewer(QtWidgets.QGraphicsView):
                     pointer_color = PipeEnum.DISABLED_COLOR.value
                 elif item.port_type == self._start_port.port_type:
                     pointer_color = PipeEnum.DISABLED_COLOR.value
+                elif not self.acyclic_check(self._start_port, item):
+                    pointer_color = PipeEnum.DISABLED_COLOR.value
             break
 
         self._LIVE_PIPE.draw_path(
@@ -1245,6 +1559,10 @@ class NodeViewer(QtWidgets.QGraphicsView):
         establish a new pipe connection.
         (adds a new pipe item to draw between 2 ports)
         """
+        if self._virtualized and (self._is_virtual_port(start_port) or
+                                  self._is_virtual_port(end_port)):
+            # drawn once both node items are in the scene.
+            return
         pipe = PipeItem()
         self.scene().addItem(pipe)
         pipe.set_connections(start_port, end_port)
@@ -1254,8 +1572,66 @@ class NodeViewer(QtWidgets.QGraphicsView):
         if not start_port.node.visible or not end_port.node.visible:
             pipe.hide()
 
-    @staticmethod
-    def acyclic_check(start_port: PortItem, end_port: PortItem):
+    def establish_connections(self: Self, connections) -> list[PipeItem]:
+        """
+        establish multiple pipe connections.
+        (all the pipe items are added first and their paths drawn once after)
+
+        Args:
+            connections (list[tuple(PortItem, PortItem)]): port item pairs.
+
+        Returns:
+            list[PipeItem]: the new pipe items.
+        """
+        if self._virtualized:
+            # drawn once both node items are in the scene.
+            connections = [
+                (start_port, end_port) for start_port, end_port in connections
+                if not self._is_virtual_port(start_port) and
+                not self._is_virtual_port(end_port)
+            ]
+        scene = self.scene()
+        pipes = []
+        index_method = scene.itemIndexMethod()
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            for start_port, end_port in connections:
+                pipe = PipeItem()
+                scene.addItem(pipe)
+                pipe.set_connections(start_port, end_port)
+                pipes.append(pipe)
+        finally:
+            scene.setItemIndexMethod(index_method)
+
+        ports = set()
+        for pipe in pipes:
+            pipe.draw_path(pipe.input_port, pipe.output_port)
+            in_node, out_node = pipe.input_port.node, pipe.output_port.node
+            if in_node.selected or out_node.selected:
+                pipe.highlight()
+            if not in_node.visible or not out_node.visible:
+                pipe.hide()
+            ports.add(pipe.input_port)
+            ports.add(pipe.output_port)
+        for port in ports:
+            port.update()
+        return pipes
+
+    def update_pipes(self: Self, pipes) -> None:
+        """
+        Mark pipes dirty so they are redrawn in the next batched update,
+        a pipe marked multiple times before the update is only redrawn once.
+
+        Args:
+            pipes (list[PipeItem]): pipe items.
+        """
+        if self._pipe_updates_suspended:
+            return
+        self._dirty_pipes.update(dict.fromkeys(pipes))
+        if not self._pipe_update_timer.isActive():
+            self._pipe_update_timer.start()
+
+    def acyclic_check(self: Self, start_port: PortItem, end_port: PortItem) -> bool:
         """
         Validate the node connections so it doesn't loop itself.
 
@@ -1266,21 +1642,25 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             bool: True if port connection is valid.
         """
+        if start_port.port_type == PortTypeEnum.IN.value:
+            start_port, end_port = end_port, start_port
+        if self.topology is not None:
+            return not self.topology.would_create_cycle(
+                start_port.node.id, end_port.node.id)
+
+        # fallback when the viewer isn't attached to a graph model.
         start_node = start_port.node
+        visited = {end_port.node}
         check_nodes = [end_port.node]
-        io_types = {
-            PortTypeEnum.IN.value: 'outputs',
-            PortTypeEnum.OUT.value: 'inputs'
-        }
         while check_nodes:
-            check_node: NodeItem = check_nodes.pop(0)
-            for check_port in getattr(check_node, io_types[end_port.port_type]):
-                if check_port.connected_ports:
-                    for port in check_port.connected_ports:
-                        if port.node != start_node:
-                            check_nodes.append(port.node)
-                        else:
-                            return False
+            check_node: NodeItem = check_nodes.pop()
+            if check_node == start_node:
+                return False
+            for check_port in check_node.outputs:
+                for port in check_port.connected_ports:
+                    if port.node not in visited:
+                        visited.add(port.node)
+                        check_nodes.append(port.node)
         return True
 
     # --- viewer ---
@@ -1376,7 +1756,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self.clear_key_state()
         ext = '*{} '.format(ext) if ext else ''
         ext_filter = ';;'.join([
-            'Node Graph ({}*json)'.format(ext), 'All Files (*)'
+            'Node Graph ({}*json *qgs)'.format(ext), 'All Files (*)'
         ])
         file_dlg = FileDialog.getOpenFileName(
             self, 'Open File', current_dir, ext_filter)
@@ -1398,6 +1778,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         ext_label = '*{} '.format(ext) if ext else ''
         ext_type = '.{}'.format(ext) if ext else '.json'
         ext_map = {'Node Graph ({}*json)'.format(ext_label): ext_type,
+                   'Node Graph Binary (*qgs)': '.qgs',
                    'All Files (*)': ''}
         file_dlg = FileDialog.getSaveFileName(
             self, 'Save Session', current_dir, ';;'.join(ext_map.keys()))
@@ -1424,10 +1805,13 @@ class NodeViewer(QtWidgets.QGraphicsView):
     def all_nodes(self: Self) -> list[AbstractNodeItem]:
         """
         Returns all node graphic items.
+        (in virtualized mode only the nodes with a node item in the scene)
 
         Returns:
             list[AbstractNodeItem]: instances of node items.
         """
+        if self._virtualized:
+            return list(self._materialized_nodes.values())
         return [i for i in self.scene().items()
                 if isinstance(i, AbstractNodeItem)]
 
@@ -1478,10 +1862,97 @@ class NodeViewer(QtWidgets.QGraphicsView):
             pos (tuple or list): node scene position.
         """
         pos = pos or (self._previous_pos.x(), self._previous_pos.y())
+        if self._virtualized:
+            self.add_nodes([node], [pos])
+            return
         node.pre_init(self, pos)
         self.scene().addItem(node)
         node.post_init(self, pos)
 
+    def add_nodes(self: Self, nodes, positions=None):
+        """
+        Add multiple node items into the scene with the scene item
+        index suspended while the items are inserted.
+        (in virtualized mode only the nodes inside the visible rect are
+        added into the scene)
+
+        Args:
+            nodes (list[AbstractNodeItem]): node item instances.
+            positions (list[tuple or list]): node scene positions matching
+                the nodes list. (optional)
+        """
+        scene = self.scene()
+        default_pos = (self._previous_pos.x(), self._previous_pos.y())
+        positions = positions or [None] * len(nodes)
+
+        index_method = scene.itemIndexMethod()
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        shown = []
+        try:
+            for node, pos in zip(nodes, positions):
+                pos = pos or default_pos
+                node.pre_init(self, pos)
+                if not self._virtualized:
+                    scene.addItem(node)
+                    node.post_init(self, pos)
+                    continue
+                node.post_init(self, pos)
+                in_window = self._register_virtual_node(node)
+                self._detached_nodes[node.id] = node
+                if in_window:
+                    shown.append(node.id)
+                else:
+                    # only the node model is kept until the node is in view.
+                    self._release_detached_node(node.id)
+        finally:
+            scene.setItemIndexMethod(index_method)
+        if shown:
+            self._set_materialized(shown)
+
+    def add_virtual_nodes(self: Self, node_ids: Sequence[str]) -> None:
+        """
+        Add graph model nodes in virtualized mode without building their
+        node items, the node items are built from the node model once the
+        nodes are inside the visible rect (plus margin).
+
+        Args:
+            node_ids (list[str]): ids of the nodes in :attr:`NodeViewer.graph_nodes`.
+        """
+        index = self._spatial_index
+        window = self._virtual_window()
+        shown = []
+        for node_id in node_ids:
+            node = self.graph_nodes[node_id]
+            if node.has_view():
+                # keep the node item layout size in the spatial index.
+                rect = node.view.sceneBoundingRect()
+                rect = (rect.x(), rect.y(), rect.width(), rect.height())
+            else:
+                x, y = node.model.pos
+                rect = (x, y, node.model.width, node.model.height)
+            index.insert(node_id, rect)
+            if window.intersects(QtCore.QRectF(*rect)):
+                shown.append(node_id)
+            elif node.has_view() and node.view.scene() is None:
+                node.release_view()
+        if shown:
+            self._set_materialized(shown)
+
+    def _release_detached_node(self: Self, node_id: str) -> None:
+        """
+        Release a node item that was never added into the scene, the node
+        item is kept when the node isn't in the graph model.
+
+        Args:
+            node_id (str): node id.
+        """
+        node = self._virtual_node(node_id)
+        if node is None:
+            return
+        item = self._detached_nodes.pop(node_id)
+        item._virtual_viewer = None
+        node.release_view()
+
     @staticmethod
     def remove_node(node):
         """
@@ -1502,8 +1973,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
             pos (tuple or list): custom x, y position.
             offset (tuple or list): x, y position offset.
         """
-        group = self.scene().createItemGroup(nodes)
-        group_rect = group.boundingRect()
+        group_rect = self._combined_rect(nodes)
         if pos:
             x, y = pos
         else:
@@ -1513,8 +1983,137 @@ class NodeViewer(QtWidgets.QGraphicsView):
         if offset:
             x += offset[0]
             y += offset[1]
-        group.setPos(x, y)
-        self.scene().destroyItemGroup(group)
+        for node in nodes:
+            node_x, node_y = node.xy_pos
+            node.xy_pos = [node_x + x, node_y + y]
+
+    def set_nodes_pos(self: Self, nodes, positions) -> None:
+        """
+        Set the position of multiple node items in a single batched pass,
+        the connected pipes are rerouted once after all the nodes moved.
+
+        Args:
+            nodes (list[AbstractNodeItem]): node items.
+            positions (list[list[float, float]]): x, y scene positions.
+        """
+        scene = self.scene()
+        viewport = self.viewport()
+        index_method = scene.itemIndexMethod()
+        updates_enabled = viewport.updatesEnabled()
+        viewport.setUpdatesEnabled(False)
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        pipes = {}
+        try:
+            for node, pos in zip(nodes, positions):
+                if node.xy_pos == list(pos):
+                    continue
+                node.xy_pos = pos
+                for pipe in self._node_pipes(node):
+                    pipes[pipe] = None
+        finally:
+            scene.setItemIndexMethod(index_method)
+            viewport.setUpdatesEnabled(updates_enabled)
+        self.reroute_pipes([p for p in pipes if p.scene() is scene])
+        viewport.update()
+
+    def is_virtualized(self: Self) -> bool:
+        """
+        Returns:
+            bool: true if the viewer is in virtualized mode.
+        """
+        return self._virtualized
+
+    def set_virtualized(self: Self, mode: bool = True, margin: float | None = None) -> None:
+        """
+        Set the viewer virtualized mode.
+
+        In virtualized mode only the nodes inside the visible rect (plus a
+        margin) have a node item in the scene, the other nodes are only
+        tracked by their bounding box in a spatial index and their node
+        items are released. The node items are built again from the node
+        model as the view pans and zooms, the pipes are only drawn between
+        nodes with a node item.
+
+        Args:
+            mode (bool): true to enable virtualized mode.
+            margin (float): margin around the visible rect as a ratio of
+                the rect size. (optional)
+        """
+        if margin is not None:
+            self._virtual_margin = margin
+        if mode == self._virtualized:
+            self._virtual_rect = QtCore.QRectF()
+            if mode:
+                self._update_virtual_nodes()
+            return
+
+        scene = self.scene()
+        if mode:
+            self._virtualized = True
+            for node in scene.items():
+                if isinstance(node, AbstractNodeItem):
+                    self._register_virtual_node(node)
+                    self._materialized_nodes[node.id] = node
+                    node._virtual_viewer = self
+            self._virtual_rect = QtCore.QRectF()
+            self._update_virtual_nodes()
+            return
+
+        shown = [node_id for node_id in self._spatial_index
+                 if node_id not in self._materialized_nodes]
+        self._set_materialized(shown)
+        for node in self._materialized_nodes.values():
+            node._virtual_viewer = None
+        self._virtualized = False
+        self._spatial_index.clear()
+        self._materialized_nodes.clear()
+        self._detached_nodes.clear()
+
+    def update_virtual_node(self: Self, node: AbstractNodeItem) -> None:
+        """
+        Update the spatial index entry of a node item after it moved and
+        release it or add it back into the scene. (virtualized mode only)
+
+        Args:
+            node (AbstractNodeItem): node item.
+        """
+        if not self._virtualized or node.id not in self._spatial_index:
+            return
+        rect = node.sceneBoundingRect()
+        self.update_virtual_rect(
+            node.id, (rect.x(), rect.y(), rect.width(), rect.height()))
+
+    def update_virtual_rect(self: Self, node_id: str, rect) -> None:
+        """
+        Update the spatial index entry of a node after it moved and build or
+        release its node item. (virtualized mode only)
+
+        Args:
+            node_id (str): node id.
+            rect (tuple(float, float, float, float)): x, y, width, height.
+        """
+        if not self._virtualized or node_id not in self._spatial_index:
+            return
+        self._spatial_index.update(node_id, rect)
+        in_window = self._virtual_window().intersects(QtCore.QRectF(*rect))
+        node = self._materialized_nodes.get(node_id)
+        if in_window and node is None:
+            self._set_materialized([node_id])
+        elif not in_window and node is not None and not node.isSelected():
+            self._set_materialized([], [node_id])
+
+    def remove_virtual_node(self: Self, node_id: str) -> None:
+        """
+        Remove a node from the spatial index. (virtualized mode only)
+
+        Args:
+            node_id (str): node id.
+        """
+        self._spatial_index.remove(node_id)
+        self._detached_nodes.pop(node_id, None)
+        node = self._materialized_nodes.pop(node_id, None)
+        if node is not None:
+            node._virtual_viewer = None
 
     def get_pipes_from_nodes(self: Self, nodes=None):
         nodes = nodes or self.selected_nodes()
@@ -1556,21 +2155,116 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self._scene_range.translate(rect.center() - self._scene_range.center())
         self.setSceneRect(self._scene_range)
 
+    def reroute_pipes(self: Self, pipes=None) -> None:
+        """
+        Redraw pipes for the current layout direction and pipe layout in a
+        single batched pass.
+
+        The path geometry of all the pipes is computed in one pass first
+        and then applied with the scene index and viewport updates
+        suspended. Self connected pipes in a cyclic graph are drawn
+        individually.
+
+        Args:
+            pipes (list[PipeItem]): pipe items. (default: all pipes)
+        """
+        pipes = self.all_pipes() if pipes is None else pipes
+        if not pipes:
+            return
+
+        direction = self._layout_direction
+        layout = self._pipe_layout
+        acyclic = self.acyclic
+
+        batch = []
+        endpoints = []
+        fallback = []
+        for pipe in pipes:
+            in_port, out_port = pipe.input_port, pipe.output_port
+            if not (in_port and out_port):
+                continue
+            in_node, out_node = in_port.node, out_port.node
+            is_visible = (in_port.isVisible() and out_port.isVisible() and
+                          in_node.isVisible() and out_node.isVisible())
+            pipe.setVisible(is_visible)
+            if not is_visible:
+                continue
+            if not acyclic and in_node == out_node:
+                fallback.append(pipe)
+                continue
+
+            # same end point offsets as "PipeItem.draw_path()".
+            port_rect = in_port.boundingRect()
+            half_w, half_h = port_rect.width() / 2, port_rect.height() / 2
+            pos1 = in_port.scenePos()
+            pos2 = out_port.scenePos()
+            x1, y1 = pos1.x() + half_w, pos1.y() + half_h
+            x2, y2 = pos2.x() + half_w, pos2.y() + half_h
+            n_rect = in_node.boundingRect()
+            node_w, node_h = n_rect.width(), n_rect.height()
+            path_key = (x1, y1, x2, y2, in_port.port_type, node_w, node_h,
+                        direction, layout, acyclic)
+            if path_key == pipe._path_key:
+                continue
+            batch.append((pipe, QtCore.QPointF(x1, y1),
+                          QtCore.QPointF(x2, y2), path_key))
+            endpoints.append((x1, y1, x2, y2, True, node_w, node_h))
+
+        geometry = compute_pipe_geometry(endpoints, direction, layout)
+
+        scene = self.scene()
+        viewport = self.viewport()
+        index_method = scene.itemIndexMethod()
+        updates_enabled = viewport.updatesEnabled()
+        viewport.setUpdatesEnabled(False)
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            for (pipe, pos1, pos2, path_key), pipe_geometry in zip(batch, geometry):
+                pipe.apply_geometry(pos1, pos2, pipe_geometry, layout, path_key)
+                self._dirty_pipes.pop(pipe, None)
+            for pipe in fallback:
+                pipe.draw_path(pipe.input_port, pipe.output_port)
+        finally:
+            scene.setItemIndexMethod(index_method)
+            viewport.setUpdatesEnabled(updates_enabled)
+        viewport.update()
+
     def get_pipe_layout(self: Self)-> PipeLayoutEnum | Any:
         return self._pipe_layout
 
     def set_pipe_layout(self: Self, layout: LayoutDirectionEnum) -> None:
         self._pipe_layout = layout
-        for pipe in self.all_pipes():
-            pipe.draw_path(pipe.input_port, pipe.output_port)
+        self.reroute_pipes()
 
     def get_layout_direction(self: Self)-> LayoutDirectionEnum | Any:
         return self._layout_direction
 
     def set_layout_direction(self: Self, direction: LayoutDirectionEnum) -> None:
+        """
+        Set the layout direction of the viewer and the node items, the
+        node items are redrawn with the per node pipe redraws suspended and
+        the pipes are rerouted once afterwards.
+
+        Args:
+            direction (LayoutDirectionEnum): layout direction.
+        """
         self._layout_direction = direction
-        for pipe_item in self.all_pipes():
-            pipe_item.draw_path(pipe_item.input_port, pipe_item.output_port)
+        scene = self.scene()
+        viewport = self.viewport()
+        index_method = scene.itemIndexMethod()
+        updates_enabled = viewport.updatesEnabled()
+        viewport.setUpdatesEnabled(False)
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        self._pipe_updates_suspended = True
+        try:
+            for node in self.all_nodes():
+                if node.layout_direction != direction:
+                    node.layout_direction = direction
+        finally:
+            self._pipe_updates_suspended = False
+            scene.setItemIndexMethod(index_method)
+            viewport.setUpdatesEnabled(updates_enabled)
+        self.reroute_pipes()
 
     def reset_zoom(self: Self, cent=None):
         self._scene_range = QtCore.QRectF(0, 0,
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+"""
+Compare nodes cloned from a prototype with freshly constructed nodes.
+"""
+import os
+
+import pytest
+
+pytest.importorskip('PySide6')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtWidgets
+
+from QtGraphology import BaseNode
+from QtGraphology.base.factory import NodeFactory
+
+
+class PrototypeNode(BaseNode):
+
+    __identifier__ = 'tests.nodes'
+    NODE_NAME = 'Prototype'
+    PROTOTYPE = True
+
+    def __init__(self):
+        super(PrototypeNode, self).__init__()
+        self.add_input('in A', multi_input=True)
+        self.add_input('in B', display_name=False)
+        self.add_output('out A')
+        self.add_text_input('label', 'Label', text='foo')
+        self.add_checkbox('enabled', 'Enabled', state=True)
+        self.add_combo_menu('mode', 'Mode', items=['a', 'b'])
+        self.create_property('value', 1.5)
+        # plain subclass attribute with nested mutable values.
+        self.history = {'values': [1, 2]}
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def factory():
+    node_factory = NodeFactory()
+    node_factory.register_node(PrototypeNode)
+    return node_factory
+
+
+def snapshot(node):
+    def ports(port_list):
+        return [(p.name(), p.multi_connection(), p.model.display_name,
+                 p.model.locked, p.view.name) for p in port_list]
+
+    properties = node.properties()
+    properties.pop('id')
+    return {
+        'inputs': ports(node.input_ports()),
+        'outputs': ports(node.output_ports()),
+        'properties': properties,
+        'widgets': {name: (type(widget).__name__, widget.get_value())
+                    for name, widget in node.widgets().items()},
+        'history': node.history,
+    }
+
+
+def test_clone_matches_new_instance(app, factory):
+    clone = factory.create_node_instance(PrototypeNode.type_)
+    fresh = PrototypeNode()
+    assert clone._recipe is None
+    assert snapshot(clone) == snapshot(fresh)
+
+
+def test_clone_ids_are_unique(app, factory):
+    node_a = factory.create_node_instance(PrototypeNode.type_)
+    node_b = factory.create_node_instance(PrototypeNode.type_)
+    assert node_a.id != node_b.id
+    assert node_a.input_ports()[0] is not node_b.input_ports()[0]
+    assert node_a.view is not node_b.view
+
+
+def test_clone_state_is_not_shared(app, factory):
+    node_a = factory.create_node_instance(PrototypeNode.type_)
+    node_b = factory.create_node_instance(PrototypeNode.type_)
+    node_a.history['values'].append(3)
+    node_a.set_property('label', 'bar')
+    assert node_b.history == {'values': [1, 2]}
+    assert node_b.get_property('label') == 'foo'
@@ -0,0 +1,79 @@
+#!/usr/bin/python
+"""
+Compare the numpy and pure python paths of the node geometry table.
+"""
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('PySide6')
+
+from QtGraphology.base import geometry
+from QtGraphology.base.geometry import NodeGeometryTable
+from QtGraphology.constants import LayoutDirectionEnum, NodeAlignEnum
+
+# enough rows for the bulk transforms to take the numpy path.
+ROW_COUNT = geometry._NUMPY_MIN_ROWS * 8
+
+TRANSFORMS = [
+    ('translate', (3.5, -2.0)),
+    ('scale', (1.5, 0.5)),
+    ('scale', (2.0, 2.0, (10.0, 10.0))),
+    ('distribute', (LayoutDirectionEnum.HORIZONTAL,)),
+    ('distribute', (LayoutDirectionEnum.VERTICAL,)),
+] + [('align', (edge,)) for edge in NodeAlignEnum]
+
+
+def build_table():
+    rnd = random.Random(1)
+    table = NodeGeometryTable()
+    for _ in range(ROW_COUNT):
+        table.add(rnd.uniform(-1e3, 1e3), rnd.uniform(-1e3, 1e3),
+                  rnd.uniform(10.0, 200.0), rnd.uniform(10.0, 200.0))
+    # recycled rows leave gaps in the handles.
+    for handle in range(0, ROW_COUNT, 7):
+        table.remove(handle)
+    return table
+
+
+def build_handles():
+    handles = [h for h in range(ROW_COUNT) if h % 7][::-1]
+    # repeated handles must be transformed once on both paths.
+    return handles + handles[::3]
+
+
+def assert_tables_equal(table_a, table_b):
+    for column in ('x', 'y', 'width', 'height'):
+        assert getattr(table_a, column).tolist() == pytest.approx(
+            getattr(table_b, column).tolist())
+
+
+@pytest.mark.parametrize('name, args', TRANSFORMS)
+def test_numpy_matches_python(monkeypatch, name, args):
+    handles = build_handles()
+    numpy_table = build_table()
+    getattr(numpy_table, name)(handles, *args)
+
+    python_table = build_table()
+    with monkeypatch.context() as patch:
+        patch.setattr(geometry, 'numpy', None)
+        getattr(python_table, name)(handles, *args)
+
+    assert_tables_equal(numpy_table, python_table)
+
+
+def test_bounding_box_matches_python(monkeypatch):
+    handles = build_handles()
+    table = build_table()
+    numpy_rect = table.bounding_box(handles)
+    monkeypatch.setattr(geometry, 'numpy', None)
+    assert table.bounding_box(handles) == pytest.approx(numpy_rect)
+
+
+def test_repeated_handles_translate_once(monkeypatch):
+    monkeypatch.setattr(geometry, 'numpy', None)
+    table = NodeGeometryTable()
+    handle = table.add(0.0, 0.0, 10.0, 10.0)
+    table.translate([handle, handle], 5.0, 5.0)
+    assert table.rect(handle) == (5.0, 5.0, 10.0, 10.0)